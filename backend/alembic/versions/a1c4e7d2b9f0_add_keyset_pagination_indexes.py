@@ -0,0 +1,33 @@
+"""Add keyset pagination indexes
+
+Revision ID: a1c4e7d2b9f0
+Revises: 73d0c3aa75cd
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7d2b9f0'
+down_revision: Union[str, None] = '73d0c3aa75cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_goals_user_id_created_at_id', 'goals', ['user_id', 'created_at', 'id'])
+    op.create_index('ix_systems_goal_id_created_at_id', 'systems', ['goal_id', 'created_at', 'id'])
+    op.create_index('ix_checkins_system_id_created_at_id', 'checkins', ['system_id', 'created_at', 'id'])
+    op.create_index('ix_direct_messages_partnership_id_created_at_id', 'direct_messages', ['partnership_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_direct_messages_partnership_id_created_at_id', table_name='direct_messages')
+    op.drop_index('ix_checkins_system_id_created_at_id', table_name='checkins')
+    op.drop_index('ix_systems_goal_id_created_at_id', table_name='systems')
+    op.drop_index('ix_goals_user_id_created_at_id', table_name='goals')
@@ -0,0 +1,38 @@
+"""Add comment thread index
+
+Revision ID: a4f9d2c7e1b3
+Revises: f2c7e4a1b8d6
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f9d2c7e1b3'
+down_revision: Union[str, None] = 'f2c7e4a1b8d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The thread loader reads every comment on one target in (created_at, id)
+    # order; this index covers that scan, so the single-column ones go.
+    op.create_index(
+        'ix_comments_target_type_target_id_created_at_id',
+        'comments',
+        ['target_type', 'target_id', 'created_at', 'id'],
+    )
+    op.execute("DROP INDEX IF EXISTS ix_comments_target_type")
+    op.execute("DROP INDEX IF EXISTS ix_comments_target_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_comments_target_id', 'comments', ['target_id'])
+    op.create_index('ix_comments_target_type', 'comments', ['target_type'])
+    op.drop_index('ix_comments_target_type_target_id_created_at_id', table_name='comments')
@@ -0,0 +1,44 @@
+"""Add partner feed indexes
+
+Revision ID: b6e1a3f8d4c2
+Revises: a4f9d2c7e1b3
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1a3f8d4c2'
+down_revision: Union[str, None] = 'a4f9d2c7e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Each partner feed source is read newest first by (owner, timestamp, id).
+    op.create_index('ix_checkins_user_id_created_at_id', 'checkins', ['user_id', 'created_at', 'id'])
+    op.create_index(
+        'ix_checkins_verified_by_partner_id_verified_at_utc_id',
+        'checkins',
+        ['verified_by_partner_id', 'verified_at_utc', 'id'],
+        postgresql_where=sa.text('verified_at_utc IS NOT NULL'),
+    )
+    op.create_index('ix_reflections_user_id_created_at_id', 'reflections', ['user_id', 'created_at', 'id'])
+    op.create_index(
+        'ix_direct_messages_partnership_id_sender_id_sent_at_utc_id',
+        'direct_messages',
+        ['partnership_id', 'sender_id', 'sent_at_utc', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_direct_messages_partnership_id_sender_id_sent_at_utc_id', table_name='direct_messages')
+    op.drop_index('ix_reflections_user_id_created_at_id', table_name='reflections')
+    op.drop_index('ix_checkins_verified_by_partner_id_verified_at_utc_id', table_name='checkins')
+    op.drop_index('ix_checkins_user_id_created_at_id', table_name='checkins')
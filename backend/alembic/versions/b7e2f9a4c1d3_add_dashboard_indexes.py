@@ -0,0 +1,37 @@
+"""Add dashboard indexes
+
+Revision ID: b7e2f9a4c1d3
+Revises: a1c4e7d2b9f0
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f9a4c1d3'
+down_revision: Union[str, None] = 'a1c4e7d2b9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_checkins_system_id_checkin_timestamp_utc', 'checkins', ['system_id', 'checkin_timestamp_utc'])
+    op.create_index('ix_checkins_user_id_checkin_timestamp_utc', 'checkins', ['user_id', 'checkin_timestamp_utc'])
+    op.create_index(
+        'ix_checkins_pending_verification',
+        'checkins',
+        ['partnership_id', 'checkin_timestamp_utc'],
+        postgresql_where=sa.text("status = 'PENDING_VERIFICATION'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_checkins_pending_verification', table_name='checkins')
+    op.drop_index('ix_checkins_user_id_checkin_timestamp_utc', table_name='checkins')
+    op.drop_index('ix_checkins_system_id_checkin_timestamp_utc', table_name='checkins')
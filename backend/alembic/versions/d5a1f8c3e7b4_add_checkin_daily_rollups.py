@@ -0,0 +1,42 @@
+"""Add checkin daily rollups
+
+Revision ID: d5a1f8c3e7b4
+Revises: c3d8a5f1e6b2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a1f8c3e7b4'
+down_revision: Union[str, None] = 'c3d8a5f1e6b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'checkin_daily_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('system_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('systems.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('local_date', sa.Date(), nullable=False),
+        sa.Column('checkin_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('metric_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('system_id', 'local_date', name='uq_checkin_daily_rollups_system_day'),
+    )
+    op.create_index('ix_checkin_daily_rollups_user_id_local_date', 'checkin_daily_rollups', ['user_id', 'local_date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_checkin_daily_rollups_user_id_local_date', table_name='checkin_daily_rollups')
+    op.drop_table('checkin_daily_rollups')
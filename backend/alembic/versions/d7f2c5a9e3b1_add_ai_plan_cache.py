@@ -0,0 +1,38 @@
+"""Add AI plan cache
+
+Revision ID: d7f2c5a9e3b1
+Revises: c9d4b7e2f5a1
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f2c5a9e3b1'
+down_revision: Union[str, None] = 'c9d4b7e2f5a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'ai_plan_cache',
+        sa.Column('key', sa.String(length=64), primary_key=True),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('prompt_version', sa.String(), nullable=False),
+        sa.Column('plan_text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('ix_ai_plan_cache_expires_at', 'ai_plan_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ai_plan_cache_expires_at', table_name='ai_plan_cache')
+    op.drop_table('ai_plan_cache')
@@ -0,0 +1,54 @@
+"""Add notification counters and pagination indexes
+
+Revision ID: e8b3c6d2a9f1
+Revises: d5a1f8c3e7b4
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c6d2a9f1'
+down_revision: Union[str, None] = 'd5a1f8c3e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_notifications_recipient_id_created_at_id', 'notifications', ['recipient_id', 'created_at', 'id'])
+    op.create_index(
+        'ix_notifications_recipient_id_unread',
+        'notifications',
+        ['recipient_id', 'created_at'],
+        postgresql_where=sa.text('is_read IS false'),
+    )
+    op.create_table(
+        'notification_counters',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, unique=True),
+        sa.Column('unread_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    # Seed the counters from the notifications that are already unread.
+    op.execute(
+        """
+        INSERT INTO notification_counters (id, user_id, unread_count)
+        SELECT gen_random_uuid(), recipient_id, count(*)
+        FROM notifications
+        WHERE is_read IS false
+        GROUP BY recipient_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('notification_counters')
+    op.drop_index('ix_notifications_recipient_id_unread', table_name='notifications')
+    op.drop_index('ix_notifications_recipient_id_created_at_id', table_name='notifications')
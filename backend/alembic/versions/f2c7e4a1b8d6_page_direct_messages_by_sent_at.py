@@ -0,0 +1,48 @@
+"""Page direct messages by sent_at_utc
+
+Revision ID: f2c7e4a1b8d6
+Revises: e8b3c6d2a9f1
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7e4a1b8d6'
+down_revision: Union[str, None] = 'e8b3c6d2a9f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination compares (sent_at_utc, id), which must never be NULL.
+    op.execute("UPDATE direct_messages SET sent_at_utc = created_at WHERE sent_at_utc IS NULL")
+    op.alter_column('direct_messages', 'sent_at_utc', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    op.execute("DROP INDEX IF EXISTS ix_direct_messages_sent_at_utc")
+    op.drop_index('ix_direct_messages_partnership_id_created_at_id', table_name='direct_messages')
+    op.create_index(
+        'ix_direct_messages_partnership_id_sent_at_utc_id',
+        'direct_messages',
+        ['partnership_id', sa.text('sent_at_utc DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_direct_messages_partnership_id_unread',
+        'direct_messages',
+        ['partnership_id', 'sent_at_utc'],
+        postgresql_where=sa.text('read_at_utc IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_direct_messages_partnership_id_unread', table_name='direct_messages')
+    op.drop_index('ix_direct_messages_partnership_id_sent_at_utc_id', table_name='direct_messages')
+    op.create_index('ix_direct_messages_partnership_id_created_at_id', 'direct_messages', ['partnership_id', 'created_at', 'id'])
+    op.create_index('ix_direct_messages_sent_at_utc', 'direct_messages', ['sent_at_utc'])
+    op.alter_column('direct_messages', 'sent_at_utc', existing_type=sa.DateTime(timezone=True), nullable=True)
@@ -1,15 +1,23 @@
 from collections.abc import AsyncGenerator
 import uuid
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import jwt, JWTError
 
 from app.db.session import SessionLocal
+from app.db.unit_of_work import unit_of_work
 from app.core.config import settings
-from app.db.models.user import User
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, PageParams, TimelinePageParams,
+    decode_cursor, decode_timeline_cursor,
+)
+from app.core.principal_cache import principal_cache
 from app.schemas.token_schemas import TokenPayload
+from app.schemas.user_schemas import UserPrincipal
 from app.crud.crud_user import user as crud_user
+from app.services.target_resolver import TargetResolver
 
 # Placeholder for User model and schemas
 # from app.models.user import User
@@ -30,14 +38,66 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+async def get_uow_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Like get_db, but the whole request runs as a single unit of work: CRUD
+    writes only flush, and everything is committed once when the endpoint
+    returns (or rolled back if it raises).
+    """
+    async with SessionLocal() as session:
+        async with unit_of_work(session):
+            yield session
+
+def get_page_params(
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page."),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageParams:
+    """
+    Dependency that decodes the `cursor`/`limit` query parameters of a
+    keyset-paginated list endpoint.
+    """
+    if cursor is None:
+        return PageParams(limit=limit)
+    try:
+        return PageParams(after=decode_cursor(cursor), limit=limit)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        )
+
+def get_timeline_page_params(
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page."),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> TimelinePageParams:
+    """
+    Like get_page_params, for endpoints that merge several sources into one timeline.
+    """
+    if cursor is None:
+        return TimelinePageParams(limit=limit)
+    try:
+        return TimelinePageParams(after=decode_timeline_cursor(cursor), limit=limit)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        )
+
 # Placeholder for the authentication dependency
 # This will be fully implemented once User models and security functions are ready.
 async def get_current_user(
     db: AsyncSession = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+) -> UserPrincipal:
     """
     Dependency to get the current authenticated user from a JWT token.
+    Returns a detached UserPrincipal; on a cache hit no JWT decode or
+    database query is performed. Services that need to modify the user
+    row must load it themselves.
     """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.ALGORITHM]
@@ -56,5 +116,33 @@ async def get_current_user(
     
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user.")
-        
-    return user 
\ No newline at end of file
+
+    principal = UserPrincipal.model_validate(user, from_attributes=True)
+    principal_cache.set(token, principal, expires_at=token_data.exp)
+    return principal
+
+
+async def get_websocket_user(
+    token: str = Query(..., description="Access token. Browsers cannot set headers on a WebSocket."),
+) -> Optional[UserPrincipal]:
+    """
+    WebSocket counterpart of get_current_user. A session is opened only for
+    the lookup, so a long-lived socket never holds a database connection.
+    Returns None instead of raising when the token is not valid.
+    """
+    async with SessionLocal() as db:
+        try:
+            return await get_current_user(db=db, token=token)
+        except HTTPException:
+            return None
+
+def get_target_resolver(
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> TargetResolver:
+    """
+    Dependency that provides a TargetResolver for the current user. FastAPI
+    caches dependencies per request, so every use within one request shares
+    the same resolver and its memoized targets.
+    """
+    return TargetResolver(db, current_user)
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
-from app.services.ai_planner_service import ai_planner_service
+from app.core.rate_limit import RateLimitExceeded, ServiceOverloaded, retry_after_header
+from app.core.sse import format_event, stream_until_disconnected
+from app.schemas.system_schemas import PlannedSystem, System, SystemPlanApply
+from app.schemas.user_schemas import UserPrincipal
+from app.services.ai_planner_service import ai_planner_service, render_plan_text
+from app.services.system_service import system_service
 
 router = APIRouter()
 
@@ -13,26 +21,119 @@ class AIPlanRequest(BaseModel):
 
 class AIPlanResponse(BaseModel):
     plan_text: str
+    systems: List[PlannedSystem]
+
+async def limit_plan_requests(current_user: UserPrincipal = Depends(deps.get_current_user)) -> UserPrincipal:
+    """
+    Charges one request to the user's planner allowance, answering 429 with
+    Retry-After once it is used up. Async so the bucket update runs on the
+    event loop rather than in the threadpool.
+    """
+    try:
+        ai_planner_service.user_buckets.take(current_user.id)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many plan requests. Please wait before trying again.",
+            headers=retry_after_header(e.retry_after),
+        )
+    return current_user
+
+def _overloaded(e: ServiceOverloaded) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"The AI planning service is busy. {e}",
+        headers=retry_after_header(e.retry_after),
+    )
 
 @router.post("/generate-plan", response_model=AIPlanResponse)
 async def generate_ai_plan(
     *,
     plan_request: AIPlanRequest,
-    db: AsyncSession = Depends(deps.get_db),
-    # You could add get_current_user dependency if you want to rate-limit or log usage per user
+    current_user: UserPrincipal = Depends(limit_plan_requests),
 ) -> AIPlanResponse:
     """
-    Takes a user's goal and returns an AI-generated plan of systems.
+    Takes a user's goal and returns an AI-generated plan of systems, both as
+    structured systems (which can be passed to /apply-plan unchanged) and
+    as readable text.
     """
     try:
-        generated_plan = await ai_planner_service.generate_system_plan_for_goal(
+        systems = await ai_planner_service.generate_structured_plan_for_goal(
             goal_title=plan_request.goal_title,
             goal_description=plan_request.goal_description
         )
-        return AIPlanResponse(plan_text=generated_plan)
+        return AIPlanResponse(plan_text=render_plan_text(systems), systems=systems)
+    except ServiceOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         # Catch potential exceptions from the AI service (e.g., API key issue, network error)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"The AI planning service is currently unavailable. {e}",
-        ) 
\ No newline at end of file
+        )
+
+@router.post("/apply-plan", response_model=List[System], status_code=status.HTTP_201_CREATED)
+async def apply_ai_plan(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    plan_in: SystemPlanApply,
+    current_user: UserPrincipal = Depends(deps.get_current_user),
+) -> List[System]:
+    """
+    Create all the systems of a plan under one of the user's goals at once.
+    Either every system is created or none is.
+    """
+    return await system_service.create_planned_systems_for_goal(
+        db=db, goal_id=plan_in.goal_id, systems=plan_in.systems, user=current_user
+    )
+
+@router.post("/generate-plan/stream")
+async def stream_ai_plan(
+    *,
+    request: Request,
+    plan_request: AIPlanRequest,
+    current_user: UserPrincipal = Depends(limit_plan_requests),
+) -> StreamingResponse:
+    """
+    Streams the plan as Server-Sent Events while the model writes it: a
+    `chunk` event per piece of text, then `done`, or `error` if generation
+    fails part-way. Generation stops as soon as the client disconnects.
+    """
+    chunks = ai_planner_service.stream_system_plan_for_goal(
+        goal_title=plan_request.goal_title,
+        goal_description=plan_request.goal_description,
+    )
+    # Wait for the first chunk before answering, so that being turned away
+    # by the limiter (or failing outright) is still a proper status code.
+    try:
+        first_chunk = await anext(chunks)
+    except StopAsyncIteration:
+        first_chunk = None
+    except ServiceOverloaded as e:
+        raise _overloaded(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"The AI planning service is currently unavailable. {e}",
+        )
+
+    async def events():
+        try:
+            if first_chunk is not None:
+                yield format_event("chunk", {"text": first_chunk})
+            async for text in chunks:
+                yield format_event("chunk", {"text": text})
+        except Exception as e:
+            # The 200 and its headers are already sent, so the failure has to
+            # travel in-band.
+            yield format_event("error", {"detail": f"The AI planning service is currently unavailable. {e}"})
+            return
+        finally:
+            await chunks.aclose()
+        yield format_event("done", {})
+
+    return StreamingResponse(
+        stream_until_disconnected(request, events()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,11 +1,12 @@
 import uuid
-from typing import List
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import PageParams
 from app.db.models.user import User as UserModel
 from app.schemas.checkin_schemas import Checkin, CheckinCreate, CheckinUpdate
+from app.schemas.pagination_schemas import Page
 from app.services.checkin_service import checkin_service
 
 router = APIRouter()
@@ -35,17 +36,18 @@ async def read_checkin(
     """
     return await checkin_service.get_checkin_by_id(db=db, checkin_id=checkin_id, user=current_user)
 
-@router.get("/by_system/{system_id}", response_model=List[Checkin])
+@router.get("/by_system/{system_id}", response_model=Page[Checkin])
 async def read_checkins_by_system(
     *,
     db: AsyncSession = Depends(deps.get_db),
     system_id: uuid.UUID,
+    page: PageParams = Depends(deps.get_page_params),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[Checkin]:
+) -> Page[Checkin]:
     """
-    Get all checkins belonging to a specific system.
+    Get the checkins belonging to a specific system, newest first, one page at a time.
     """
-    return await checkin_service.get_checkins_for_system(db=db, system_id=system_id, user=current_user)
+    return await checkin_service.get_checkins_for_system(db=db, system_id=system_id, user=current_user, page=page)
 
 @router.put("/{checkin_id}", response_model=Checkin)
 async def update_checkin(
@@ -1,11 +1,14 @@
 import uuid
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import PageParams
+from app.db.models.comment import CommentTargetType
 from app.db.models.user import User as UserModel
-from app.schemas.comment_schemas import Comment, CommentCreate, CommentUpdate
+from app.schemas.comment_schemas import Comment, CommentCreate, CommentNode, CommentUpdate
+from app.schemas.pagination_schemas import Page
 from app.services.comment_service import comment_service
 
 router = APIRouter()
@@ -18,34 +21,64 @@ async def create_comment(
     current_user: UserModel = Depends(deps.get_current_user),
 ) -> Comment:
     """
-    Create a new comment on a goal or check-in.
+    Create a new comment, or a reply, on a check-in or reflection.
     The service layer will validate access to the parent item.
     """
     return await comment_service.create_comment(db=db, comment_in=comment_in, user=current_user)
 
-@router.get("/by_goal/{goal_id}", response_model=List[Comment])
-async def read_comments_by_goal(
+@router.get("/targets/{target_type}/{target_id}", response_model=Page[CommentNode])
+async def read_comments(
     *,
     db: AsyncSession = Depends(deps.get_db),
-    goal_id: uuid.UUID,
+    target_type: CommentTargetType,
+    target_id: uuid.UUID,
+    page: PageParams = Depends(deps.get_page_params),
+    replies: int = Query(3, ge=0, le=20, description="Replies to include under each comment."),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[Comment]:
+) -> Page[CommentNode]:
     """
-    Get all comments for a specific goal.
+    Get one page of top-level comments on an item, oldest first, each with
+    its first few replies nested.
     """
-    return await comment_service.get_comments_for_goal(db=db, goal_id=goal_id, user=current_user)
+    return await comment_service.get_comment_page(
+        db=db,
+        target_type=target_type,
+        target_id=target_id,
+        user=current_user,
+        page=page,
+        replies_per_comment=replies,
+    )
+
+@router.get("/targets/{target_type}/{target_id}/thread", response_model=List[CommentNode])
+async def read_comment_thread(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    target_type: CommentTargetType,
+    target_id: uuid.UUID,
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> List[CommentNode]:
+    """
+    Get every comment on an item as a nested thread.
+    """
+    return await comment_service.get_thread(
+        db=db, target_type=target_type, target_id=target_id, user=current_user
+    )
 
-@router.get("/by_checkin/{checkin_id}", response_model=List[Comment])
-async def read_comments_by_checkin(
+@router.get("/{comment_id}/replies", response_model=Page[CommentNode])
+async def read_comment_replies(
     *,
     db: AsyncSession = Depends(deps.get_db),
-    checkin_id: uuid.UUID,
+    comment_id: uuid.UUID,
+    page: PageParams = Depends(deps.get_page_params),
+    replies: int = Query(3, ge=0, le=20, description="Replies to include under each reply."),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[Comment]:
+) -> Page[CommentNode]:
     """
-    Get all comments for a specific checkin.
+    Get one page of the replies to a comment, oldest first.
     """
-    return await comment_service.get_comments_for_checkin(db=db, checkin_id=checkin_id, user=current_user)
+    return await comment_service.get_replies(
+        db=db, comment_id=comment_id, user=current_user, page=page, replies_per_comment=replies
+    )
 
 @router.put("/{comment_id}", response_model=Comment)
 async def update_comment(
@@ -70,6 +103,6 @@ async def delete_comment(
     current_user: UserModel = Depends(deps.get_current_user),
 ) -> Comment:
     """
-    Delete a comment. Only the author can delete their comment.
+    Delete a comment and its replies. Only the author can delete their comment.
     """
-    return await comment_service.delete_comment(db=db, comment_id=comment_id, user=current_user) 
\ No newline at end of file
+    return await comment_service.delete_comment(db=db, comment_id=comment_id, user=current_user)
@@ -0,0 +1,22 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.db.models.user import User as UserModel
+from app.schemas.dashboard_schemas import Dashboard
+from app.services.dashboard_service import dashboard_service
+
+router = APIRouter()
+
+@router.get("/", response_model=Dashboard)
+async def read_dashboard(
+    db: AsyncSession = Depends(deps.get_db),
+    day: Optional[date] = Query(None, alias="date", description="Local date to show. Defaults to today in the user's timezone."),
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> Dashboard:
+    """
+    Everything the dashboard view needs, computed server-side.
+    """
+    return await dashboard_service.get_dashboard(db=db, user=current_user, day=day)
@@ -1,12 +1,17 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import PageParams
+from app.db.session import SessionLocal
 from app.db.models.user import User as UserModel
-from app.schemas.direct_message_schemas import DirectMessage, DirectMessageCreate
+from app.schemas.direct_message_schemas import DirectMessage, DirectMessageCreate, MarkReadRequest, MarkReadResult
+from app.schemas.pagination_schemas import Page
+from app.schemas.user_schemas import UserPrincipal
 from app.services.direct_message_service import direct_message_service
+from app.services.realtime_service import realtime_service
 
 router = APIRouter()
 
@@ -23,15 +28,62 @@ async def send_direct_message(
     """
     return await direct_message_service.send_message(db=db, message_in=message_in, sender=current_user)
 
-@router.get("/{partnership_id}", response_model=List[DirectMessage])
+@router.get("/{partnership_id}", response_model=Page[DirectMessage])
 async def get_direct_message_conversation(
     *,
     db: AsyncSession = Depends(deps.get_db),
     partnership_id: uuid.UUID,
+    page: PageParams = Depends(deps.get_page_params),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[DirectMessage]:
+) -> Page[DirectMessage]:
     """
-    Get the conversation history for a specific partnership.
+    Get the conversation history for a specific partnership, latest first, one page at a time.
+    Each page holds the newest messages sent before the cursor.
     The service layer will validate that the user is part of this partnership.
     """
-    return await direct_message_service.get_conversation(db=db, partnership_id=partnership_id, user=current_user) 
\ No newline at end of file
+    return await direct_message_service.get_conversation(
+        db=db, partnership_id=partnership_id, user=current_user, page=page
+    )
+
+@router.post("/{partnership_id}/read", response_model=MarkReadResult)
+async def mark_direct_messages_read(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    partnership_id: uuid.UUID,
+    read_in: MarkReadRequest,
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> MarkReadResult:
+    """
+    Mark every message the current user received in the partnership, up to
+    and including `up_to_message_id`, as read.
+    """
+    return await direct_message_service.mark_read_up_to(
+        db=db, partnership_id=partnership_id, up_to_message_id=read_in.up_to_message_id, user=current_user
+    )
+
+@router.websocket("/{partnership_id}/ws")
+async def direct_message_socket(
+    websocket: WebSocket,
+    partnership_id: uuid.UUID,
+    current_user: Optional[UserPrincipal] = Depends(deps.get_websocket_user),
+):
+    """
+    Live events for a partnership's conversation: `message.created`,
+    `messages.read`, `reaction.created` and `reaction.deleted`, each as a JSON text frame
+    `{"type": ..., "data": ...}`. Authenticate with `?token=`. The socket
+    is closed after a `partnership.terminated` event.
+    """
+    allowed = current_user is not None
+    if allowed:
+        # The cached principal's current_partnership_id may be stale, so check
+        # the partnership itself; the session is closed before streaming.
+        async with SessionLocal() as db:
+            try:
+                await direct_message_service.verify_member(db, partnership_id=partnership_id, user=current_user)
+            except HTTPException:
+                allowed = False
+    if not allowed:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    await realtime_service.stream_partnership(websocket, partnership_id=partnership_id)
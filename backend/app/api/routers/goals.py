@@ -1,24 +1,26 @@
 import uuid
-from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import PageParams
 from app.db.models.user import User as UserModel
 from app.schemas.goal_schemas import Goal, GoalCreate, GoalUpdate
+from app.schemas.pagination_schemas import Page
 from app.services.goal_service import goal_service
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Goal])
+@router.get("/", response_model=Page[Goal])
 async def read_goals(
     db: AsyncSession = Depends(deps.get_db),
+    page: PageParams = Depends(deps.get_page_params),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[Goal]:
+) -> Page[Goal]:
     """
-    Retrieve all goals for the current user.
+    Retrieve the current user's goals, newest first, one page at a time.
     """
-    return await goal_service.get_user_goals(db=db, user=current_user)
+    return await goal_service.get_user_goals(db=db, user=current_user, page=page)
 
 @router.post("/", response_model=Goal, status_code=status.HTTP_201_CREATED)
 async def create_goal(
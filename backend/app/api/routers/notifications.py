@@ -0,0 +1,62 @@
+import uuid
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.core.pagination import PageParams
+from app.db.models.user import User as UserModel
+from app.schemas.notification_schemas import MarkAllReadResult, Notification, NotificationPage, UnreadCount
+from app.services.notification_service import notification_service
+from app.services.target_resolver import TargetResolver
+
+router = APIRouter()
+
+@router.get("/", response_model=NotificationPage)
+async def read_notifications(
+    db: AsyncSession = Depends(deps.get_db),
+    page: PageParams = Depends(deps.get_page_params),
+    unread_only: bool = Query(False, alias="unreadOnly"),
+    current_user: UserModel = Depends(deps.get_current_user),
+    resolver: TargetResolver = Depends(deps.get_target_resolver),
+) -> NotificationPage:
+    """
+    Retrieve the current user's notifications, newest first, one page at a
+    time, together with their unread count and the target each one points at.
+    """
+    return await notification_service.get_notifications(
+        db=db, user=current_user, unread_only=unread_only, page=page, resolver=resolver
+    )
+
+@router.get("/unread-count", response_model=UnreadCount)
+async def read_unread_count(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> UnreadCount:
+    """
+    Get the current user's unread notification count.
+    """
+    return {"unread_count": await notification_service.get_unread_count(db=db, user=current_user)}
+
+@router.put("/{notification_id}/read", response_model=Notification)
+async def mark_notification_read(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    notification_id: uuid.UUID,
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> Notification:
+    """
+    Mark a notification as read.
+    """
+    return await notification_service.mark_notification_read(
+        db=db, notification_id=notification_id, user=current_user
+    )
+
+@router.post("/mark-all-read", response_model=MarkAllReadResult)
+async def mark_all_notifications_read(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> MarkAllReadResult:
+    """
+    Mark all of the current user's notifications as read.
+    """
+    return await notification_service.mark_all_read(db=db, user=current_user)
@@ -4,9 +4,12 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import TimelinePageParams
 from app.db.models.user import User as UserModel
 from app.db.models.partnership import PartnershipStatus
-from app.schemas.partnership_schemas import Partnership, PartnershipCreate, PartnershipUpdate
+from app.schemas.pagination_schemas import Page
+from app.schemas.partnership_schemas import Partnership, PartnershipCreate, PartnershipUpdate, PartnerFeedItem
+from app.services.partner_feed_service import partner_feed_service
 from app.services.partnership_service import partnership_service
 
 router = APIRouter()
@@ -46,6 +49,18 @@ async def get_current_partnership(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No active partnership found.")
     return partnership
 
+@router.get("/current/feed", response_model=Page[PartnerFeedItem])
+async def get_partner_feed(
+    db: AsyncSession = Depends(deps.get_db),
+    page: TimelinePageParams = Depends(deps.get_timeline_page_params),
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> Page[PartnerFeedItem]:
+    """
+    Get the partner's recent activity (check-ins, verifications, reflections
+    and messages) as one timeline, newest first, one page at a time.
+    """
+    return await partner_feed_service.get_feed(db=db, user=current_user, page=page)
+
 @router.put("/requests/{partnership_id}/respond", response_model=Partnership)
 async def respond_to_partnership_request(
     *,
@@ -0,0 +1,39 @@
+import uuid
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.db.models.user import User as UserModel
+from app.schemas.progress_schemas import DateRangePreset, Progress, StatsSource
+from app.services.progress_service import progress_service
+
+router = APIRouter()
+
+@router.get("/", response_model=Progress)
+async def read_progress(
+    db: AsyncSession = Depends(deps.get_db),
+    goal_id: Optional[uuid.UUID] = Query(None, alias="goalId"),
+    preset: DateRangePreset = Query(DateRangePreset.LAST_7D, alias="dateRangePreset"),
+    start_date: Optional[date] = Query(None, alias="startDate"),
+    end_date: Optional[date] = Query(None, alias="endDate"),
+    compare_partner: bool = Query(False, alias="comparePartner"),
+    source: Optional[StatsSource] = Query(None),
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> Progress:
+    """
+    Consistency, weekday and per-system statistics for the current user,
+    optionally side by side with their partner. `source` picks where daily
+    totals are read from (rollup or raw); it defaults to the server setting.
+    """
+    return await progress_service.get_progress(
+        db=db,
+        user=current_user,
+        preset=preset,
+        start_date=start_date,
+        end_date=end_date,
+        goal_id=goal_id,
+        compare_partner=compare_partner,
+        source=source,
+    )
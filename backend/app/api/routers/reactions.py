@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.db.models.user import User as UserModel
-from app.schemas.reaction_schemas import Reaction, ReactionCreate
+from app.schemas.reaction_schemas import Reaction, ReactionCreate, ReactionSummary, ReactionSummaryRequest
 from app.services.reaction_service import reaction_service
 
 router = APIRouter()
@@ -44,4 +44,17 @@ async def get_reactions_by_message(
     """
     Get all reactions for a specific message.
     """
-    return await reaction_service.get_reactions_for_message(db=db, message_id=message_id, user=current_user) 
\ No newline at end of file
+    return await reaction_service.get_reactions_for_message(db=db, message_id=message_id, user=current_user)
+
+@router.post("/summary", response_model=List[ReactionSummary])
+async def get_reaction_summaries(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    summary_in: ReactionSummaryRequest,
+    current_user: UserModel = Depends(deps.get_current_user),
+) -> List[ReactionSummary]:
+    """
+    Emoji counts and whether the current user reacted, for a whole screen of
+    messages or feed items in one call.
+    """
+    return await reaction_service.get_reaction_summaries(db=db, targets=summary_in.targets, user=current_user)
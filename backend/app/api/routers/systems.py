@@ -1,10 +1,11 @@
 import uuid
-from typing import List
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.pagination import PageParams
 from app.db.models.user import User as UserModel
+from app.schemas.pagination_schemas import Page
 from app.schemas.system_schemas import System, SystemCreate, SystemUpdate
 from app.services.system_service import system_service
 
@@ -35,17 +36,18 @@ async def read_system(
     """
     return await system_service.get_system_by_id(db=db, system_id=system_id, user=current_user)
 
-@router.get("/by_goal/{goal_id}", response_model=List[System])
+@router.get("/by_goal/{goal_id}", response_model=Page[System])
 async def read_systems_by_goal(
     *,
     db: AsyncSession = Depends(deps.get_db),
     goal_id: uuid.UUID,
+    page: PageParams = Depends(deps.get_page_params),
     current_user: UserModel = Depends(deps.get_current_user),
-) -> List[System]:
+) -> Page[System]:
     """
-    Get all systems belonging to a specific goal.
+    Get the systems belonging to a specific goal, newest first, one page at a time.
     """
-    return await system_service.get_systems_for_goal(db=db, goal_id=goal_id, user=current_user)
+    return await system_service.get_systems_for_goal(db=db, goal_id=goal_id, user=current_user, page=page)
 
 @router.put("/{system_id}", response_model=System)
 async def update_system(
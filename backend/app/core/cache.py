@@ -0,0 +1,128 @@
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+class TTLCache(Generic[V]):
+    """
+    A small bounded in-process cache with per-entry expiry and LRU eviction.
+    Keeps hit/miss/eviction counters so callers can report how effective it is.
+    Not shared between worker processes.
+
+    To cache a value loaded while it may be invalidated concurrently, read
+    `version(key)` before loading and pass it to `set`: the value is then
+    dropped if `pop` ran for that key in between.
+    """
+    def __init__(self, *, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        # Version of each recently popped key, bounded like the entries. Keys
+        # without one are at `_version_floor`, which only ever grows, so an
+        # evicted version can only make `set` skip a value, never keep a stale one.
+        self._versions: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._version_floor = 0
+        self._clock = itertools.count(1)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_sets = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Return the cached value for a key, or None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def version(self, key: Hashable) -> int:
+        """
+        The key's current version, for `set(..., version=...)`.
+        """
+        return self._versions.get(key, self._version_floor)
+
+    def set(
+        self, key: Hashable, value: V, *, ttl_seconds: Optional[float] = None, version: Optional[int] = None
+    ) -> None:
+        """
+        Store a value. `ttl_seconds` can only shorten the cache-wide TTL.
+        With `version`, the value is not stored if the key was popped since
+        that version was read.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+        if version is not None and self.version(key) != version:
+            self.stale_sets += 1
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """
+        Remove a single entry, returning its value if it was present, and
+        bump the key's version.
+        """
+        self._versions[key] = next(self._clock)
+        self._versions.move_to_end(key)
+        while len(self._versions) > self.max_entries:
+            _, evicted = self._versions.popitem(last=False)
+            self._version_floor = max(self._version_floor, evicted)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.invalidations += 1
+        return entry[1]
+
+    def invalidate_where(self, predicate: Callable[[Hashable, V], bool]) -> int:
+        """
+        Remove every entry matching the predicate. This is a linear scan, so it is
+        meant for rare events such as profile changes, not per-request work.
+        """
+        doomed = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in doomed:
+            del self._entries[key]
+        self.invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the cache counters.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "stale_sets": self.stale_sets,
+        }
@@ -26,6 +26,16 @@ class Settings(BaseSettings):
     # This field will be constructed automatically
     DATABASE_URL: str | None = None
 
+    # Engine profile: "dev", "pgbouncer-transaction" or "direct-primary".
+    # See app/db/engine_profiles.py. The DB_* values below override the profile.
+    DB_ENGINE_PROFILE: str = "dev"
+    DB_ECHO: bool | None = None
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_RECYCLE_SECONDS: int | None = None
+    DB_POOL_TIMEOUT_SECONDS: float | None = None
+    DB_COMMAND_TIMEOUT_SECONDS: float | None = None
+
     @model_validator(mode='before')
     def assemble_db_connection(cls, v: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(v, dict) and not v.get("DATABASE_URL"):
@@ -39,6 +49,86 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7 # 7 days
     ALGORITHM: str = "HS256"
+
+    # In-process cache of verified principals used by deps.get_current_user.
+    # Set the TTL to 0 to disable the cache entirely.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Where progress statistics read daily check-in totals from: "raw"
+    # (aggregated from checkins per request) or "rollup" (checkin_daily_rollups).
+    # The migration creates the rollup table empty; switch to "rollup" only
+    # after 'python checkin_rollups.py backfill' (and 'verify') has run.
+    CHECKIN_STATS_SOURCE: str = "raw"
+
+    # Notifications are queued after commit and written in batches by
+    # app/services/notification_dispatcher.py. When disabled they are inserted
+    # inline in the request's own transaction instead.
+    NOTIFICATION_DISPATCHER_ENABLED: bool = True
+    NOTIFICATION_QUEUE_MAX_SIZE: int = 10_000
+    NOTIFICATION_BATCH_SIZE: int = 500
+    NOTIFICATION_FLUSH_INTERVAL_SECONDS: float = 0.05
+    # How long a request waits for queue space before writing its own batch.
+    NOTIFICATION_ENQUEUE_TIMEOUT_SECONDS: float = 0.5
+    NOTIFICATION_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    # Attempts (with exponential backoff) at writing a batch from the worker.
+    NOTIFICATION_WRITE_ATTEMPTS: int = 4
+
+    # Real-time fan-out (app/core/pubsub.py): "memory" reaches only this
+    # process; "postgres" uses LISTEN/NOTIFY across workers and nodes, over
+    # PUBSUB_DATABASE_URL (a session-mode connection) or DATABASE_URL.
+    PUBSUB_BACKEND: str = "memory"
+    PUBSUB_DATABASE_URL: str | None = None
+    PUBSUB_MAX_PENDING_EVENTS: int = 100
+
+    # In-process cache of per-target reaction summaries. Writes invalidate the
+    # local entry; the TTL bounds staleness seen by other workers.
+    REACTION_SUMMARY_CACHE_TTL_SECONDS: int = 5
+    REACTION_SUMMARY_CACHE_MAX_ENTRIES: int = 50_000
+
+    # Outgoing email is written to the email_outbox table in the same
+    # transaction as the change that triggers it, and delivered by the
+    # background sender in app/services/email_sender.py. EMAIL_TRANSPORT is
+    # "resend" (batch API), "smtp" (e.g. a local MailHog) or "file" (writes
+    # each message to EMAIL_FILE_DIR; for tests and local development).
+    EMAIL_TRANSPORT: str = "resend"
+    EMAIL_FROM: str | None = None
+    EMAIL_FILE_DIR: str = "sent_emails"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    EMAIL_SENDER_ENABLED: bool = True
+    EMAIL_BATCH_SIZE: int = 100
+    EMAIL_SEND_CONCURRENCY: int = 4
+    EMAIL_POLL_INTERVAL_SECONDS: float = 5.0
+    # Immediate retries of a failed send, with exponential backoff and jitter.
+    EMAIL_SEND_RETRY_ATTEMPTS: int = 3
+    # After that the message goes back to the outbox, retried after
+    # EMAIL_RETRY_BASE_SECONDS * 2^(attempts - 1), until EMAIL_MAX_ATTEMPTS.
+    EMAIL_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_MAX_ATTEMPTS: int = 8
+    # A claimed message is retried by another sender if not settled within this.
+    EMAIL_LEASE_SECONDS: int = 300
+
+    # AI planner (app/services/ai_planner_service.py). Plans are cached by
+    # model, prompt version and normalized goal text: in memory per process,
+    # and in the ai_plan_cache table when AI_PLAN_CACHE_PERSISTENT is on.
+    # AI_PLANNER_PROVIDER picks the model provider (app/services/ai_models.py):
+    # "gemini", or "fake" for an offline model used in local benchmarks.
+    AI_PLANNER_PROVIDER: str = "gemini"
+    AI_PLANNER_MODEL: str = "gemini-1.5-pro-latest"
+    AI_PLAN_CACHE_TTL_SECONDS: int = 3600
+    AI_PLAN_CACHE_MAX_ENTRIES: int = 1000
+    AI_PLAN_CACHE_PERSISTENT: bool = True
+    AI_PLAN_CACHE_PERSISTENT_TTL_SECONDS: int = 30 * 24 * 3600
+    # At most AI_PLANNER_MAX_CONCURRENCY model calls run at once per process;
+    # up to AI_PLANNER_MAX_QUEUE more wait up to AI_PLANNER_QUEUE_TIMEOUT_SECONDS
+    # before getting a 503. Each user may start AI_PLANNER_USER_BURST requests
+    # at once, refilled at AI_PLANNER_USER_RATE_PER_MINUTE, before getting a 429.
+    AI_PLANNER_MAX_CONCURRENCY: int = 4
+    AI_PLANNER_MAX_QUEUE: int = 16
+    AI_PLANNER_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    AI_PLANNER_USER_RATE_PER_MINUTE: float = 6.0
+    AI_PLANNER_USER_BURST: int = 3
     
     # API Keys for external services (optional)
     OPENAI_API_KEY: str | None = None
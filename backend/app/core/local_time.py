@@ -0,0 +1,37 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+def resolve_timezone(name: Optional[str]) -> ZoneInfo:
+    """
+    ZoneInfo for a user's stored timezone name, falling back to UTC when it
+    is missing or not a valid IANA name.
+    """
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+def local_today(tz: ZoneInfo) -> date:
+    """
+    The current calendar date in the given timezone.
+    """
+    return datetime.now(tz).date()
+
+def local_day_bounds(day: date, tz: ZoneInfo) -> Tuple[datetime, datetime]:
+    """
+    The [start, end) UTC instants covering a local calendar day. Handles DST
+    transitions, so a day is not always 24 hours long.
+    """
+    start = datetime.combine(day, time.min, tzinfo=tz)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+def weekday_name(day: date) -> str:
+    """
+    Lowercase three-letter weekday ("mon" ... "sun") as used in
+    `System.frequency_details["days"]`.
+    """
+    return WEEKDAY_NAMES[day.weekday()]
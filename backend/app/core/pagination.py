@@ -0,0 +1,114 @@
+import base64
+import hashlib
+import hmac
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from app.core.config import settings
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+# Signatures are truncated; 128 bits is plenty to stop clients forging cursors.
+_SIGNATURE_BYTES = 16
+
+CursorKey = Tuple[datetime, uuid.UUID]
+# A position in a merged timeline: timestamp, source stream, row ID.
+TimelineCursorKey = Tuple[datetime, str, uuid.UUID]
+
+class InvalidCursorError(ValueError):
+    pass
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _signature(payload: bytes) -> bytes:
+    key = hashlib.sha256(b"pagination-cursor:" + settings.JWT_SECRET.encode()).digest()
+    return hmac.new(key, payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+def _sign(fields: List[Any]) -> str:
+    """
+    Serialize cursor fields into an opaque, signed `payload.signature` string.
+    """
+    payload = json.dumps(fields, separators=(",", ":")).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_signature(payload))}"
+
+def _unsign(cursor: str) -> Any:
+    """
+    Verify a cursor produced by `_sign` and return its decoded fields.
+    Raises InvalidCursorError if it was tampered with or is malformed.
+    """
+    try:
+        payload_part, signature_part = cursor.split(".", 1)
+        payload = _b64decode(payload_part)
+        signature = _b64decode(signature_part)
+    except ValueError:
+        raise InvalidCursorError("Malformed cursor.") from None
+
+    if not hmac.compare_digest(signature, _signature(payload)):
+        raise InvalidCursorError("Cursor signature does not match.")
+
+    try:
+        return json.loads(payload)
+    except ValueError:
+        raise InvalidCursorError("Malformed cursor.") from None
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """
+    Encode the (created_at, id) sort key of the last row on a page into an
+    opaque, signed cursor string.
+    """
+    return _sign([created_at.isoformat(), id.hex])
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """
+    Verify and decode a cursor produced by `encode_cursor`.
+    Raises InvalidCursorError if it was tampered with or is malformed.
+    """
+    fields = _unsign(cursor)
+    try:
+        created_at, id_hex = fields
+        return datetime.fromisoformat(created_at), uuid.UUID(hex=id_hex)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Malformed cursor.") from None
+
+def encode_timeline_cursor(occurred_at: datetime, source: str, id: uuid.UUID) -> str:
+    """
+    Like `encode_cursor`, for a timeline merged from several sources: the
+    source name is part of the sort key, since IDs are only unique within one.
+    """
+    return _sign([occurred_at.isoformat(), source, id.hex])
+
+def decode_timeline_cursor(cursor: str) -> TimelineCursorKey:
+    """
+    Verify and decode a cursor produced by `encode_timeline_cursor`.
+    Raises InvalidCursorError if it was tampered with or is malformed.
+    """
+    fields = _unsign(cursor)
+    try:
+        occurred_at, source, id_hex = fields
+        return datetime.fromisoformat(occurred_at), str(source), uuid.UUID(hex=id_hex)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Malformed cursor.") from None
+
+@dataclass(frozen=True)
+class PageParams:
+    """
+    A decoded page request: where to start (None for the first page) and how many rows.
+    """
+    after: Optional[CursorKey] = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+@dataclass(frozen=True)
+class TimelinePageParams:
+    """
+    A decoded page request for a merged timeline (see `encode_timeline_cursor`).
+    """
+    after: Optional[TimelineCursorKey] = None
+    limit: int = DEFAULT_PAGE_SIZE
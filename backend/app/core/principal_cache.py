@@ -0,0 +1,56 @@
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.schemas.user_schemas import UserPrincipal
+
+class PrincipalCache:
+    """
+    Caches verified principals by their bearer token so that repeat requests
+    skip both the JWT verification and the user lookup.
+    An entry never outlives the token's own `exp` claim.
+    """
+    def __init__(self, *, max_entries: int, ttl_seconds: int):
+        self._cache: TTLCache[UserPrincipal] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.ttl_seconds > 0
+
+    def get(self, token: str) -> Optional[UserPrincipal]:
+        if not self.enabled:
+            return None
+        return self._cache.get(token)
+
+    def set(self, token: str, principal: UserPrincipal, *, expires_at: Optional[int] = None) -> None:
+        """
+        Cache a principal for a token that has just been verified.
+        """
+        if not self.enabled:
+            return
+        ttl_seconds = None
+        if expires_at is not None:
+            ttl_seconds = expires_at - time.time()
+        self._cache.set(token, principal, ttl_seconds=ttl_seconds)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> int:
+        """
+        Drop every cached token that belongs to a user. Call this whenever a
+        column captured in UserPrincipal changes.
+        """
+        return self._cache.invalidate_where(lambda _, principal: principal.id == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,31 @@
+from typing import Any, Callable, Dict, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+class ProviderRegistry(Generic[T]):
+    """
+    Named factories for one kind of external-service client (an AI model,
+    an email transport, ...). Nothing is built or imported when a provider
+    is registered: factories import their SDK and check their API key when
+    first called, so the app starts without SDKs or keys for services it
+    does not use. Local stubs are registered alongside the real providers
+    and selected the same way, by name from settings.
+    """
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._factories: Dict[str, Callable[..., T]] = {}
+
+    def register(self, name: str, factory: Callable[..., T]) -> None:
+        self._factories[name] = factory
+
+    def names(self) -> List[str]:
+        return sorted(self._factories)
+
+    def create(self, name: str, **options: Any) -> T:
+        """
+        Build a client with the named provider's factory.
+        """
+        factory = self._factories.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown {self.kind} provider '{name}'. Expected one of: {', '.join(self.names())}.")
+        return factory(**options)
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+class Subscription:
+    """
+    One subscriber's bounded queue of encoded events. A subscriber that
+    falls `max_pending` events behind is closed rather than slowing down
+    everyone else on the channel; it should reconnect and refetch.
+    """
+    def __init__(self, channel: str, max_pending: int):
+        self.channel = channel
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def offer(self, text: str) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(text)
+        except asyncio.QueueFull:
+            self.close()
+
+    def close(self) -> None:
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> Optional[str]:
+        """
+        The next encoded event, or None once the subscription is closed.
+        """
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+class PubSubHub:
+    """
+    In-process hub: events published on a channel are delivered to every
+    local subscriber of that channel. Each event is JSON-encoded once and
+    the same string is handed to all subscribers.
+    Only reaches subscribers in this process; see PostgresPubSubHub.
+    """
+    def __init__(self, *, max_pending: int = settings.PUBSUB_MAX_PENDING_EVENTS):
+        self.max_pending = max_pending
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        for subscriptions in list(self._subscribers.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        subscription = Subscription(channel, self.max_pending)
+        self._subscribers.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscribers.get(channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[channel]
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        self.published += 1
+        self.deliver_local(channel, json.dumps(event, default=str))
+
+    def deliver_local(self, channel: str, text: str) -> None:
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.offer(text)
+            self.delivered += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self).__name__,
+            "channels": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+        }
+
+class PostgresPubSubHub(PubSubHub):
+    """
+    Hub that fans out across processes and nodes with Postgres
+    LISTEN/NOTIFY. `publish` sends a NOTIFY on one shared Postgres channel;
+    every process LISTENs on it and delivers the events to its own local
+    subscribers (including the publishing process).
+
+    LISTEN needs a dedicated session-mode connection, so point
+    PUBSUB_DATABASE_URL at the database directly rather than through a
+    transaction-mode pooler.
+    """
+    PG_CHANNEL = "duotrak_events"
+
+    def __init__(self, dsn: str, **kwargs):
+        super().__init__(**kwargs)
+        self.dsn = dsn
+        self._listen_conn = None
+        self._publish_conn = None
+        self._publish_lock = asyncio.Lock()
+        self._stopping = False
+
+    async def start(self) -> None:
+        self._stopping = False
+        await self._connect_listener()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for conn in (self._listen_conn, self._publish_conn):
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+        self._listen_conn = self._publish_conn = None
+        await super().stop()
+
+    async def _connect_listener(self) -> None:
+        import asyncpg
+
+        self._listen_conn = await asyncpg.connect(self.dsn)
+        await self._listen_conn.add_listener(self.PG_CHANNEL, self._on_notify)
+        self._listen_conn.add_termination_listener(self._on_listener_lost)
+
+    def _on_listener_lost(self, conn) -> None:
+        if self._stopping:
+            return
+        logger.warning("Lost the pub/sub LISTEN connection; reconnecting.")
+        asyncio.get_running_loop().create_task(self._reconnect_listener())
+
+    async def _reconnect_listener(self) -> None:
+        delay = 0.5
+        while not self._stopping:
+            try:
+                if self._listen_conn is not None and not self._listen_conn.is_closed():
+                    await self._listen_conn.close()
+                await self._connect_listener()
+                return
+            except Exception:
+                logger.exception("Pub/sub reconnect failed; retrying in %.1fs.", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    async def _publisher(self):
+        """
+        The publish connection, opened on first use and reopened if it has
+        died. Called with `_publish_lock` held.
+        """
+        import asyncpg
+
+        if self._publish_conn is None or self._publish_conn.is_closed():
+            self._publish_conn = await asyncpg.connect(self.dsn)
+        return self._publish_conn
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        import asyncpg
+
+        payload = json.dumps({"channel": channel, "event": event}, default=str)
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD_BYTES:
+            # Too large for NOTIFY: tell subscribers to refetch instead.
+            payload = json.dumps({"channel": channel, "event": {"type": event.get("type"), "refetch": True}})
+        async with self._publish_lock:
+            try:
+                conn = await self._publisher()
+                await conn.execute("SELECT pg_notify($1, $2)", self.PG_CHANNEL, payload)
+            except (asyncpg.exceptions.ConnectionDoesNotExistError, asyncpg.exceptions.InterfaceError, OSError):
+                # The connection died since the last publish: retry once on a new one.
+                logger.warning("Lost the pub/sub publish connection; reconnecting.")
+                self._publish_conn = None
+                conn = await self._publisher()
+                await conn.execute("SELECT pg_notify($1, $2)", self.PG_CHANNEL, payload)
+        self.published += 1
+
+    def _on_notify(self, conn, pid: int, pg_channel: str, payload: str) -> None:
+        message = json.loads(payload)
+        self.deliver_local(message["channel"], json.dumps(message["event"]))
+
+def build_hub() -> PubSubHub:
+    if settings.PUBSUB_BACKEND == "postgres":
+        dsn = settings.PUBSUB_DATABASE_URL or settings.DATABASE_URL
+        return PostgresPubSubHub(dsn.replace("postgresql+asyncpg://", "postgresql://"))
+    if settings.PUBSUB_BACKEND != "memory":
+        raise ValueError(f"Unknown PUBSUB_BACKEND '{settings.PUBSUB_BACKEND}'. Expected 'memory' or 'postgres'.")
+    return PubSubHub()
+
+pubsub_hub = build_hub()
@@ -0,0 +1,141 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, Tuple
+
+class RateLimitExceeded(Exception):
+    """
+    The caller has used up its allowance. Retry after `retry_after` seconds.
+    """
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exceeded, retry in {retry_after:.1f}s.")
+        self.retry_after = retry_after
+
+class ServiceOverloaded(Exception):
+    """
+    No capacity became free in time. Retry after `retry_after` seconds.
+    """
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+def retry_after_header(seconds: float) -> Dict[str, str]:
+    """
+    Retry-After takes whole seconds; round up so clients never come back early.
+    """
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+class TokenBuckets:
+    """
+    One token bucket per key (e.g. a user ID): up to `burst` tokens, refilled
+    at `rate` tokens per second. Buckets are refilled lazily when used, so
+    idle keys cost nothing; the least recently used are dropped beyond
+    `max_keys`, which only ever hands a full bucket back to an idle key.
+    Not shared between worker processes, and not thread-safe: call `take`
+    from the event loop (async code), never from the threadpool.
+    """
+    def __init__(self, *, rate: float, burst: float, max_keys: int = 10_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self.admitted = 0
+        self.rejected = 0
+
+    def take(self, key: Hashable, cost: float = 1.0) -> None:
+        """
+        Spend `cost` tokens from the key's bucket, or raise RateLimitExceeded
+        with the time until enough tokens have accumulated.
+        """
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+        admitted = tokens >= cost
+        if admitted:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        if not admitted:
+            self.rejected += 1
+            raise RateLimitExceeded((cost - tokens) / self.rate)
+        self.admitted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._buckets),
+            "rate": self.rate,
+            "burst": self.burst,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+class ConcurrencyLimiter:
+    """
+    Lets at most `limit` callers hold a slot at once. Up to `max_queue` more
+    wait for one, each for at most `queue_timeout` seconds; anyone beyond
+    that is turned away at once. Rejections raise ServiceOverloaded with a
+    retry hint estimated from how long slots have recently been held.
+    """
+    def __init__(self, *, limit: int, max_queue: int, queue_timeout: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        # Moving average of how long a slot is held, in seconds.
+        self.average_hold = 1.0
+
+    def retry_after(self) -> float:
+        """
+        Roughly how long until everyone queued now has been served.
+        """
+        return self.average_hold * (self.waiting + 1) / self.limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected_queue_full += 1
+                raise ServiceOverloaded(self.retry_after(), "Too many requests are waiting.")
+            self.waiting += 1
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected_timeout += 1
+                raise ServiceOverloaded(self.retry_after(), "Timed out waiting for capacity.")
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.admitted += 1
+        self.active += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.average_hold = 0.8 * self.average_hold + 0.2 * (time.monotonic() - started)
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "average_hold_seconds": round(self.average_hold, 3),
+        }
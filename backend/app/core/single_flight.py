@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight(Generic[T]):
+    """
+    Collapses concurrent calls for the same key into one. The first caller
+    starts `fn()` as a task; everyone asking for that key while it runs
+    awaits the same task and gets its result or exception. The task is
+    shielded, so a caller that is cancelled (e.g. a client disconnect) does
+    not cancel the call for the others. Within one process only.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[T]"] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._calls), "calls": self.calls, "shared": self.shared}
@@ -0,0 +1,41 @@
+import asyncio
+import json
+from contextlib import aclosing, suppress
+from typing import Any, AsyncIterator
+
+from starlette.requests import Request
+
+def format_event(event: str, data: Any) -> str:
+    """
+    One Server-Sent Event. Data is JSON-encoded, so it never contains the
+    blank line that ends an event.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+async def stream_until_disconnected(
+    request: Request, events: AsyncIterator[str], *, poll_interval: float = 0.25
+) -> AsyncIterator[str]:
+    """
+    Pass `events` through to a StreamingResponse, closing the upstream
+    iterator as soon as the client goes away. Starlette only notices a
+    disconnect when it next writes, which can be long after the client left
+    while a slow upstream is still producing; here the connection is checked
+    every `poll_interval` while waiting for the next event.
+    """
+    async with aclosing(events):
+        while True:
+            next_event = asyncio.ensure_future(anext(events))
+            while True:
+                done, _ = await asyncio.wait({next_event}, timeout=poll_interval)
+                if done:
+                    break
+                if await request.is_disconnected():
+                    next_event.cancel()
+                    with suppress(asyncio.CancelledError, StopAsyncIteration):
+                        await next_event
+                    return
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield event
@@ -0,0 +1,297 @@
+import uuid
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import Select
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.pagination import CursorKey, PageParams, encode_cursor
+from app.db.base_class import Base
+from app.db.unit_of_work import commit_or_flush
+
+ModelType = TypeVar("ModelType", bound=Base)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+# Postgres caps a statement at 32767 bind parameters, so bulk statements are
+# issued in chunks well under that.
+DEFAULT_BATCH_SIZE = 1000
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Shared async CRUD operations for a single model.
+    Model-specific CRUD classes subclass this and add their own queries.
+    All writes go through `commit_or_flush`, so they take part in an active
+    unit of work.
+    """
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    # --- Single-row operations ---
+
+    async def get(
+        self, db: AsyncSession, id: uuid.UUID, *, options: Sequence[ORMOption] = ()
+    ) -> Optional[ModelType]:
+        """
+        Get a single row by its ID. Relationships are only loaded when
+        requested via `options` (see app/db/load_plans.py).
+        """
+        statement = select(self.model).where(self.model.id == id).options(*options)
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType | Dict[str, Any]) -> ModelType:
+        """
+        Create a new row.
+        """
+        data = obj_in if isinstance(obj_in, dict) else obj_in.dict()
+        db_obj = self.model(**data)
+        db.add(db_obj)
+        await commit_or_flush(db)
+        return db_obj
+
+    async def update(
+        self, db: AsyncSession, *, db_obj: ModelType, obj_in: UpdateSchemaType | Dict[str, Any]
+    ) -> ModelType:
+        """
+        Update an existing row with the fields that were explicitly set.
+        """
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+
+        db.add(db_obj)
+        await commit_or_flush(db)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[ModelType]:
+        """
+        Remove a row by its ID.
+        """
+        db_obj = await self.get(db, id=id)
+        if db_obj:
+            await self.remove_obj(db, db_obj=db_obj)
+        return db_obj
+
+    async def remove_obj(self, db: AsyncSession, *, db_obj: ModelType) -> ModelType:
+        """
+        Remove a row that has already been loaded, without fetching it again.
+        """
+        await db.delete(db_obj)
+        await commit_or_flush(db)
+        return db_obj
+
+    # --- Ownership-scoped lookups ---
+
+    def select_owned(self, user_id: uuid.UUID) -> Select:
+        """
+        A SELECT of this model restricted to rows owned by `user_id`.
+        Models that belong to a user override this, joining through to the
+        owning column where needed.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not define ownership.")
+
+    async def get_owned(
+        self, db: AsyncSession, *, id: uuid.UUID, user_id: uuid.UUID, options: Sequence[ORMOption] = ()
+    ) -> Optional[ModelType]:
+        """
+        Get a row by ID only if it belongs to `user_id`, in a single statement.
+        Returns None both when the row is missing and when someone else owns it.
+        """
+        statement = self.select_owned(user_id).where(self.model.id == id).options(*options)
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    # --- Keyset pagination ---
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        statement: Select,
+        *,
+        page: PageParams,
+        descending: bool = True,
+        sort_column: Optional[InstrumentedAttribute] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run `statement` as one keyset page ordered by (created_at, id) and
+        return it shaped like `schemas.pagination_schemas.Page`. Rows are
+        fetched with `WHERE (created_at, id) < cursor` (or `>` when ascending),
+        so every page costs the same regardless of depth and rows inserted
+        meanwhile never shift the results. One extra row is read to know
+        whether a next page exists. `sort_column` replaces created_at with
+        another non-null timestamp column.
+        """
+        sort_column = self.model.created_at if sort_column is None else sort_column
+        sort_key = tuple_(sort_column, self.model.id)
+        if page.after is not None:
+            after = tuple_(*page.after)
+            statement = statement.where(sort_key < after if descending else sort_key > after)
+
+        if descending:
+            statement = statement.order_by(sort_column.desc(), self.model.id.desc())
+        else:
+            statement = statement.order_by(sort_column.asc(), self.model.id.asc())
+
+        result = await db.execute(statement.limit(page.limit + 1))
+        rows = list(result.scalars().unique().all())
+        next_cursor = None
+        if len(rows) > page.limit:
+            rows = rows[:page.limit]
+            next_cursor = encode_cursor(getattr(rows[-1], sort_column.key), rows[-1].id)
+        return {"items": rows, "next_cursor": next_cursor}
+
+    async def get_timeline_slice(
+        self,
+        db: AsyncSession,
+        statement: Select,
+        *,
+        sort_column: InstrumentedAttribute,
+        limit: int,
+        before: Optional[CursorKey] = None,
+        include_ties: Optional[bool] = None,
+    ) -> List[ModelType]:
+        """
+        Up to `limit` rows of `statement`, newest first by (sort_column, id),
+        for merging several timelines into one. With `before`, only rows
+        sorting after that position are read: strictly before (timestamp, id)
+        by default or, when `include_ties` is set, compared on the timestamp
+        alone, keeping (True) or dropping (False) rows at exactly that time.
+        """
+        if before is not None:
+            before_at, before_id = before
+            if include_ties is None:
+                statement = statement.where(tuple_(sort_column, self.model.id) < tuple_(before_at, before_id))
+            elif include_ties:
+                statement = statement.where(sort_column <= before_at)
+            else:
+                statement = statement.where(sort_column < before_at)
+        statement = statement.order_by(sort_column.desc(), self.model.id.desc()).limit(limit)
+        result = await db.execute(statement)
+        return list(result.scalars().unique().all())
+
+    # --- Bulk operations ---
+
+    async def get_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[uuid.UUID],
+        options: Sequence[ORMOption] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[ModelType]:
+        """
+        Get many rows by ID with `WHERE id IN (...)`, one statement per chunk.
+        Missing IDs are skipped and rows come back in no particular order.
+        """
+        found: List[ModelType] = []
+        statement = select(self.model).options(*options)
+        for chunk in _chunks(list(dict.fromkeys(ids)), batch_size):
+            result = await db.execute(statement.where(self.model.id.in_(chunk)))
+            found.extend(result.scalars().unique().all())
+        return found
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[ModelType]:
+        """
+        Insert many rows with multi-row `INSERT ... RETURNING` statements and
+        return the new objects in input order. Python-side defaults (such as
+        generated UUIDs) are applied; ORM events and relationship cascades are not.
+        """
+        rows = [obj if isinstance(obj, dict) else obj.dict() for obj in objs_in]
+        if not rows:
+            return []
+
+        created: List[ModelType] = []
+        statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        for chunk in _chunks(rows, batch_size):
+            result = await db.scalars(statement, list(chunk))
+            created.extend(result.all())
+        await commit_or_flush(db)
+        return created
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        values: Dict[str, Any],
+        ids: Optional[Sequence[uuid.UUID]] = None,
+        where: Sequence[ColumnElement[bool]] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Apply the same `values` to every matching row with `UPDATE ... WHERE`
+        and return the number of rows changed. Rows are selected by `ids`,
+        by extra `where` criteria, or both. Criteria are required, so this
+        never updates a whole table by accident.
+        """
+        if ids is None and not where:
+            raise ValueError("update_many requires ids or where criteria.")
+        if ids is not None and not ids:
+            return 0
+
+        statement = update(self.model).where(*where).values(**values)
+        updated = 0
+        if ids is None:
+            result = await db.execute(statement)
+            updated = result.rowcount
+        else:
+            for chunk in _chunks(list(ids), batch_size):
+                result = await db.execute(statement.where(self.model.id.in_(chunk)))
+                updated += result.rowcount
+        await commit_or_flush(db)
+        return updated
+
+    async def update_many_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        rows: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Apply a different set of values to each row. Every dict must contain
+        the row's `id`. Runs as an executemany `UPDATE ... WHERE id = :id`.
+        """
+        if not rows:
+            return
+        if any("id" not in row for row in rows):
+            raise ValueError("Every row passed to update_many_by_id needs an 'id'.")
+
+        for chunk in _chunks(list(rows), batch_size):
+            await db.execute(update(self.model), list(chunk))
+        await commit_or_flush(db)
+
+    async def delete_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[uuid.UUID],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Delete rows by ID with `DELETE ... WHERE id IN (...)` and return how
+        many were removed. Child rows are removed by the database's
+        ON DELETE CASCADE foreign keys.
+        """
+        deleted = 0
+        for chunk in _chunks(list(ids), batch_size):
+            result = await db.execute(delete(self.model).where(self.model.id.in_(chunk)))
+            deleted += result.rowcount
+        await commit_or_flush(db)
+        return deleted
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from pydantic import BaseModel
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.crud.base import CRUDBase
+from app.db.models.ai_plan_cache import AIPlanCacheEntry
+from app.db.unit_of_work import commit_or_flush
+
+class CRUDAIPlanCache(CRUDBase[AIPlanCacheEntry, BaseModel, BaseModel]):
+    async def get_plan_text(self, db: AsyncSession, *, key: str) -> Optional[str]:
+        """
+        The cached plan for a key, unless it has expired.
+        """
+        statement = select(self.model.plan_text).where(
+            self.model.key == key, self.model.expires_at > func.now()
+        )
+        result = await db.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def put(
+        self, db: AsyncSession, *, key: str, model: str, prompt_version: str, plan_text: str, ttl_seconds: int
+    ) -> None:
+        """
+        Store a plan, replacing any earlier (e.g. expired) entry for the key.
+        """
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        statement = insert(self.model).values(
+            key=key, model=model, prompt_version=prompt_version, plan_text=plan_text, expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.key],
+            set_={
+                "plan_text": statement.excluded.plan_text,
+                "created_at": func.now(),
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        await db.execute(statement)
+        await commit_or_flush(db)
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        """
+        Delete expired entries and return how many were removed.
+        """
+        result = await db.execute(delete(self.model).where(self.model.expires_at <= func.now()))
+        await commit_or_flush(db)
+        return result.rowcount
+
+ai_plan_cache = CRUDAIPlanCache(AIPlanCacheEntry)
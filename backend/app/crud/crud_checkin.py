@@ -1,74 +1,208 @@
 import uuid
-from typing import List, Optional, Type
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Date, Integer, Row, case, cast, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import Select
 
-from app.db.models.checkin import Checkin
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
+from app.db.models.checkin import COMPLETED_CHECKIN_STATUSES, Checkin, CheckinStatus
+from app.db.models.goal import Goal
+from app.db.models.system import System
 from app.schemas.checkin_schemas import CheckinCreate, CheckinUpdate
 
-class CRUDCheckin:
-    def __init__(self, model: Type[Checkin]):
-        self.model = model
+class CRUDCheckin(CRUDBase[Checkin, CheckinCreate, CheckinUpdate]):
+    def select_owned(self, user_id: uuid.UUID) -> Select:
+        """
+        Check-ins whose system belongs to a goal owned by the user.
+        """
+        return (
+            select(self.model)
+            .join(System, System.id == self.model.system_id)
+            .join(Goal, Goal.id == System.goal_id)
+            .where(Goal.user_id == user_id)
+        )
 
-    async def create(self, db: AsyncSession, *, obj_in: CheckinCreate) -> Checkin:
+    def select_by_user(self, user_id: uuid.UUID) -> Select:
         """
-        Create a new check-in.
+        Check-ins logged by the user.
         """
-        db_obj = self.model(**obj_in.dict())
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        return select(self.model).where(self.model.user_id == user_id)
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[Checkin]:
+    def select_verified_by(self, verifier_id: uuid.UUID) -> Select:
         """
-        Get a single check-in by its ID.
+        Check-ins the user has verified as a partner.
         """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        return result.scalars().first()
+        return select(self.model).where(
+            self.model.verified_by_partner_id == verifier_id,
+            self.model.verified_at_utc.is_not(None),
+        )
 
     async def get_multi_by_system(
-        self, db: AsyncSession, *, system_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[Checkin]:
+        self, db: AsyncSession, *, system_id: uuid.UUID, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Get multiple check-ins for a specific system with pagination.
+        Get one keyset page of check-ins for a specific system, newest first.
+        """
+        statement = select(self.model).where(self.model.system_id == system_id)
+        return await self.get_page(db, statement, page=page)
+
+    async def get_pending_verifications(
+        self,
+        db: AsyncSession,
+        *,
+        partnership_id: uuid.UUID,
+        verifier_id: uuid.UUID,
+        limit: int = 20,
+    ) -> Tuple[int, List[Row]]:
+        """
+        Check-ins by the verifier's partner that are waiting for verification,
+        oldest first. Returns the total count and up to `limit` rows (with the
+        system title) from a single query.
         """
         statement = (
-            select(self.model)
-            .where(self.model.system_id == system_id)
-            .offset(skip)
+            select(
+                self.model.id,
+                self.model.system_id,
+                self.model.checkin_timestamp_utc,
+                System.title.label("system_title"),
+                func.count().over().label("total"),
+            )
+            .join(System, System.id == self.model.system_id)
+            .where(
+                self.model.partnership_id == partnership_id,
+                self.model.user_id != verifier_id,
+                self.model.status == CheckinStatus.PENDING_VERIFICATION,
+            )
+            .order_by(self.model.checkin_timestamp_utc.asc())
             .limit(limit)
-            .order_by(self.model.created_at.desc())
         )
         result = await db.execute(statement)
-        return result.scalars().all()
+        rows = result.all()
+        return (rows[0].total if rows else 0), rows
+
+    async def summarize_streaks(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        timezone_name: str,
+        by_system: bool = False,
+        system_id: Optional[uuid.UUID] = None,
+    ) -> List[Row]:
+        """
+        Recompute streaks from the raw check-ins in SQL (gaps-and-islands over
+        the distinct local days with a completed check-in). Returns one row for
+        the user, or one per system with `by_system=True`, holding the latest
+        run (`first_day`, `last_day`, `length`) and the `longest` run.
+        Used to rebuild the streak store, not on the request path.
+        """
+        local_day = cast(func.timezone(timezone_name, self.model.checkin_timestamp_utc), Date)
+        keys = [self.model.system_id] if by_system else []
+        filters = [
+            self.model.user_id == user_id,
+            self.model.status.in_(COMPLETED_CHECKIN_STATUSES),
+        ]
+        if system_id is not None:
+            filters.append(self.model.system_id == system_id)
+
+        days = select(*keys, local_day.label("day")).where(*filters).distinct().cte("days")
+        day_keys = [days.c.system_id] if by_system else []
+        # Consecutive days share the same (day - row_number) value.
+        island = days.c.day - cast(
+            func.row_number().over(partition_by=day_keys or None, order_by=days.c.day), Integer
+        )
+        numbered = select(*day_keys, days.c.day, island.label("island")).cte("numbered")
+        numbered_keys = [numbered.c.system_id] if by_system else []
+        islands = (
+            select(
+                *numbered_keys,
+                func.min(numbered.c.day).label("first_day"),
+                func.max(numbered.c.day).label("last_day"),
+                func.count().label("length"),
+            )
+            .group_by(*numbered_keys, numbered.c.island)
+            .cte("islands")
+        )
+        island_keys = [islands.c.system_id] if by_system else []
+        ranked = select(
+            *island_keys,
+            islands.c.first_day,
+            islands.c.last_day,
+            islands.c.length,
+            func.max(islands.c.length).over(partition_by=island_keys or None).label("longest"),
+            func.row_number().over(
+                partition_by=island_keys or None, order_by=islands.c.last_day.desc()
+            ).label("recency"),
+        ).subquery("ranked")
+        statement = select(
+            *([ranked.c.system_id] if by_system else []),
+            ranked.c.first_day,
+            ranked.c.last_day,
+            ranked.c.length,
+            ranked.c.longest,
+        ).where(ranked.c.recency == 1)
+        result = await db.execute(statement)
+        return result.all()
+
+    def local_date_expression(self, timezones: Dict[uuid.UUID, str]):
+        """
+        SQL expression for a check-in's local date in its owner's timezone,
+        given the (already validated) timezone of every user involved.
+        """
+        local_timestamp = case(
+            *[
+                (self.model.user_id == user_id, func.timezone(tz_name, self.model.checkin_timestamp_utc))
+                for user_id, tz_name in timezones.items()
+            ],
+            else_=func.timezone("UTC", self.model.checkin_timestamp_utc),
+        )
+        return cast(local_timestamp, Date)
 
-    async def update(
-        self, db: AsyncSession, *, db_obj: Checkin, obj_in: CheckinUpdate
-    ) -> Checkin:
-        """
-        Update an existing check-in.
-        """
-        update_data = obj_in.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    def select_daily_totals(self, timezones: Dict[uuid.UUID, str]) -> Select:
+        """
+        Raw per (user, system, local day) totals, shaped like the rows of
+        checkin_daily_rollups. Callers add their own WHERE criteria.
+        """
+        local_date = self.local_date_expression(timezones)
+        return select(
+            self.model.user_id,
+            self.model.system_id,
+            local_date.label("local_date"),
+            func.count().label("checkin_count"),
+            func.count().filter(self.model.status.in_(COMPLETED_CHECKIN_STATUSES)).label("completed_count"),
+            func.coalesce(func.sum(self.model.metric_value_logged), 0.0).label("metric_sum"),
+        ).group_by(self.model.user_id, self.model.system_id, local_date)
 
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[Checkin]:
+    async def get_daily_total_columns(
+        self,
+        db: AsyncSession,
+        *,
+        system_ids: Sequence[uuid.UUID],
+        timezones: Dict[uuid.UUID, str],
+        start: datetime,
+        end: datetime,
+    ) -> Tuple[list, list, list, list, list]:
         """
-        Remove a check-in by its ID.
+        Columnar per (system, local day) totals computed from the raw check-ins
+        on `system_ids` within [start, end): parallel lists of system ID, local
+        day, check-in count, completed count and metric sum, from one query.
+        Same shape as crud_checkin_rollup.get_daily_total_columns.
         """
-        statement = select(self.model).where(self.model.id == id)
+        if not system_ids:
+            return [], [], [], [], []
+        totals = self.select_daily_totals(timezones).where(
+            self.model.system_id.in_(system_ids),
+            self.model.checkin_timestamp_utc >= start,
+            self.model.checkin_timestamp_utc < end,
+        ).subquery()
+        statement = select(
+            totals.c.system_id, totals.c.local_date, totals.c.checkin_count,
+            totals.c.completed_count, totals.c.metric_sum,
+        )
         result = await db.execute(statement)
-        db_obj = result.scalars().first()
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
+        return tuple(list(column) for column in zip(*result.all())) or ([], [], [], [], [])
 
-checkin = CRUDCheckin(Checkin) 
\ No newline at end of file
+checkin = CRUDCheckin(Checkin)
@@ -0,0 +1,152 @@
+import uuid
+from datetime import date
+from typing import Any, Dict, List, Sequence, Tuple
+from pydantic import BaseModel
+from sqlalchemy import and_, delete, func, or_, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.engine import Row
+
+from app.crud.base import CRUDBase
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.db.models.checkin import Checkin
+from app.db.models.checkin_rollup import CheckinDailyRollup
+from app.db.unit_of_work import commit_or_flush
+
+TOTAL_COLUMNS = ("checkin_count", "completed_count", "metric_sum")
+
+# Metric sums are floats; differences below this are rounding, not drift.
+METRIC_TOLERANCE = 1e-6
+
+class CRUDCheckinRollup(CRUDBase[CheckinDailyRollup, BaseModel, BaseModel]):
+    async def apply_deltas(self, db: AsyncSession, *, deltas: Sequence[Dict[str, Any]]) -> None:
+        """
+        Add signed deltas to the rollup rows in one `INSERT ... ON CONFLICT DO
+        UPDATE`, then drop rows whose check-in count fell to zero. Each delta
+        holds user_id, system_id, local_date and the TOTAL_COLUMNS; there must
+        be at most one delta per (system_id, local_date).
+        """
+        if not deltas:
+            return
+        table = self.model.__table__
+        statement = insert(self.model).values(list(deltas))
+        statement = statement.on_conflict_do_update(
+            constraint="uq_checkin_daily_rollups_system_day",
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in TOTAL_COLUMNS
+            } | {"updated_at": func.now()},
+        )
+        await db.execute(statement)
+
+        touched = [(delta["system_id"], delta["local_date"]) for delta in deltas]
+        await db.execute(
+            delete(self.model).where(
+                tuple_(self.model.system_id, self.model.local_date).in_(touched),
+                self.model.checkin_count <= 0,
+            )
+        )
+        await commit_or_flush(db)
+
+    async def rebuild_for_users(
+        self, db: AsyncSession, *, user_ids: Sequence[uuid.UUID], timezone_name: str
+    ) -> int:
+        """
+        Replace the rollups of users who share a timezone with totals computed
+        from their raw check-ins, using one DELETE and one INSERT ... SELECT.
+        Returns the number of rollup rows written.
+        """
+        await db.execute(delete(self.model).where(self.model.user_id.in_(user_ids)))
+        totals = crud_checkin.select_daily_totals(
+            {user_id: timezone_name for user_id in user_ids}
+        ).where(Checkin.user_id.in_(user_ids)).subquery()
+        # INSERT ... SELECT evaluates the Python-side id default only once, so
+        # ids are generated by the database instead.
+        result = await db.execute(
+            insert(self.model).from_select(
+                ["id", "user_id", "system_id", "local_date", *TOTAL_COLUMNS],
+                select(func.gen_random_uuid(), *totals.c),
+            )
+        )
+        await commit_or_flush(db)
+        return result.rowcount
+
+    async def find_mismatches(
+        self, db: AsyncSession, *, user_ids: Sequence[uuid.UUID], timezone_name: str, limit: int = 100
+    ) -> List[Row]:
+        """
+        Compare the rollups of users who share a timezone against totals
+        recomputed from the raw check-ins (FULL OUTER JOIN on system and day)
+        and return up to `limit` disagreeing rows with both sides' values.
+        """
+        raw = crud_checkin.select_daily_totals(
+            {user_id: timezone_name for user_id in user_ids}
+        ).where(Checkin.user_id.in_(user_ids)).subquery("raw")
+        rollup = (
+            select(self.model)
+            .where(self.model.user_id.in_(user_ids), self.model.checkin_count > 0)
+            .subquery("rollup")
+        )
+        statement = (
+            select(
+                func.coalesce(raw.c.user_id, rollup.c.user_id).label("user_id"),
+                func.coalesce(raw.c.system_id, rollup.c.system_id).label("system_id"),
+                func.coalesce(raw.c.local_date, rollup.c.local_date).label("local_date"),
+                raw.c.checkin_count.label("raw_checkin_count"),
+                rollup.c.checkin_count.label("rollup_checkin_count"),
+                raw.c.completed_count.label("raw_completed_count"),
+                rollup.c.completed_count.label("rollup_completed_count"),
+                raw.c.metric_sum.label("raw_metric_sum"),
+                rollup.c.metric_sum.label("rollup_metric_sum"),
+            )
+            .select_from(raw)
+            .join(
+                rollup,
+                and_(raw.c.system_id == rollup.c.system_id, raw.c.local_date == rollup.c.local_date),
+                full=True,
+            )
+            .where(
+                or_(
+                    raw.c.system_id.is_(None),
+                    rollup.c.system_id.is_(None),
+                    raw.c.checkin_count != rollup.c.checkin_count,
+                    raw.c.completed_count != rollup.c.completed_count,
+                    func.abs(raw.c.metric_sum - rollup.c.metric_sum) > METRIC_TOLERANCE,
+                )
+            )
+            .limit(limit)
+        )
+        result = await db.execute(statement)
+        return result.all()
+
+    async def get_daily_total_columns(
+        self,
+        db: AsyncSession,
+        *,
+        system_ids: Sequence[uuid.UUID],
+        start_date: date,
+        end_date: date,
+    ) -> Tuple[list, list, list, list, list]:
+        """
+        Columnar per (system, local day) totals read from the rollups for
+        local days in [start_date, end_date]. Same shape as
+        crud_checkin.get_daily_total_columns.
+        """
+        if not system_ids:
+            return [], [], [], [], []
+        statement = select(
+            self.model.system_id,
+            self.model.local_date,
+            self.model.checkin_count,
+            self.model.completed_count,
+            self.model.metric_sum,
+        ).where(
+            self.model.system_id.in_(system_ids),
+            self.model.local_date >= start_date,
+            self.model.local_date <= end_date,
+        )
+        result = await db.execute(statement)
+        return tuple(list(column) for column in zip(*result.all())) or ([], [], [], [], [])
+
+checkin_rollup = CRUDCheckinRollup(CheckinDailyRollup)
@@ -1,16 +1,22 @@
 import uuid
-from typing import List, Optional, Type
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import func, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.db.models.comment import Comment
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
+from app.db.load_plans import load_plan
+from app.db.models.comment import Comment, CommentTargetType
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.comment_schemas import CommentCreate, CommentUpdate
 
-class CRUDComment:
-    def __init__(self, model: Type[Comment]):
-        self.model = model
+# Replies nested deeper than this are not loaded; their parent's
+# reply_count still shows they exist.
+MAX_THREAD_DEPTH = 8
 
+class CRUDComment(CRUDBase[Comment, CommentCreate, CommentUpdate]):
     async def create(self, db: AsyncSession, *, obj_in: CommentCreate, user_id: uuid.UUID) -> Comment:
         """
         Create a new comment.
@@ -20,69 +26,89 @@ class CRUDComment:
             user_id=user_id
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
+        await db.refresh(db_obj, attribute_names=['user'])
         return db_obj
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[Comment]:
+    async def get(
+        self, db: AsyncSession, id: uuid.UUID, *, options: Sequence[ORMOption] = ()
+    ) -> Optional[Comment]:
         """
         Get a single comment by ID, with user details loaded.
         """
-        statement = select(self.model).where(self.model.id == id).options(joinedload(self.model.user))
-        result = await db.execute(statement)
-        return result.scalars().first()
+        return await super().get(db, id, options=options or load_plan("comment.with_author"))
 
-    async def get_multi_by_goal(self, db: AsyncSession, *, goal_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Comment]:
+    async def get_thread(
+        self,
+        db: AsyncSession,
+        *,
+        target_type: CommentTargetType,
+        target_id: uuid.UUID,
+        parent_id: Optional[uuid.UUID] = None,
+        page: Optional[PageParams] = None,
+        replies_per_comment: Optional[int] = None,
+        max_depth: int = MAX_THREAD_DEPTH,
+    ) -> List[Tuple[Comment, int]]:
         """
-        Get multiple comments for a specific goal with pagination.
+        Load a comment thread on a target in one recursive CTE, as a flat list
+        of (comment, reply_count) rows to be assembled into a tree.
+
+        The thread starts from the top-level comments (or the direct replies
+        of `parent_id`), all of them or one keyset `page` in (created_at, id)
+        order, fetching one extra to detect a next page. Replies are followed
+        down to `max_depth` levels, keeping only the first
+        `replies_per_comment` replies of each comment when set. Replies are
+        ranked once, in a plain CTE over the target's comments, because
+        Postgres does not allow LIMIT or window functions in the recursive
+        term. Authors are joined in.
         """
-        statement = (
-            select(self.model)
-            .where(self.model.goal_id == goal_id)
-            .options(joinedload(self.model.user))
-            .order_by(self.model.created_at.asc())
-            .offset(skip)
-            .limit(limit)
+        on_target = (self.model.target_type == target_type, self.model.target_id == target_id)
+        ranked = (
+            select(
+                self.model.id,
+                self.model.parent_comment_id,
+                self.model.created_at,
+                func.row_number().over(
+                    partition_by=self.model.parent_comment_id,
+                    order_by=(self.model.created_at, self.model.id),
+                ).label("reply_rank"),
+            )
+            .where(*on_target)
+            .cte("ranked")
         )
-        result = await db.execute(statement)
-        return result.scalars().all()
 
-    async def get_multi_by_checkin(self, db: AsyncSession, *, checkin_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Comment]:
-        """
-        Get multiple comments for a specific checkin with pagination.
-        """
-        statement = (
-            select(self.model)
-            .where(self.model.checkin_id == checkin_id)
-            .options(joinedload(self.model.user))
-            .order_by(self.model.created_at.asc())
-            .offset(skip)
-            .limit(limit)
+        anchor = select(ranked.c.id).where(
+            ranked.c.parent_comment_id.is_(None) if parent_id is None else ranked.c.parent_comment_id == parent_id
         )
-        result = await db.execute(statement)
-        return result.scalars().all()
+        if page is not None:
+            if page.after is not None:
+                anchor = anchor.where(tuple_(ranked.c.created_at, ranked.c.id) > tuple_(*page.after))
+            anchor = anchor.order_by(ranked.c.created_at, ranked.c.id).limit(page.limit + 1)
+        anchor = anchor.subquery("anchor")
 
-    async def update(self, db: AsyncSession, *, db_obj: Comment, obj_in: CommentUpdate) -> Comment:
-        """
-        Update an existing comment.
-        """
-        update_data = obj_in.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        thread = select(anchor.c.id, literal(0).label("depth")).cte("thread", recursive=True)
+        replies = (
+            select(ranked.c.id, thread.c.depth + 1)
+            .join(thread, ranked.c.parent_comment_id == thread.c.id)
+            .where(thread.c.depth < max_depth)
+        )
+        if replies_per_comment is not None:
+            replies = replies.where(ranked.c.reply_rank <= replies_per_comment)
+        thread = thread.union_all(replies)
 
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[Comment]:
-        """
-        Remove a comment by its ID.
-        """
-        db_obj = await self.get(db, id=id)
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
+        reply_counts = (
+            select(self.model.parent_comment_id, func.count().label("reply_count"))
+            .where(*on_target, self.model.parent_comment_id.is_not(None))
+            .group_by(self.model.parent_comment_id)
+            .subquery("reply_counts")
+        )
+        statement = (
+            select(self.model, func.coalesce(reply_counts.c.reply_count, 0))
+            .join(thread, self.model.id == thread.c.id)
+            .outerjoin(reply_counts, reply_counts.c.parent_comment_id == self.model.id)
+            .options(*load_plan("comment.with_author"))
+        )
+        result = await db.execute(statement)
+        return [(comment, reply_count) for comment, reply_count in result.all()]
 
-comment = CRUDComment(Comment) 
\ No newline at end of file
+comment = CRUDComment(Comment)
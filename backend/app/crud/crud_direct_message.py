@@ -1,67 +1,89 @@
 import uuid
-from typing import List, Optional, Type
+from typing import Any, Dict
+from pydantic import BaseModel
+from sqlalchemy import func, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Select
 
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
+from app.db.load_plans import load_plan
 from app.db.models.direct_message import DirectMessage
-from app.db.models.reaction import Reaction # Import Reaction for relationship loading
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.direct_message_schemas import DirectMessageCreate
 
-class CRUDDirectMessage:
-    def __init__(self, model: Type[DirectMessage]):
-        self.model = model
-
+class CRUDDirectMessage(CRUDBase[DirectMessage, DirectMessageCreate, BaseModel]):
     async def create(self, db: AsyncSession, *, obj_in: DirectMessageCreate, sender_id: uuid.UUID) -> DirectMessage:
         """
-        Create a new direct message.
+        Create a new direct message. A new message has no reactions, so the
+        collection is set empty instead of being loaded.
         """
         db_obj = self.model(
             **obj_in.dict(),
             sender_id=sender_id
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
+        set_committed_value(db_obj, "reactions", [])
         return db_obj
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[DirectMessage]:
+    def select_sent_by(self, *, partnership_id: uuid.UUID, sender_id: uuid.UUID) -> Select:
         """
-        Get a single direct message by its ID.
+        Messages the user sent within a partnership.
         """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        return result.scalars().first()
+        return select(self.model).where(
+            self.model.partnership_id == partnership_id,
+            self.model.sender_id == sender_id,
+        )
 
     async def get_multi_by_partnership(
-        self, db: AsyncSession, *, partnership_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[DirectMessage]:
+        self, db: AsyncSession, *, partnership_id: uuid.UUID, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Get the message history for a specific partnership, ordered from oldest to newest.
+        Get one keyset page of a partnership's messages, latest first: the
+        newest `page.limit` messages sent before the cursor. Backed by the
+        (partnership_id, sent_at_utc desc, id desc) index, so opening a long
+        conversation costs the same as a new one.
         Eagerly loads reactions and the reaction authors to prevent N+1 queries.
         """
         statement = (
             select(self.model)
             .where(self.model.partnership_id == partnership_id)
-            .options(
-                selectinload(self.model.reactions).joinedload(Reaction.user)
-            )
-            .order_by(self.model.created_at.asc()) # Ascending for chat history
-            .offset(skip)
-            .limit(limit)
+            .options(*load_plan("direct_message.with_reactions"))
         )
-        result = await db.execute(statement)
-        return result.scalars().unique().all()
-    
-    async def mark_as_read(self, db: AsyncSession, *, message: DirectMessage) -> DirectMessage:
+        return await self.get_page(db, statement, page=page, sort_column=self.model.sent_at_utc)
+
+    async def mark_read_up_to(
+        self, db: AsyncSession, *, partnership_id: uuid.UUID, reader_id: uuid.UUID, message_id: uuid.UUID
+    ) -> int:
         """
-        Mark a message as read.
+        Mark every unread message the reader received in the partnership, up to
+        and including `message_id`, as read with a single UPDATE. The bound is
+        looked up inside the statement, and only from this partnership, so an
+        unknown or foreign message marks nothing. Returns the number of
+        messages marked.
         """
-        message.is_read = True
-        db.add(message)
-        await db.commit()
-        await db.refresh(message)
-        return message
-
+        bound = aliased(self.model)
+        up_to = (
+            select(bound.sent_at_utc, bound.id)
+            .where(bound.id == message_id, bound.partnership_id == partnership_id)
+            .scalar_subquery()
+        )
+        statement = (
+            update(self.model)
+            .where(
+                self.model.partnership_id == partnership_id,
+                self.model.sender_id != reader_id,
+                self.model.read_at_utc.is_(None),
+                tuple_(self.model.sent_at_utc, self.model.id) <= up_to,
+            )
+            .values(read_at_utc=func.now())
+        )
+        result = await db.execute(statement)
+        await commit_or_flush(db)
+        return result.rowcount
 
 direct_message = CRUDDirectMessage(DirectMessage) 
\ No newline at end of file
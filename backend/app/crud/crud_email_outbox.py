@@ -0,0 +1,64 @@
+from datetime import timedelta
+from typing import List
+from pydantic import BaseModel
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.crud.base import CRUDBase
+from app.db.models.email_outbox import EmailOutbox, EmailStatus
+from app.db.unit_of_work import commit_or_flush
+
+class CRUDEmailOutbox(CRUDBase[EmailOutbox, BaseModel, BaseModel]):
+    async def claim_due(
+        self, db: AsyncSession, *, limit: int, lease_seconds: int, max_attempts: int
+    ) -> List[EmailOutbox]:
+        """
+        Claim up to `limit` pending messages that are due, oldest first, in a
+        single statement:
+
+            UPDATE email_outbox SET attempts = attempts + 1, next_attempt_at = now() + lease
+            WHERE id IN (SELECT id ... FOR UPDATE SKIP LOCKED) RETURNING *
+
+        SKIP LOCKED lets several senders claim disjoint batches, and pushing
+        `next_attempt_at` past the lease keeps a claimed message from being
+        picked up again unless its sender dies before settling it. Messages
+        that have used up `max_attempts` that way are marked failed first
+        instead of being claimed again.
+        """
+        await db.execute(
+            update(self.model)
+            .where(
+                self.model.status == EmailStatus.PENDING,
+                self.model.next_attempt_at <= func.now(),
+                self.model.attempts >= max_attempts,
+            )
+            .values(status=EmailStatus.FAILED, last_error="Gave up: not settled after the last attempt.")
+            .execution_options(synchronize_session=False)
+        )
+        due = (
+            select(self.model.id)
+            .where(
+                self.model.status == EmailStatus.PENDING,
+                self.model.next_attempt_at <= func.now(),
+                self.model.attempts < max_attempts,
+            )
+            .order_by(self.model.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(self.model)
+            .where(self.model.id.in_(due))
+            .values(
+                attempts=self.model.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(self.model)
+        )
+        result = await db.execute(statement, execution_options={"synchronize_session": False})
+        claimed = list(result.scalars().all())
+        await commit_or_flush(db)
+        return claimed
+
+email_outbox = CRUDEmailOutbox(EmailOutbox)
@@ -1,14 +1,21 @@
 import uuid
-from typing import List, Optional, Type
+from typing import Any, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import Select
 
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
 from app.db.models.goal import Goal
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.goal_schemas import GoalCreate, GoalUpdate
 
-class CRUDGoal:
-    def __init__(self, model: Type[Goal]):
-        self.model = model
+class CRUDGoal(CRUDBase[Goal, GoalCreate, GoalUpdate]):
+    def select_owned(self, user_id: uuid.UUID) -> Select:
+        """
+        Goals owned by the user.
+        """
+        return select(self.model).where(self.model.user_id == user_id)
 
     async def create_with_owner(
         self, db: AsyncSession, *, obj_in: GoalCreate, user_id: uuid.UUID
@@ -18,60 +25,15 @@ class CRUDGoal:
         """
         db_obj = self.model(**obj_in.dict(), user_id=user_id)
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
         return db_obj
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[Goal]:
-        """
-        Get a single goal by its ID.
-        """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        return result.scalars().first()
-
     async def get_multi_by_owner(
-        self, db: AsyncSession, *, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[Goal]:
-        """
-        Get multiple goals for a specific user with pagination.
+        self, db: AsyncSession, *, user_id: uuid.UUID, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        statement = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(self.model.created_at.desc())
-        )
-        result = await db.execute(statement)
-        return result.scalars().all()
-
-    async def update(
-        self, db: AsyncSession, *, db_obj: Goal, obj_in: GoalUpdate
-    ) -> Goal:
+        Get one keyset page of goals for a specific user, newest first.
         """
-        Update an existing goal.
-        """
-        update_data = obj_in.dict(exclude_unset=True)
-        for field in update_data:
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, update_data[field])
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
-
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[Goal]:
-        """
-        Remove a goal by its ID.
-        """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        db_obj = result.scalars().first()
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
+        return await self.get_page(db, self.select_owned(user_id), page=page)
 
-goal = CRUDGoal(Goal) 
\ No newline at end of file
+goal = CRUDGoal(Goal)
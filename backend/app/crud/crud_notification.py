@@ -0,0 +1,125 @@
+import uuid
+from typing import Any, Dict, Mapping, Optional, Tuple
+from pydantic import BaseModel
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.selectable import CTE
+
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
+from app.db.models.notification import Notification, NotificationCounter
+from app.db.unit_of_work import commit_or_flush
+from app.schemas.notification_schemas import NotificationCreate
+
+class CRUDNotification(CRUDBase[Notification, NotificationCreate, BaseModel]):
+    def select_owned(self, user_id: uuid.UUID) -> Select:
+        """
+        Notifications addressed to the user.
+        """
+        return select(self.model).where(self.model.recipient_id == user_id)
+
+    async def get_multi_by_recipient(
+        self,
+        db: AsyncSession,
+        *,
+        recipient_id: uuid.UUID,
+        unread_only: bool = False,
+        page: PageParams = PageParams(),
+    ) -> Dict[str, Any]:
+        """
+        Get one keyset page of a user's notifications, newest first.
+        """
+        statement = self.select_owned(recipient_id)
+        if unread_only:
+            statement = statement.where(self.model.is_read.is_(False))
+        return await self.get_page(db, statement, page=page)
+
+    def _mark_read(self, recipient_id: uuid.UUID, *criteria) -> Tuple[CTE, CTE]:
+        """
+        A single statement that marks the recipient's matching unread
+        notifications as read and takes them off the unread counter:
+
+            WITH marked AS (UPDATE notifications ... RETURNING *),
+                 counter AS (UPDATE notification_counters
+                             SET unread_count = greatest(unread_count - (SELECT count(*) FROM marked), 0) ...)
+            SELECT ... FROM marked
+
+        Both updates see the same snapshot, so the counter moves by exactly
+        the number of rows this statement changed.
+        """
+        marked = (
+            update(self.model)
+            .where(self.model.recipient_id == recipient_id, self.model.is_read.is_(False), *criteria)
+            .values(is_read=True, read_at_utc=func.now())
+            .returning(*self.model.__table__.c)
+            .cte("marked")
+        )
+        marked_count = select(func.count()).select_from(marked).scalar_subquery()
+        counter = (
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == recipient_id)
+            .values(unread_count=func.greatest(NotificationCounter.unread_count - marked_count, 0))
+            .returning(NotificationCounter.user_id)
+            .cte("counter")
+        )
+        return marked, counter
+
+    async def mark_read(
+        self, db: AsyncSession, *, id: uuid.UUID, recipient_id: uuid.UUID
+    ) -> Optional[Notification]:
+        """
+        Mark one unread notification as read. Returns the updated row, or None
+        when there was nothing to change (missing, not the recipient's, or
+        already read).
+        """
+        marked, counter = self._mark_read(recipient_id, self.model.id == id)
+        statement = select(aliased(self.model, marked)).add_cte(counter)
+        result = await db.execute(statement)
+        notification = result.scalars().first()
+        await commit_or_flush(db)
+        return notification
+
+    async def mark_all_read(self, db: AsyncSession, *, recipient_id: uuid.UUID) -> int:
+        """
+        Mark every unread notification of the user as read in one statement
+        and return how many changed.
+        """
+        marked, counter = self._mark_read(recipient_id)
+        statement = select(func.count()).select_from(marked).add_cte(counter)
+        result = await db.execute(statement)
+        await commit_or_flush(db)
+        return result.scalar_one()
+
+class CRUDNotificationCounter(CRUDBase[NotificationCounter, BaseModel, BaseModel]):
+    async def get_unread_count(self, db: AsyncSession, *, user_id: uuid.UUID) -> int:
+        statement = select(self.model.unread_count).where(self.model.user_id == user_id)
+        result = await db.execute(statement)
+        return result.scalar() or 0
+
+    async def increment_many(self, db: AsyncSession, *, counts: Mapping[uuid.UUID, int]) -> None:
+        """
+        Add to several users' unread counters in one `INSERT ... ON CONFLICT
+        DO UPDATE`. Rows are written in user ID order so concurrent fan-outs
+        lock counters in the same order and cannot deadlock.
+        """
+        if not counts:
+            return
+        statement = insert(self.model).values(
+            [{"user_id": user_id, "unread_count": counts[user_id]} for user_id in sorted(counts)]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "unread_count": self.model.unread_count + statement.excluded.unread_count,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(statement)
+        await commit_or_flush(db)
+
+notification = CRUDNotification(Notification)
+notification_counter = CRUDNotificationCounter(NotificationCounter)
@@ -1,18 +1,19 @@
 import uuid
-from typing import List, Optional, Type
+from typing import List, Optional, Sequence
 from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import ORMOption
 from datetime import datetime
 
+from app.crud.base import CRUDBase
+from app.db.load_plans import load_plan
 from app.db.models.partnership import Partnership, PartnershipStatus
+from app.db.models.user import User as UserModel
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.partnership_schemas import PartnershipCreate, PartnershipUpdate
 
-class CRUDPartnership:
-    def __init__(self, model: Type[Partnership]):
-        self.model = model
-
+class CRUDPartnership(CRUDBase[Partnership, PartnershipCreate, PartnershipUpdate]):
     async def create(
         self, 
         db: AsyncSession, 
@@ -25,7 +26,7 @@ class CRUDPartnership:
         """
         Create a new partnership request.
         """
-        db_obj = self.model.model_construct(
+        db_obj = self.model(
             user1_id=requester_id,
             invite_email=obj_in.invite_email,
             status=PartnershipStatus.PENDING_INVITE,
@@ -33,21 +34,16 @@ class CRUDPartnership:
             invite_token_expires_at=invite_token_expires_at
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
         return db_obj
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[Partnership]:
+    async def get(
+        self, db: AsyncSession, id: uuid.UUID, *, options: Sequence[ORMOption] = ()
+    ) -> Optional[Partnership]:
         """
         Get a single partnership by its ID, with user details loaded.
         """
-        statement = (
-            select(self.model)
-            .where(self.model.id == id)
-            .options(joinedload(self.model.requester), joinedload(self.model.approver))
-        )
-        result = await db.execute(statement)
-        return result.scalars().first()
+        return await super().get(db, id, options=options or load_plan("partnership.with_users"))
 
     async def get_by_users(self, db: AsyncSession, *, user1_id: uuid.UUID, user2_id: uuid.UUID) -> Optional[Partnership]:
         """
@@ -74,7 +70,7 @@ class CRUDPartnership:
         statement = (
             select(self.model)
             .where(self.model.invite_email == user.email, self.model.status == PartnershipStatus.PENDING_INVITE)
-            .options(joinedload(self.model.user1))
+            .options(*load_plan("partnership.with_requester"))
             .order_by(self.model.created_at.desc())
         )
         result = await db.execute(statement)
@@ -90,7 +86,7 @@ class CRUDPartnership:
                 (or_(self.model.user1_id == user_id, self.model.user2_id == user_id)),
                 self.model.status == PartnershipStatus.ACTIVE
             )
-            .options(joinedload(self.model.user1), joinedload(self.model.user2))
+            .options(*load_plan("partnership.with_users"))
         )
         result = await db.execute(statement)
         return result.scalars().first()
@@ -103,27 +99,4 @@ class CRUDPartnership:
         result = await db.execute(statement)
         return result.scalars().first()
 
-    async def update(self, db: AsyncSession, *, db_obj: Partnership, obj_in: PartnershipUpdate) -> Partnership:
-        """
-        Update a partnership (e.g., to change status).
-        """
-        update_data = obj_in.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
-
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[Partnership]:
-        """
-        Remove a partnership by its ID.
-        """
-        db_obj = await self.get(db, id=id)
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
-
 partnership = CRUDPartnership(Partnership)
@@ -1,26 +1,30 @@
 import uuid
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Sequence, Tuple
+from pydantic import BaseModel
+from sqlalchemy import func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
 
-from app.db.models.reaction import Reaction
+from app.crud.base import CRUDBase
+from app.db.load_plans import load_plan
+from app.db.models.reaction import Reaction, ReactionTargetType
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.reaction_schemas import ReactionCreate
 
-class CRUDReaction:
-    def __init__(self, model: Type[Reaction]):
-        self.model = model
-
+class CRUDReaction(CRUDBase[Reaction, ReactionCreate, BaseModel]):
     async def create(self, db: AsyncSession, *, obj_in: ReactionCreate, user_id: uuid.UUID) -> Reaction:
         """
-        Create a new reaction for a message by a user.
+        Create a new reaction on a direct message by a user.
         """
         db_obj = self.model(
-            **obj_in.dict(),
+            emoji=obj_in.emoji,
+            target_type=ReactionTargetType.DIRECT_MESSAGE,
+            target_id=obj_in.message_id,
+            direct_message_id=obj_in.message_id,
             user_id=user_id
         )
         db.add(db_obj)
-        await db.commit()
+        await commit_or_flush(db)
         await db.refresh(db_obj, attribute_names=['user'])
         return db_obj
 
@@ -31,9 +35,10 @@ class CRUDReaction:
         """
         statement = select(self.model).where(
             self.model.user_id == user_id,
-            self.model.message_id == message_id,
+            self.model.target_type == ReactionTargetType.DIRECT_MESSAGE,
+            self.model.target_id == message_id,
             self.model.emoji == emoji
-        ).options(joinedload(self.model.user))
+        ).options(*load_plan("reaction.with_author"))
         result = await db.execute(statement)
         return result.scalars().first()
     
@@ -45,24 +50,39 @@ class CRUDReaction:
         """
         statement = (
             select(self.model)
-            .where(self.model.message_id == message_id)
-            .options(joinedload(self.model.user))
+            .where(self.model.direct_message_id == message_id)
+            .options(*load_plan("reaction.with_author"))
             .offset(skip)
             .limit(limit)
         )
         result = await db.execute(statement)
         return result.scalars().all()
 
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[Reaction]:
+    async def get_reactors_by_target(
+        self, db: AsyncSession, *, targets: Sequence[Tuple[ReactionTargetType, uuid.UUID]]
+    ) -> Dict[Tuple[ReactionTargetType, uuid.UUID], Dict[str, List[uuid.UUID]]]:
         """
-        Remove a reaction by its ID.
+        For many (target_type, target_id) pairs at once, who reacted with
+        which emoji, from a single GROUP BY query. Each user reacts with an
+        emoji at most once per target, so the number of reactors is the count.
+        Targets without reactions are absent from the result.
         """
-        statement = select(self.model).where(self.model.id == id)
+        if not targets:
+            return {}
+        statement = (
+            select(
+                self.model.target_type,
+                self.model.target_id,
+                self.model.emoji,
+                func.array_agg(self.model.user_id),
+            )
+            .where(tuple_(self.model.target_type, self.model.target_id).in_(list(targets)))
+            .group_by(self.model.target_type, self.model.target_id, self.model.emoji)
+        )
         result = await db.execute(statement)
-        db_obj = result.scalars().first()
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
+        reactors: Dict[Tuple[ReactionTargetType, uuid.UUID], Dict[str, List[uuid.UUID]]] = {}
+        for target_type, target_id, emoji, user_ids in result.all():
+            reactors.setdefault((target_type, target_id), {})[emoji] = user_ids
+        return reactors
 
-reaction = CRUDReaction(Reaction) 
\ No newline at end of file
+reaction = CRUDReaction(Reaction)
@@ -0,0 +1,72 @@
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.crud.base import CRUDBase
+from app.db.models.streak import SystemStreak, UserStreak
+from app.db.unit_of_work import commit_or_flush
+
+StreakModel = Union[UserStreak, SystemStreak]
+
+STREAK_FIELDS = ("current_streak", "longest_streak", "current_streak_start_date", "last_completed_date")
+
+class CRUDStreak(CRUDBase[StreakModel, BaseModel, BaseModel]):
+    """
+    Streak rows are keyed by their owner (`user_id` for user streaks,
+    `system_id` for system streaks) rather than by their own ID.
+    """
+    def __init__(self, model: Type[StreakModel], *, key: str):
+        super().__init__(model)
+        self.key = key
+        self.key_column = getattr(model, key)
+
+    async def get_by_key(self, db: AsyncSession, *, key: uuid.UUID) -> Optional[StreakModel]:
+        statement = select(self.model).where(self.key_column == key)
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    async def get_many_by_key(self, db: AsyncSession, *, keys: Sequence[uuid.UUID]) -> List[StreakModel]:
+        if not keys:
+            return []
+        statement = select(self.model).where(self.key_column.in_(keys))
+        result = await db.execute(statement)
+        return result.scalars().all()
+
+    async def get_for_update(
+        self, db: AsyncSession, *, key: uuid.UUID, values: Dict[str, Any]
+    ) -> StreakModel:
+        """
+        Get the streak row locked with SELECT ... FOR UPDATE, creating an empty
+        one first if needed, so concurrent check-ins for the same owner apply
+        their increments one after another. `values` supplies the other
+        required columns for a new row (e.g. `user_id` of a system streak).
+        """
+        await db.execute(
+            insert(self.model)
+            .values(**{self.key: key}, **values)
+            .on_conflict_do_nothing(index_elements=[self.key])
+        )
+        statement = select(self.model).where(self.key_column == key).with_for_update()
+        result = await db.execute(statement.execution_options(populate_existing=True))
+        return result.scalars().one()
+
+    async def upsert_many(self, db: AsyncSession, *, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Insert or overwrite streak rows in one `INSERT ... ON CONFLICT DO UPDATE`.
+        Each row holds the key, any other required columns and the STREAK_FIELDS.
+        """
+        if not rows:
+            return
+        statement = insert(self.model).values(list(rows))
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.key],
+            set_={field: statement.excluded[field] for field in STREAK_FIELDS},
+        )
+        await db.execute(statement)
+        await commit_or_flush(db)
+
+user_streak = CRUDStreak(UserStreak, key="user_id")
+system_streak = CRUDStreak(SystemStreak, key="system_id")
@@ -1,74 +1,127 @@
 import uuid
-from typing import List, Optional, Type
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import Row, or_, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import Select
 
-from app.db.models.system import System
+from app.core.pagination import PageParams
+from app.crud.base import CRUDBase
+from app.db.models.checkin import Checkin
+from app.db.models.goal import Goal
+from app.db.models.streak import SystemStreak
+from app.db.models.system import System, SystemFrequency, SystemStatus
 from app.schemas.system_schemas import SystemCreate, SystemUpdate
 
-class CRUDSystem:
-    def __init__(self, model: Type[System]):
-        self.model = model
-
-    async def create(self, db: AsyncSession, *, obj_in: SystemCreate) -> System:
+class CRUDSystem(CRUDBase[System, SystemCreate, SystemUpdate]):
+    def select_owned(self, user_id: uuid.UUID) -> Select:
         """
-        Create a new system.
+        Systems whose parent goal is owned by the user.
         """
-        db_obj = self.model(**obj_in.dict())
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        return (
+            select(self.model)
+            .join(Goal, Goal.id == self.model.goal_id)
+            .where(Goal.user_id == user_id)
+        )
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[System]:
+    async def get_multi_by_goal(
+        self, db: AsyncSession, *, goal_id: uuid.UUID, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Get a single system by its ID.
+        Get one keyset page of systems for a specific goal, newest first.
         """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        return result.scalars().first()
+        statement = select(self.model).where(self.model.goal_id == goal_id)
+        return await self.get_page(db, statement, page=page)
 
-    async def get_multi_by_goal(
-        self, db: AsyncSession, *, goal_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[System]:
+    async def get_due_on_day_with_latest_checkin(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        weekday: str,
+        day_start: datetime,
+        day_end: datetime,
+    ) -> List[Row]:
         """
-        Get multiple systems for a specific goal with pagination.
+        The user's active systems scheduled for a day, each with the status and
+        notes of its latest check-in inside [day_start, day_end) and its stored
+        streak, in one query.
+        Daily systems are always due; weekly systems are due when
+        `frequency_details["days"]` lists the weekday (or lists no days at all).
         """
+        latest_checkin = (
+            select(Checkin.status, Checkin.notes)
+            .where(
+                Checkin.system_id == self.model.id,
+                Checkin.checkin_timestamp_utc >= day_start,
+                Checkin.checkin_timestamp_utc < day_end,
+            )
+            .order_by(Checkin.checkin_timestamp_utc.desc())
+            .limit(1)
+            .lateral("latest_checkin")
+        )
         statement = (
-            select(self.model)
-            .where(self.model.goal_id == goal_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(self.model.created_at.desc())
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                self.model.target_time_local,
+                latest_checkin.c.status.label("checkin_status"),
+                latest_checkin.c.notes.label("checkin_notes"),
+                SystemStreak.current_streak,
+                SystemStreak.last_completed_date,
+            )
+            .outerjoin(latest_checkin, true())
+            .outerjoin(SystemStreak, SystemStreak.system_id == self.model.id)
+            .where(
+                self.model.user_id == user_id,
+                self.model.status == SystemStatus.ACTIVE,
+                or_(
+                    self.model.frequency == SystemFrequency.DAILY,
+                    self.model.frequency_details.is_(None),
+                    ~self.model.frequency_details.has_key("days"),
+                    self.model.frequency_details["days"].has_key(weekday),
+                ),
+            )
+            .order_by(self.model.target_time_local.asc().nulls_last(), self.model.title)
         )
         result = await db.execute(statement)
-        return result.scalars().all()
-
-    async def update(
-        self, db: AsyncSession, *, db_obj: System, obj_in: SystemUpdate
-    ) -> System:
-        """
-        Update an existing system.
-        """
-        update_data = obj_in.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        return result.all()
 
-    async def remove(self, db: AsyncSession, *, id: uuid.UUID) -> Optional[System]:
+    async def get_active_for_users(
+        self,
+        db: AsyncSession,
+        *,
+        user_ids: Sequence[uuid.UUID],
+        goal_id: Optional[uuid.UUID] = None,
+        goal_owner_id: Optional[uuid.UUID] = None,
+    ) -> List[Row]:
         """
-        Remove a system by its ID.
+        The scheduling columns of the active systems of one or more users, in
+        one query. With `goal_id`, `goal_owner_id`'s systems are limited to that
+        goal while other users' systems are all returned.
         """
-        statement = select(self.model).where(self.model.id == id)
+        statement = (
+            select(
+                self.model.id,
+                self.model.user_id,
+                self.model.title,
+                self.model.frequency,
+                self.model.frequency_details,
+                self.model.created_at,
+            )
+            .where(
+                self.model.user_id.in_(user_ids),
+                self.model.status == SystemStatus.ACTIVE,
+            )
+            .order_by(self.model.created_at, self.model.id)
+        )
+        if goal_id is not None:
+            statement = statement.where(
+                or_(self.model.user_id != goal_owner_id, self.model.goal_id == goal_id)
+            )
         result = await db.execute(statement)
-        db_obj = result.scalars().first()
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-        return db_obj
+        return result.all()
 
-system = CRUDSystem(System) 
\ No newline at end of file
+system = CRUDSystem(System)
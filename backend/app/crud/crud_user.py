@@ -1,23 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Type, Any, Dict
+from typing import Optional
+from sqlalchemy import Row
 import uuid
 
+from app.crud.base import CRUDBase
 from app.db.models.user import User
+from app.db.unit_of_work import commit_or_flush
 from app.schemas.user_schemas import UserCreate, UserUpdate
 
-class CRUDUser:
-    def __init__(self, model: Type[User]):
-        self.model = model
-
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[User]:
-        """
-        Get a user by ID.
-        """
-        statement = select(self.model).where(self.model.id == id)
-        result = await db.execute(statement)
-        return result.scalars().first()
-
+class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
         """
         Get a user by email.
@@ -34,6 +26,22 @@ class CRUDUser:
         result = await db.execute(statement)
         return result.scalars().first()
 
+    async def get_partner_summary(
+        self, db: AsyncSession, *, user_id: uuid.UUID, partnership_id: uuid.UUID
+    ) -> Optional[Row]:
+        """
+        The (id, username, name, timezone) of the other member of a partnership,
+        without loading the partnership itself.
+        """
+        statement = select(
+            self.model.id, self.model.username, self.model.name, self.model.timezone
+        ).where(
+            self.model.current_partnership_id == partnership_id,
+            self.model.id != user_id,
+        )
+        result = await db.execute(statement)
+        return result.first()
+
     async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """
         Create a new user profile.
@@ -42,32 +50,7 @@ class CRUDUser:
         """
         db_obj = self.model(**obj_in.dict())
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
-
-    async def update(
-        self, 
-        db: AsyncSession, 
-        *, 
-        db_obj: User, 
-        obj_in: UserUpdate | Dict[str, Any]
-    ) -> User:
-        """
-        Update a user's profile.
-        """
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        
-        for field in update_data:
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, update_data[field])
-        
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
         return db_obj
 
     async def create_with_id(
@@ -82,8 +65,7 @@ class CRUDUser:
             **obj_in.dict()
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await commit_or_flush(db)
         return db_obj
 
 user = CRUDUser(User) 
\ No newline at end of file
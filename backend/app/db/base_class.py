@@ -1,5 +1,10 @@
 from sqlalchemy.ext.declarative import declarative_base
 
+class _EagerDefaultsBase:
+    # Fetch server-generated columns (created_at, updated_at, ...) with
+    # RETURNING on INSERT/UPDATE instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
 # All ORM models will inherit from this class.
 # It allows SQLAlchemy to map the models to database tables.
-Base = declarative_base() 
\ No newline at end of file
+Base = declarative_base(cls=_EagerDefaultsBase)
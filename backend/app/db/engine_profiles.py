@@ -0,0 +1,132 @@
+import dataclasses
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.core.config import Settings
+from app.db.pool import InstrumentedAsyncQueuePool
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    Connection settings for one deployment mode. Selected with
+    `DB_ENGINE_PROFILE`; individual values can be overridden with the
+    matching `DB_*` settings.
+    """
+    name: str
+    echo: bool
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_timeout: float
+    pool_pre_ping: bool
+    # asyncpg's own statement cache and SQLAlchemy's prepared statement cache.
+    statement_cache_size: int
+    prepared_statement_cache_size: int
+    # Name every prepared statement uniquely so a transaction-mode pooler that
+    # hands us a different server connection never sees a name clash.
+    unique_statement_names: bool
+    connect_timeout: float
+    command_timeout: Optional[float]
+
+ENGINE_PROFILES: Dict[str, EngineProfile] = {
+    # Local development: SQL logging on, small pool. Prepared statements stay
+    # off because the default .env points at the Supabase transaction pooler.
+    "dev": EngineProfile(
+        name="dev",
+        echo=True,
+        pool_size=5,
+        max_overflow=5,
+        pool_recycle=1800,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        unique_statement_names=True,
+        connect_timeout=10,
+        command_timeout=None,
+    ),
+    # Behind PgBouncer / Supavisor in transaction mode: server connections are
+    # shared between clients, so statement caches must be disabled. Connections
+    # are recycled quickly since the pooler owns the real sessions.
+    "pgbouncer-transaction": EngineProfile(
+        name="pgbouncer-transaction",
+        echo=False,
+        pool_size=10,
+        max_overflow=10,
+        pool_recycle=300,
+        pool_timeout=10,
+        pool_pre_ping=False,
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        unique_statement_names=True,
+        connect_timeout=5,
+        command_timeout=30,
+    ),
+    # Direct session-mode connection to the primary: prepared statements are
+    # safe and save a parse/plan on every repeated query.
+    "direct-primary": EngineProfile(
+        name="direct-primary",
+        echo=False,
+        pool_size=20,
+        max_overflow=10,
+        pool_recycle=1800,
+        pool_timeout=10,
+        pool_pre_ping=True,
+        statement_cache_size=512,
+        prepared_statement_cache_size=512,
+        unique_statement_names=False,
+        connect_timeout=5,
+        command_timeout=30,
+    ),
+}
+
+def resolve_engine_profile(settings: Settings) -> EngineProfile:
+    """
+    Look up the configured profile and apply any explicit overrides.
+    """
+    try:
+        profile = ENGINE_PROFILES[settings.DB_ENGINE_PROFILE]
+    except KeyError:
+        raise ValueError(
+            f"Unknown DB_ENGINE_PROFILE '{settings.DB_ENGINE_PROFILE}'. "
+            f"Expected one of: {', '.join(ENGINE_PROFILES)}."
+        ) from None
+
+    overrides = {
+        "echo": settings.DB_ECHO,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS,
+    }
+    return dataclasses.replace(profile, **{k: v for k, v in overrides.items() if v is not None})
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+def build_engine_kwargs(profile: EngineProfile) -> Dict[str, Any]:
+    """
+    Translate a profile into `create_async_engine` keyword arguments.
+    """
+    connect_args: Dict[str, Any] = {
+        "statement_cache_size": profile.statement_cache_size,
+        "prepared_statement_cache_size": profile.prepared_statement_cache_size,
+        "timeout": profile.connect_timeout,
+    }
+    if profile.unique_statement_names:
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+    if profile.command_timeout is not None:
+        connect_args["command_timeout"] = profile.command_timeout
+
+    return {
+        "echo": profile.echo,
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": profile.pool_size,
+        "max_overflow": profile.max_overflow,
+        "pool_recycle": profile.pool_recycle,
+        "pool_timeout": profile.pool_timeout,
+        "pool_pre_ping": profile.pool_pre_ping,
+        "connect_args": connect_args,
+    }
@@ -0,0 +1,79 @@
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.db.models.checkin import Checkin
+from app.db.models.comment import Comment
+from app.db.models.direct_message import DirectMessage
+from app.db.models.goal import Goal
+from app.db.models.partnership import Partnership
+from app.db.models.reaction import Reaction
+from app.db.models.system import System
+from app.db.models.user import User
+
+class LoadPlanRegistry:
+    """
+    Named sets of relationship loader options.
+
+    Every relationship on the models is declared `lazy="raise"` (collections) or
+    `lazy="raise_on_sql"` (many-to-one), so nothing is loaded unless a query asks
+    for it. CRUD methods and services pick a plan by name instead of repeating
+    `selectinload`/`joinedload` chains, which keeps the eager loading for each
+    endpoint visible in one place.
+    """
+    def __init__(self):
+        self._plans: Dict[str, Callable[[], Tuple[ORMOption, ...]]] = {}
+
+    def register(self, name: str, factory: Callable[[], Sequence[ORMOption]]) -> None:
+        if name in self._plans:
+            raise ValueError(f"Load plan '{name}' is already registered.")
+        self._plans[name] = lambda: tuple(factory())
+
+    def get(self, *names: str) -> List[ORMOption]:
+        """
+        Return the combined loader options for one or more plans.
+        """
+        options: List[ORMOption] = []
+        for name in names:
+            try:
+                options.extend(self._plans[name]())
+            except KeyError:
+                raise KeyError(f"Unknown load plan '{name}'.") from None
+        return options
+
+    def names(self) -> List[str]:
+        return sorted(self._plans)
+
+load_plans = LoadPlanRegistry()
+
+def load_plan(*names: str) -> List[ORMOption]:
+    """
+    Shortcut for `load_plans.get(...)`, meant to be passed to `.options(*...)`.
+    """
+    return load_plans.get(*names)
+
+# --- Users ---
+load_plans.register("user.with_current_partnership", lambda: [joinedload(User.current_partnership)])
+
+# --- Goals & Systems ---
+load_plans.register("goal.with_systems", lambda: [selectinload(Goal.systems)])
+load_plans.register("system.with_goal", lambda: [joinedload(System.goal)])
+load_plans.register("system.with_checkins", lambda: [selectinload(System.checkins)])
+load_plans.register("checkin.with_system", lambda: [joinedload(Checkin.system)])
+
+# --- Partnerships & Messaging ---
+load_plans.register(
+    "partnership.with_users",
+    lambda: [joinedload(Partnership.user1), joinedload(Partnership.user2)],
+)
+load_plans.register("partnership.with_requester", lambda: [joinedload(Partnership.user1)])
+load_plans.register(
+    "direct_message.with_reactions",
+    lambda: [selectinload(DirectMessage.reactions).joinedload(Reaction.user)],
+)
+
+# --- Social ---
+load_plans.register("comment.with_author", lambda: [joinedload(Comment.user)])
+load_plans.register("reaction.with_author", lambda: [joinedload(Reaction.user)])
+load_plans.register("reaction.with_message", lambda: [joinedload(Reaction.direct_message)])
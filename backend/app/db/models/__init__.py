@@ -7,4 +7,8 @@ from .comment import Comment
 from .reaction import Reaction
 from .reflection import Reflection
 from .direct_message import DirectMessage
-from .notification import Notification 
\ No newline at end of file
+from .notification import Notification, NotificationCounter
+from .streak import UserStreak, SystemStreak
+from .checkin_rollup import CheckinDailyRollup
+from .email_outbox import EmailOutbox
+from .ai_plan_cache import AIPlanCacheEntry
\ No newline at end of file
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, String, Text, func
+
+from app.db.base_class import Base
+
+class AIPlanCacheEntry(Base):
+    """
+    A generated plan, stored under the hash of everything that determines it
+    (see `ai_planner_service.plan_cache_key`), so identical goals are only
+    sent to the model once.
+    """
+    __tablename__ = "ai_plan_cache"
+
+    key = Column(String(64), primary_key=True)
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    plan_text = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Lets expired entries be purged without a full scan.
+        Index("ix_ai_plan_cache_expires_at", "expires_at"),
+    )
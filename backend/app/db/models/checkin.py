@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Float, func
+from sqlalchemy import Column, Index, String, Text, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Float, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -15,6 +15,9 @@ class CheckinStatus(PyEnum):
     VERIFIED_COMPLETED = "verified_completed"
     QUERIED_BY_PARTNER = "queried_by_partner"
 
+# Statuses that count as the system having been done (for streaks and progress).
+COMPLETED_CHECKIN_STATUSES = (CheckinStatus.COMPLETED, CheckinStatus.VERIFIED_COMPLETED)
+
 class Checkin(Base):
     __tablename__ = "checkins"
 
@@ -37,10 +40,31 @@ class Checkin(Base):
     verifier_query = Column(Text, nullable=True)
 
     # Relationships
-    user = relationship("User", foreign_keys=[user_id], back_populates="checkins_made")
-    system = relationship("System", back_populates="checkins")
-    verifier = relationship("User", foreign_keys=[verified_by_partner_id], back_populates="verified_checkins")
-    partnership = relationship("Partnership", foreign_keys=[partnership_id])
+    user = relationship("User", foreign_keys=[user_id], back_populates="checkins", lazy="raise_on_sql")
+    system = relationship("System", back_populates="checkins", lazy="raise_on_sql")
+    verifier = relationship("User", foreign_keys=[verified_by_partner_id], back_populates="verified_checkins", lazy="raise_on_sql")
+    partnership = relationship("Partnership", foreign_keys=[partnership_id], lazy="raise_on_sql")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Keyset pagination: WHERE system_id = ? AND (created_at, id) < (?, ?)
+        Index("ix_checkins_system_id_created_at_id", "system_id", "created_at", "id"),
+        # Dashboard: latest check-in per system for the day, and streak days per user.
+        Index("ix_checkins_system_id_checkin_timestamp_utc", "system_id", "checkin_timestamp_utc"),
+        Index("ix_checkins_user_id_checkin_timestamp_utc", "user_id", "checkin_timestamp_utc"),
+        # Partner feed: a user's check-ins, and the check-ins they verified, newest first.
+        Index("ix_checkins_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_checkins_verified_by_partner_id_verified_at_utc_id",
+            "verified_by_partner_id", "verified_at_utc", "id",
+            postgresql_where=text("verified_at_utc IS NOT NULL"),
+        ),
+        # Dashboard: partner check-ins waiting for verification.
+        Index(
+            "ix_checkins_pending_verification",
+            "partnership_id", "checkin_timestamp_utc",
+            postgresql_where=text("status = 'PENDING_VERIFICATION'"),
+        ),
+    )
@@ -0,0 +1,31 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, Index, Integer, Float, Date, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+class CheckinDailyRollup(Base):
+    """
+    Per (system, local day) check-in totals, kept in sync with the checkins
+    table by app/services/rollup_service.py. `local_date` is the day in the
+    owning user's timezone.
+    """
+    __tablename__ = "checkin_daily_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    system_id = Column(UUID(as_uuid=True), ForeignKey("systems.id", ondelete="CASCADE"), nullable=False)
+    local_date = Column(Date, nullable=False)
+
+    checkin_count = Column(Integer, default=0, nullable=False)
+    completed_count = Column(Integer, default=0, nullable=False)
+    metric_sum = Column(Float, default=0.0, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("system_id", "local_date", name="uq_checkin_daily_rollups_system_day"),
+        Index("ix_checkin_daily_rollups_user_id_local_date", "user_id", "local_date"),
+    )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Text, DateTime, ForeignKey, String, func, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Text, DateTime, ForeignKey, String, Index, func, Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,17 +19,22 @@ class Comment(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
-    target_type = Column(SQLAlchemyEnum(CommentTargetType), nullable=False, index=True)
-    target_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    target_type = Column(SQLAlchemyEnum(CommentTargetType), nullable=False)
+    target_id = Column(UUID(as_uuid=True), nullable=False)
 
     parent_comment_id = Column(UUID(as_uuid=True), ForeignKey("comments.id", ondelete="CASCADE"), nullable=True, index=True)
 
     content = Column(Text, nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="comments")
-    parent = relationship("Comment", remote_side=[id], back_populates="replies", lazy="selectin")
-    replies = relationship("Comment", back_populates="parent", lazy="selectin", cascade="all, delete-orphan")
+    user = relationship("User", back_populates="comments", lazy="raise_on_sql")
+    parent = relationship("Comment", remote_side=[id], back_populates="replies", lazy="raise_on_sql")
+    replies = relationship("Comment", back_populates="parent", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Thread loading ranks every comment on one target by (created_at, id).
+        Index("ix_comments_target_type_target_id_created_at_id", "target_type", "target_id", "created_at", "id"),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, Text, DateTime, ForeignKey, String, func
+from sqlalchemy import Column, Index, Text, DateTime, ForeignKey, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -18,16 +18,41 @@ class DirectMessage(Base):
     emoji_content = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
     
-    sent_at_utc = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    sent_at_utc = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     read_at_utc = Column(DateTime(timezone=True), nullable=True, index=True)
     
     reply_to_activity_id = Column(String, nullable=True)
     reply_to_activity_summary = Column(String, nullable=True)
 
     # Relationships
-    partnership = relationship("Partnership", back_populates="direct_messages")
-    sender = relationship("User", back_populates="messages_sent")
-    reactions = relationship("Reaction", back_populates="direct_message", cascade="all, delete-orphan", lazy="selectin")
+    partnership = relationship("Partnership", back_populates="direct_messages", lazy="raise_on_sql")
+    sender = relationship("User", back_populates="messages_sent", lazy="raise_on_sql")
+    reactions = relationship("Reaction", back_populates="direct_message", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Latest-first keyset pagination: WHERE partnership_id = ? AND (sent_at_utc, id) < (?, ?)
+        Index(
+            "ix_direct_messages_partnership_id_sent_at_utc_id",
+            "partnership_id",
+            sent_at_utc.desc(),
+            id.desc(),
+        ),
+        # Read receipts only touch messages nobody has read yet.
+        Index(
+            "ix_direct_messages_partnership_id_unread",
+            "partnership_id",
+            "sent_at_utc",
+            postgresql_where=(read_at_utc.is_(None)),
+        ),
+        # Partner feed: the messages a user sent in a partnership, newest first.
+        Index(
+            "ix_direct_messages_partnership_id_sender_id_sent_at_utc_id",
+            "partnership_id",
+            "sender_id",
+            "sent_at_utc",
+            "id",
+        ),
+    )
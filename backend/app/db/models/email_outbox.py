@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func, text, Enum as SQLAlchemyEnum
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+class EmailStatus(PyEnum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class EmailOutbox(Base):
+    """
+    An email waiting to be sent, or the record of one that was. Rows are
+    written in the transaction of the change that triggers the email, so an
+    email is queued exactly when that change commits, and are delivered by
+    the background sender.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # What the email is for, e.g. "partnership_invite".
+    kind = Column(String, nullable=False)
+    to_address = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html = Column(Text, nullable=False)
+
+    status = Column(SQLAlchemyEnum(EmailStatus), default=EmailStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    # When the sender may next pick the message up; pushed forward while a
+    # sender holds it and after a failed attempt.
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    provider_message_id = Column(String, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # The sender only ever scans messages that are still pending.
+        Index(
+            "ix_email_outbox_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Date, Enum as SQLAlchemyEnum, func
+from sqlalchemy import Column, Index, String, Text, Boolean, DateTime, ForeignKey, Date, Enum as SQLAlchemyEnum, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -42,8 +42,13 @@ class Goal(Base):
     is_archived = Column(Boolean, default=False, nullable=False, index=True)
 
     # Relationships
-    user = relationship("User", back_populates="goals")
-    systems = relationship("System", back_populates="goal", cascade="all, delete-orphan", lazy="selectin")
+    user = relationship("User", back_populates="goals", lazy="raise_on_sql")
+    systems = relationship("System", back_populates="goal", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Keyset pagination: WHERE user_id = ? AND (created_at, id) < (?, ?)
+        Index("ix_goals_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
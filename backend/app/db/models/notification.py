@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, Text, DateTime, ForeignKey, String, Boolean, func
+from sqlalchemy import Column, Text, DateTime, ForeignKey, String, Boolean, Integer, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -28,8 +28,34 @@ class Notification(Base):
     target_name = Column(String, nullable=True)
 
     # Relationships
-    recipient = relationship("User", foreign_keys=[recipient_id], back_populates="notifications_received")
-    actor = relationship("User", foreign_keys=[actor_user_id], back_populates="notifications_acted")
+    recipient = relationship("User", foreign_keys=[recipient_id], back_populates="notifications_received", lazy="raise_on_sql")
+    actor = relationship("User", foreign_keys=[actor_user_id], back_populates="notifications_acted", lazy="raise_on_sql")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Keyset pagination of a recipient's notifications, newest first.
+        Index("ix_notifications_recipient_id_created_at_id", "recipient_id", "created_at", "id"),
+        # mark-all-read and the unread filter only touch unread rows.
+        Index(
+            "ix_notifications_recipient_id_unread",
+            "recipient_id",
+            "created_at",
+            postgresql_where=(is_read.is_(False)),
+        ),
+    )
+
+class NotificationCounter(Base):
+    """
+    Per-user count of unread notifications, kept in step with writes by
+    app/services/notification_service.py so reads never count(*) the
+    notifications table. A missing row means zero.
+    """
+    __tablename__ = "notification_counters"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+    unread_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
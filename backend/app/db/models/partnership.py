@@ -30,10 +30,10 @@ class Partnership(Base):
     invite_email = Column(String, nullable=True)
 
     # Relationships
-    user1 = relationship("User", foreign_keys=[user1_id], back_populates="partnerships_as_user1")
-    user2 = relationship("User", foreign_keys=[user2_id], back_populates="partnerships_as_user2")
+    user1 = relationship("User", foreign_keys=[user1_id], back_populates="partnerships_as_user1", lazy="raise_on_sql")
+    user2 = relationship("User", foreign_keys=[user2_id], back_populates="partnerships_as_user2", lazy="raise_on_sql")
 
-    direct_messages = relationship("DirectMessage", back_populates="partnership", cascade="all, delete-orphan", lazy="selectin")
+    direct_messages = relationship("DirectMessage", back_populates="partnership", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
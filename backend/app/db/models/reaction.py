@@ -30,8 +30,8 @@ class Reaction(Base):
     direct_message_id = Column(UUID(as_uuid=True), ForeignKey("direct_messages.id", ondelete="CASCADE"), nullable=True, index=True)
 
     # Relationships
-    user = relationship("User") # No back_populates needed if not listing reactions on the user model directly
-    direct_message = relationship("DirectMessage", back_populates="reactions")
+    user = relationship("User", lazy="raise_on_sql") # No back_populates needed if not listing reactions on the user model directly
+    direct_message = relationship("DirectMessage", back_populates="reactions", lazy="raise_on_sql")
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, Text, DateTime, ForeignKey, Date, func, String
+from sqlalchemy import Column, Index, Text, DateTime, ForeignKey, Date, func, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import UniqueConstraint
@@ -22,12 +22,14 @@ class Reflection(Base):
     prompt_text = Column(Text, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="reflections")
-    partnership = relationship("Partnership", foreign_keys=[partnership_id])
+    user = relationship("User", back_populates="reflections", lazy="raise_on_sql")
+    partnership = relationship("Partnership", foreign_keys=[partnership_id], lazy="raise_on_sql")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint('user_id', 'reflection_date_local', name='_user_reflection_date_uc'),
+        # Partner feed: a user's reflections, newest first.
+        Index("ix_reflections_user_id_created_at_id", "user_id", "created_at", "id"),
     ) 
\ No newline at end of file
@@ -0,0 +1,40 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+# Streaks are kept up to date by app/services/streak_service.py as check-ins are
+# written, so reads never scan the checkins table. Days are the user's local
+# calendar days. `current_streak` is the length of the run ending on
+# `last_completed_date`; it is only still "current" if that day is today or
+# yesterday, which readers check.
+
+class UserStreak(Base):
+    __tablename__ = "user_streaks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_streak = Column(Integer, default=0, nullable=False)
+    current_streak_start_date = Column(Date, nullable=True)
+    last_completed_date = Column(Date, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+class SystemStreak(Base):
+    __tablename__ = "system_streaks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    system_id = Column(UUID(as_uuid=True), ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, unique=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_streak = Column(Integer, default=0, nullable=False)
+    current_streak_start_date = Column(Date, nullable=True)
+    last_completed_date = Column(Date, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
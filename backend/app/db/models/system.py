@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Time, Float, func
+from sqlalchemy import Column, Index, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Time, Float, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -52,9 +52,14 @@ class System(Base):
     ai_assistance_used = Column(Boolean, default=False, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="systems_created")
-    goal = relationship("Goal", back_populates="systems")
-    checkins = relationship("Checkin", back_populates="system", cascade="all, delete-orphan", lazy="selectin")
+    user = relationship("User", back_populates="systems_created", lazy="raise_on_sql")
+    goal = relationship("Goal", back_populates="systems", lazy="raise_on_sql")
+    checkins = relationship("Checkin", back_populates="system", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Keyset pagination: WHERE goal_id = ? AND (created_at, id) < (?, ?)
+        Index("ix_systems_goal_id_created_at_id", "goal_id", "created_at", "id"),
+    )
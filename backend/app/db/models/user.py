@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Date, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 
 from app.db.base_class import Base
 
@@ -24,23 +24,25 @@ class User(Base):
     current_partnership_id = Column(UUID(as_uuid=True), ForeignKey("partnerships.id", ondelete="SET NULL"), nullable=True, index=True)
     
     # Relationships
-    current_partnership = relationship("Partnership", foreign_keys=[current_partnership_id], backref="active_partners_via_current_id", lazy="selectin")
-    partnerships_as_user1 = relationship("Partnership", foreign_keys="Partnership.user1_id", back_populates="user1", lazy="selectin")
-    partnerships_as_user2 = relationship("Partnership", foreign_keys="Partnership.user2_id", back_populates="user2", lazy="selectin")
-
-    goals = relationship("Goal", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
-    systems_created = relationship("System", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
-    checkins = relationship("Checkin", back_populates="user", cascade="all, delete-orphan")
+    # Nothing here is loaded implicitly. Collections raise if touched without
+    # being loaded; callers pick what they need from app/db/load_plans.py.
+    current_partnership = relationship("Partnership", foreign_keys=[current_partnership_id], backref=backref("active_partners_via_current_id", lazy="raise"), lazy="raise_on_sql")
+    partnerships_as_user1 = relationship("Partnership", foreign_keys="Partnership.user1_id", back_populates="user1", lazy="raise")
+    partnerships_as_user2 = relationship("Partnership", foreign_keys="Partnership.user2_id", back_populates="user2", lazy="raise")
+
+    goals = relationship("Goal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    systems_created = relationship("System", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    checkins = relationship("Checkin", foreign_keys="Checkin.user_id", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
     
-    verified_checkins = relationship("Checkin", foreign_keys="Checkin.verified_by_partner_id", back_populates="verifier", lazy="selectin")
+    verified_checkins = relationship("Checkin", foreign_keys="Checkin.verified_by_partner_id", back_populates="verifier", lazy="raise")
 
-    reflections = relationship("Reflection", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
-    comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
+    reflections = relationship("Reflection", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
     
-    messages_sent = relationship("DirectMessage", foreign_keys="DirectMessage.sender_id", back_populates="sender", lazy="selectin")
+    messages_sent = relationship("DirectMessage", foreign_keys="DirectMessage.sender_id", back_populates="sender", lazy="raise")
 
-    notifications_received = relationship("Notification", foreign_keys="Notification.recipient_id", back_populates="recipient", cascade="all, delete-orphan", lazy="selectin")
-    notifications_acted = relationship("Notification", foreign_keys="Notification.actor_user_id", back_populates="actor", lazy="selectin")
+    notifications_received = relationship("Notification", foreign_keys="Notification.recipient_id", back_populates="recipient", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    notifications_acted = relationship("Notification", foreign_keys="Notification.actor_user_id", back_populates="actor", lazy="raise")
 
     theme_preference = Column(String, nullable=True, default="system")
     
@@ -51,17 +53,3 @@ class User(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-
-    partnerships_as_requester = relationship(
-        "Partnership",
-        foreign_keys="[Partnership.requester_id]",
-        back_populates="requester",
-        cascade="all, delete-orphan",
-    )
-    
-    partnerships_as_approver = relationship(
-        "Partnership",
-        foreign_keys="[Partnership.approver_id]",
-        back_populates="approver",
-        cascade="all, delete-orphan",
-    ) 
\ No newline at end of file
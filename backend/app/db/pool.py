@@ -0,0 +1,56 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that also records how long callers waited to get a
+    connection. Everything else (sizing, overflow, recycling) is unchanged.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            if waited > self.max_wait_seconds:
+                self.max_wait_seconds = waited
+
+    def recreate(self):
+        # Carry the counters over when the engine recreates its pool (e.g. after dispose()).
+        new_pool = super().recreate()
+        if isinstance(new_pool, InstrumentedAsyncQueuePool):
+            new_pool.checkouts = self.checkouts
+            new_pool.total_wait_seconds = self.total_wait_seconds
+            new_pool.max_wait_seconds = self.max_wait_seconds
+            new_pool.timeouts = self.timeouts
+        return new_pool
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Live pool figures plus the accumulated wait-time counters.
+        """
+        return {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (self.total_wait_seconds / self.checkouts * 1000) if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
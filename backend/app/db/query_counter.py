@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+class QueryCounter:
+    """
+    Records every statement sent to the database by an engine while active.
+    Meant for tests and local profiling; it counts everything on the engine,
+    so do not use it to attribute queries between concurrent requests.
+    """
+    def __init__(self, engine: AsyncEngine | Engine):
+        self.engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def start(self) -> None:
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+    def stop(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+    def report(self) -> str:
+        lines = [f"{self.count} quer{'y' if self.count == 1 else 'ies'} executed:"]
+        lines.extend(f"  {i}. {' '.join(sql.split())}" for i, sql in enumerate(self.statements, 1))
+        return "\n".join(lines)
+
+@contextmanager
+def count_queries(engine: AsyncEngine | Engine) -> Iterator[QueryCounter]:
+    """
+    Context manager that yields a QueryCounter for the enclosed block.
+
+        with count_queries(engine) as counter:
+            await client.get("/api/v1/users/me", headers=auth)
+        print(counter.count)
+    """
+    counter = QueryCounter(engine)
+    counter.start()
+    try:
+        yield counter
+    finally:
+        counter.stop()
+
+@contextmanager
+def assert_num_queries(
+    engine: AsyncEngine | Engine, expected: int, *, at_most: bool = False, label: Optional[str] = None
+) -> Iterator[QueryCounter]:
+    """
+    Fail with the list of executed statements if the enclosed block does not
+    run exactly `expected` queries (or more than `expected` with `at_most=True`).
+    Used to pin the query budget of an endpoint:
+
+        with assert_num_queries(engine, 1, label="GET /goals"):
+            await client.get("/api/v1/goals/", headers=auth)
+    """
+    with count_queries(engine) as counter:
+        yield counter
+
+    failed = counter.count > expected if at_most else counter.count != expected
+    if failed:
+        bound = "at most " if at_most else ""
+        prefix = f"{label}: " if label else ""
+        raise AssertionError(f"{prefix}expected {bound}{expected} queries, got {counter.report()}")
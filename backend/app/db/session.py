@@ -1,15 +1,14 @@
+from typing import Any, Dict
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.engine_profiles import build_engine_kwargs, resolve_engine_profile
 
-# Create an async engine to connect to the database
-# The pool_pre_ping helps in handling dropped connections.
-engine = create_async_engine(
-    settings.DATABASE_URL, 
-    pool_pre_ping=True, 
-    echo=True, 
-    connect_args={"statement_cache_size": 0}
-)
+# Pool sizing, timeouts and prepared statement caching come from the
+# configured engine profile (DB_ENGINE_PROFILE).
+engine_profile = resolve_engine_profile(settings)
+engine = create_async_engine(settings.DATABASE_URL, **build_engine_kwargs(engine_profile))
 
 # Create a sessionmaker for creating new session objects
 # expire_on_commit=False prevents attributes from being expired after commit.
@@ -19,4 +18,10 @@ SessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
-) 
\ No newline at end of file
+)
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Live connection pool statistics for the application engine.
+    """
+    return {"profile": engine_profile.name, **engine.pool.stats()}
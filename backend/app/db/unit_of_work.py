@@ -0,0 +1,66 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DEPTH_KEY = "unit_of_work_depth"
+_AFTER_COMMIT_KEY = "unit_of_work_after_commit"
+
+def in_unit_of_work(db: AsyncSession) -> bool:
+    """
+    True while the session is inside a `unit_of_work` block.
+    """
+    return db.info.get(_DEPTH_KEY, 0) > 0
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Group every write made through the CRUD layer into a single transaction.
+
+    Inside the block CRUD methods only flush, so each statement still runs
+    (and server-generated columns come back through RETURNING), but nothing is
+    committed until the outermost block exits. Any exception rolls the whole
+    unit back. Blocks can be nested; only the outermost one commits, and then
+    runs any callbacks registered with `run_after_commit`.
+
+        async with unit_of_work(db):
+            await crud_partnership.update(db, ...)
+            await crud_user.update(db, ...)
+    """
+    depth = db.info.get(_DEPTH_KEY, 0)
+    db.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            await db.commit()
+    except BaseException:
+        if depth == 0:
+            await db.rollback()
+            db.info.pop(_AFTER_COMMIT_KEY, None)
+        raise
+    finally:
+        db.info[_DEPTH_KEY] = depth
+    if depth == 0:
+        for callback in db.info.pop(_AFTER_COMMIT_KEY, []):
+            await callback()
+
+async def run_after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Run `callback` once the current unit of work has committed, or right away
+    when there is none (CRUD writes outside a unit of work commit immediately).
+    Callbacks are dropped if the unit of work rolls back.
+    """
+    if in_unit_of_work(db):
+        db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+    else:
+        await callback()
+
+async def commit_or_flush(db: AsyncSession) -> None:
+    """
+    Persist pending changes: flush when a unit of work is active, commit otherwise.
+    Models use eager defaults, so no refresh is needed afterwards.
+    """
+    if in_unit_of_work(db):
+        await db.flush()
+    else:
+        await db.commit()
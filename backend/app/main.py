@@ -1,14 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routers import auth, users, goals, systems, partnerships, ai_planner
+from app.api.routers import auth, users, dashboard, progress, goals, systems, checkins, partnerships, direct_messages, reactions, comments, notifications, ai_planner
 from app.core.config import settings
+from app.core.pubsub import pubsub_hub
+from app.services.email_sender import email_sender
+from app.services.notification_dispatcher import notification_dispatcher
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start background workers with the app and drain them on shutdown.
+    """
+    await pubsub_hub.start()
+    if settings.NOTIFICATION_DISPATCHER_ENABLED:
+        notification_dispatcher.start()
+    if settings.EMAIL_SENDER_ENABLED:
+        email_sender.start()
+    yield
+    await email_sender.stop()
+    await notification_dispatcher.stop()
+    await pubsub_hub.stop()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Backend for the DuoTrak AI-Assisted Accountability Partner App.",
     version="1.0.0",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
@@ -31,7 +52,14 @@ async def read_root():
 # Include the authentication router
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
+app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
+app.include_router(progress.router, prefix="/api/v1/progress", tags=["progress"])
 app.include_router(goals.router, prefix="/api/v1/goals", tags=["goals"])
 app.include_router(systems.router, prefix="/api/v1/systems", tags=["systems"])
+app.include_router(checkins.router, prefix="/api/v1/checkins", tags=["checkins"])
 app.include_router(partnerships.router, prefix="/api/v1/partnerships", tags=["partnerships"])
+app.include_router(direct_messages.router, prefix="/api/v1/direct-messages", tags=["direct_messages"])
+app.include_router(reactions.router, prefix="/api/v1/reactions", tags=["reactions"])
+app.include_router(comments.router, prefix="/api/v1/comments", tags=["comments"])
+app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["notifications"])
 app.include_router(ai_planner.router, prefix="/api/v1/planner", tags=["ai_planner"]) 
\ No newline at end of file
@@ -1,29 +1,48 @@
 import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 from datetime import datetime
 
+from app.db.models.checkin import CheckinStatus
+
 class CheckinBase(BaseModel):
     notes: Optional[str] = None
-    progress: int = Field(..., ge=0, le=100, description="Progress percentage from 0 to 100")
+    metric_value_logged: Optional[float] = Field(None, description="Value logged for counter/duration/pages systems")
+    photo_url: Optional[str] = None
 
     class Config:
         orm_mode = True
 
 class CheckinCreate(CheckinBase):
     system_id: uuid.UUID
+    status: CheckinStatus = CheckinStatus.COMPLETED
+    # Omit to check in "now"; set to log a backdated check-in.
+    checkin_timestamp_utc: Optional[datetime] = None
+    original_local_timestamp_str: Optional[str] = None
 
 class CheckinUpdate(CheckinBase):
-    # Allow updating notes or progress independently
-    notes: Optional[str] = None
-    progress: Optional[int] = Field(None, ge=0, le=100)
+    # Allow updating any field independently
+    status: Optional[CheckinStatus] = None
+    checkin_timestamp_utc: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def check_required_not_null(self) -> "CheckinUpdate":
+        # Optional so they can be left out, but a check-in always has both.
+        for field in ("status", "checkin_timestamp_utc"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null.")
+        return self
 
 
 class CheckinInDBBase(CheckinBase):
     id: uuid.UUID
+    user_id: uuid.UUID
     system_id: uuid.UUID
+    partnership_id: Optional[uuid.UUID] = None
+    status: CheckinStatus
+    checkin_timestamp_utc: datetime
     created_at: datetime
     updated_at: datetime
 
 class Checkin(CheckinInDBBase):
-    pass 
\ No newline at end of file
+    pass
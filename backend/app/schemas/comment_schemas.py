@@ -1,8 +1,9 @@
 import uuid
-from pydantic import BaseModel, Field, root_validator
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
+from app.db.models.comment import CommentTargetType
 from app.schemas.user_schemas import UserInfo
 
 # --- Base Schema ---
@@ -14,29 +15,28 @@ class CommentBase(BaseModel):
 
 # --- Create Schema ---
 class CommentCreate(CommentBase):
-    goal_id: Optional[uuid.UUID] = None
-    checkin_id: Optional[uuid.UUID] = None
-
-    @root_validator
-    def validate_one_parent_id(cls, values):
-        """Ensure exactly one parent ID is provided."""
-        goal_id, checkin_id = values.get('goal_id'), values.get('checkin_id')
-        if (goal_id is None and checkin_id is None):
-            raise ValueError('Either goal_id or checkin_id must be provided.')
-        if (goal_id is not None and checkin_id is not None):
-            raise ValueError('Only one of goal_id or checkin_id can be provided.')
-        return values
+    target_type: CommentTargetType
+    target_id: uuid.UUID
+    # Set when replying; the parent must be on the same target.
+    parent_comment_id: Optional[uuid.UUID] = None
 
 # --- Update Schema ---
 class CommentUpdate(BaseModel):
     content: str = Field(..., min_length=1, max_length=1000)
 
-# --- API Response Schema ---
+# --- API Response Schemas ---
 class Comment(CommentBase):
     id: uuid.UUID
     user_id: uuid.UUID
-    goal_id: Optional[uuid.UUID]
-    checkin_id: Optional[uuid.UUID]
+    target_type: CommentTargetType
+    target_id: uuid.UUID
+    parent_comment_id: Optional[uuid.UUID] = None
     created_at: datetime
     updated_at: datetime
-    user: UserInfo # Include author details in the response 
\ No newline at end of file
+    user: UserInfo # Include author details in the response
+
+class CommentNode(Comment):
+    # Total number of direct replies; `replies` may hold fewer when the
+    # loader was limited to the first few replies or a maximum depth.
+    reply_count: int = 0
+    replies: List["CommentNode"] = []
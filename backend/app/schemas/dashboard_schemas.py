@@ -0,0 +1,38 @@
+import uuid
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date, datetime, time
+
+class DashboardStreak(BaseModel):
+    current_streak: int
+    longest_streak: int
+
+class DashboardSystem(BaseModel):
+    id: uuid.UUID
+    name: str
+    status: str
+    details: Optional[str] = None
+    schedule_time: Optional[time] = None
+    current_streak: int = 0
+
+class ReflectionPrompt(BaseModel):
+    id: str
+    text: str
+
+class VerificationAlert(BaseModel):
+    id: uuid.UUID
+    system_id: uuid.UUID
+    system_name: str
+    checked_in_at: Optional[datetime] = None
+    message: str
+
+class Dashboard(BaseModel):
+    date: date
+    timezone: str
+    user_greeting_name: str
+    streak: DashboardStreak
+    pending_verification_count: int
+    pending_systems_count: int
+    systems_for_today: List[DashboardSystem]
+    daily_reflection_prompts: List[ReflectionPrompt]
+    verification_alerts: List[VerificationAlert]
@@ -1,23 +1,33 @@
 import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List
 from datetime import datetime
 from app.schemas.reaction_schemas import Reaction
 
 # --- Base Schema ---
 class DirectMessageBase(BaseModel):
-    content: str = Field(..., min_length=1, max_length=1000)
+    # A message carries text, an emoji or an image (at least one of them).
+    text_content: Optional[str] = Field(None, min_length=1, max_length=1000)
+    emoji_content: Optional[str] = None
+    image_url: Optional[str] = None
+    reply_to_activity_id: Optional[str] = None
+    reply_to_activity_summary: Optional[str] = None
 
     class Config:
         orm_mode = True
 
 # --- Create Schema ---
 class DirectMessageCreate(DirectMessageBase):
-    # When creating a message, the sender is the current user.
-    # We only need to know the recipient and the partnership it belongs to.
-    recipient_id: uuid.UUID
+    # When creating a message, the sender is the current user and the
+    # recipient is their partner in this partnership.
     partnership_id: uuid.UUID
 
+    @model_validator(mode="after")
+    def check_has_content(self) -> "DirectMessageCreate":
+        if not (self.text_content or self.emoji_content or self.image_url):
+            raise ValueError("A message needs text_content, emoji_content or image_url.")
+        return self
+
 
 # --- Update Schema ---
 # We will assume messages are immutable and cannot be updated.
@@ -26,8 +36,21 @@ class DirectMessageCreate(DirectMessageBase):
 class DirectMessage(DirectMessageBase):
     id: uuid.UUID
     sender_id: uuid.UUID
-    recipient_id: uuid.UUID
     partnership_id: uuid.UUID
+    sent_at_utc: Optional[datetime] = None
+    read_at_utc: Optional[datetime] = None
     created_at: datetime
-    is_read: bool
-    reactions: List[Reaction] = [] 
\ No newline at end of file
+    reactions: List[Reaction] = []
+
+# --- Read Receipts ---
+class MarkReadRequest(BaseModel):
+    # Every message received up to and including this one is marked read.
+    up_to_message_id: uuid.UUID
+
+class MarkReadResult(BaseModel):
+    marked_read: int
+
+# Pushed to the partnership as a `messages.read` event.
+class ReadReceipt(BaseModel):
+    reader_id: uuid.UUID
+    up_to_message_id: uuid.UUID
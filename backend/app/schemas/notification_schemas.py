@@ -0,0 +1,49 @@
+import uuid
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+from app.schemas.pagination_schemas import Page
+from app.schemas.target_schemas import TargetSummary
+
+# --- Base Schema ---
+class NotificationBase(BaseModel):
+    type: str
+    title: Optional[str] = None
+    message: Optional[str] = None
+    link_to: Optional[str] = None
+    icon_identifier: Optional[str] = None
+    target_type: Optional[str] = None
+    target_id: Optional[str] = None
+    target_name: Optional[str] = None
+
+    class Config:
+        orm_mode = True
+
+# --- Create Schema ---
+# Notifications are produced by the server, never posted by clients.
+class NotificationCreate(NotificationBase):
+    recipient_id: uuid.UUID
+    actor_user_id: Optional[uuid.UUID] = None
+
+# --- API Response Schemas ---
+class Notification(NotificationBase):
+    id: uuid.UUID
+    recipient_id: uuid.UUID
+    actor_user_id: Optional[uuid.UUID] = None
+    is_read: bool
+    read_at_utc: Optional[datetime] = None
+    created_at: datetime
+    # The current state of the target; target_name is a snapshot from when
+    # the notification was sent.
+    target: Optional[TargetSummary] = None
+
+class NotificationPage(Page[Notification]):
+    unread_count: int
+
+class UnreadCount(BaseModel):
+    unread_count: int
+
+class MarkAllReadResult(BaseModel):
+    marked_read: int
+    unread_count: int
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """
+    Response envelope shared by all keyset-paginated list endpoints.
+    Pass `next_cursor` back as `?cursor=` to fetch the next page; it is
+    null on the last page.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page.")
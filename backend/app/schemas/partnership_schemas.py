@@ -1,9 +1,9 @@
 import uuid
-from pydantic import BaseModel, Field
+from enum import Enum
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 from app.db.models.partnership import PartnershipStatus
-from app.schemas.user_schemas import UserInfo, User
 
 # --- Base Schema ---
 class PartnershipBase(BaseModel):
@@ -16,9 +16,10 @@ class PartnershipBase(BaseModel):
 
 # --- Create Schema ---
 class PartnershipCreate(BaseModel):
-    # To create a request, you only need to know who you're sending it to.
+    # To create a request, you only need to know who you're sending it to:
+    # they are invited by email and may not have an account yet.
     # The requester is the current_user.
-    approver_id: uuid.UUID
+    invite_email: EmailStr
 
 
 # --- Update Schema ---
@@ -28,15 +29,31 @@ class PartnershipUpdate(BaseModel):
 
 
 # --- API Response Schema ---
-# This is what we'll return from the API.
-# It includes the full user objects for both requester and approver.
+# This is what we'll return from the API. user1 is the requester; user2 is
+# set once the invited user accepts.
 class Partnership(PartnershipBase):
     id: uuid.UUID
-    requester_id: uuid.UUID
-    approver_id: uuid.UUID
+    user1_id: uuid.UUID
+    user2_id: Optional[uuid.UUID] = None
+    invite_email: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    
-    # Nested user information for rich API responses
-    requester: UserInfo
-    approver: UserInfo 
\ No newline at end of file
+    activated_at: Optional[datetime] = None
+
+# --- Partner Feed ---
+class PartnerFeedItemType(str, Enum):
+    CHECKIN = "checkin"
+    REFLECTION = "reflection"
+    VERIFICATION = "verification"
+    MESSAGE = "message"
+
+class PartnerFeedItem(BaseModel):
+    type: PartnerFeedItemType
+    # The check-in, reflection or message ID; a verification carries the
+    # ID of the check-in that was verified.
+    id: uuid.UUID
+    occurred_at: datetime
+    title: Optional[str] = None
+    body: Optional[str] = None
+    status: Optional[str] = None
+
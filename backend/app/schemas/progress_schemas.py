@@ -0,0 +1,61 @@
+import uuid
+from enum import Enum
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+class DateRangePreset(str, Enum):
+    LAST_7D = "last7d"
+    LAST_30D = "last30d"
+    MONTH_TO_DATE = "monthToDate"
+    ALL_TIME = "allTime"
+    CUSTOM = "custom"
+
+class StatsSource(str, Enum):
+    ROLLUP = "rollup"
+    RAW = "raw"
+
+class SystemEngagement(BaseModel):
+    system_id: uuid.UUID
+    system_name: str
+    logged_count: int
+    completed_count: int
+    metric_total: float = 0.0
+
+class ProgressStats(BaseModel):
+    overall_consistency: float
+    current_streak: int
+    longest_streak: int
+    most_consistent_day: str
+    total_checkins: int
+    systems_completed: int
+    system_engagement: List[SystemEngagement]
+
+class ConsistencyPoint(BaseModel):
+    date: date
+    user_consistency: Optional[float] = None
+    partner_consistency: Optional[float] = None
+
+class DayOfWeekConsistency(BaseModel):
+    day: str
+    user_consistency: Optional[float] = None
+    partner_consistency: Optional[float] = None
+
+class PartnerProfile(BaseModel):
+    user_id: uuid.UUID
+    username: Optional[str] = None
+
+class SystemSummary(BaseModel):
+    id: uuid.UUID
+    name: str
+
+class Progress(BaseModel):
+    goal_title: str
+    start_date: date
+    end_date: date
+    personal_stats: ProgressStats
+    partner_profile: Optional[PartnerProfile] = None
+    partner_stats: Optional[ProgressStats] = None
+    user_systems_list: List[SystemSummary]
+    consistency_over_time: List[ConsistencyPoint]
+    consistency_by_weekday: List[DayOfWeekConsistency]
@@ -1,6 +1,8 @@
 import uuid
 from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
+from app.db.models.reaction import ReactionTargetType
 from app.schemas.user_schemas import UserInfo
 
 # --- Base Schema ---
@@ -20,6 +22,24 @@ class ReactionCreate(ReactionBase):
 class Reaction(ReactionBase):
     id: uuid.UUID
     user_id: uuid.UUID
-    message_id: uuid.UUID
+    target_type: ReactionTargetType
+    target_id: uuid.UUID
+    direct_message_id: Optional[uuid.UUID] = None
     created_at: datetime
-    user: UserInfo # Include author details in the response 
\ No newline at end of file
+    user: UserInfo # Include author details in the response
+
+# --- Batch Summary Schemas ---
+class ReactionTarget(BaseModel):
+    target_type: ReactionTargetType
+    target_id: uuid.UUID
+
+class ReactionSummaryRequest(BaseModel):
+    targets: List[ReactionTarget] = Field(..., min_length=1, max_length=200)
+
+class EmojiCount(BaseModel):
+    emoji: str
+    count: int
+    reacted_by_me: bool
+
+class ReactionSummary(ReactionTarget):
+    reactions: List[EmojiCount] = []
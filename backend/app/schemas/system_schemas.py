@@ -1,19 +1,19 @@
 import uuid
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field, field_validator
 from datetime import time, datetime
 
 from app.db.models.system import SystemFrequency, SystemMetricType, SystemStatus
 
 class SystemBase(BaseModel):
-    name: Optional[str] = Field(None, min_length=3, max_length=100)
+    title: Optional[str] = Field(None, min_length=3, max_length=100)
     description: Optional[str] = None
     
     class Config:
         orm_mode = True
 
 class SystemCreate(SystemBase):
-    name: str = Field(..., min_length=3, max_length=100)
+    title: str = Field(..., min_length=3, max_length=100)
     goal_id: uuid.UUID
 
 class SystemUpdate(SystemBase):
@@ -21,9 +21,37 @@ class SystemUpdate(SystemBase):
 
 class SystemInDBBase(SystemBase):
     id: uuid.UUID
-    goal_id: uuid.UUID
+    goal_id: Optional[uuid.UUID] = None
+    metric_type: SystemMetricType
+    frequency: SystemFrequency
+    status: SystemStatus
+    ai_assistance_used: Optional[bool] = None
     created_at: datetime
     updated_at: datetime
 
 class System(SystemInDBBase):
     pass
+
+# The most systems a single plan may add to a goal.
+MAX_PLANNED_SYSTEMS = 10
+
+class PlannedSystem(BaseModel):
+    """
+    One system suggested by the AI planner, ready to be created as-is.
+    """
+    title: str = Field(..., min_length=3, max_length=100)
+    description: str = Field(..., min_length=1)
+    metric_type: SystemMetricType
+    frequency: SystemFrequency
+
+    @field_validator("metric_type", "frequency", mode="before")
+    @classmethod
+    def _fold_enum_case(cls, value: Any) -> Any:
+        # Model output is not always lower case ("Binary", " DAILY").
+        return value.strip().lower() if isinstance(value, str) else value
+
+class SystemPlan(BaseModel):
+    systems: List[PlannedSystem] = Field(..., min_length=1, max_length=MAX_PLANNED_SYSTEMS)
+
+class SystemPlanApply(SystemPlan):
+    goal_id: uuid.UUID
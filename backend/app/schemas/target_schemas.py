@@ -0,0 +1,16 @@
+import uuid
+from pydantic import BaseModel
+from typing import Optional
+
+class TargetSummary(BaseModel):
+    """
+    What a comment, reaction or notification points at, as shown next to it.
+    `available` is false when the target was deleted, is of a type that
+    cannot be resolved, or belongs to someone outside the viewer's
+    partnership; title and owner are then omitted.
+    """
+    target_type: str
+    target_id: uuid.UUID
+    available: bool
+    title: Optional[str] = None
+    owner_id: Optional[uuid.UUID] = None
@@ -1,9 +1,11 @@
 from pydantic import BaseModel
 import uuid
+from typing import Optional
 
 class Token(BaseModel):
     access_token: str
     token_type: str
 
 class TokenPayload(BaseModel):
-    sub: uuid.UUID 
\ No newline at end of file
+    sub: uuid.UUID
+    exp: Optional[int] = None 
\ No newline at end of file
@@ -1,5 +1,5 @@
 import uuid
-from pydantic import BaseModel, EmailStr, constr, Field
+from pydantic import AliasChoices, BaseModel, EmailStr, constr, Field
 from typing import Optional
 from datetime import datetime
 
@@ -7,8 +7,8 @@ from datetime import datetime
 # for nesting in other models (e.g., comments, reactions, partnerships).
 class UserInfo(BaseModel):
     id: uuid.UUID
-    username: str
-    avatar_url: Optional[str] = None
+    username: Optional[str] = None
+    avatar_url: Optional[str] = Field(None, validation_alias=AliasChoices("avatar_url", "profile_image_url"))
 
     class Config:
         orm_mode = True
@@ -70,6 +70,27 @@ class UserInDBBase(UserBase):
 class User(UserInDBBase):
     pass
 
+# --- Authenticated Principal ---
+# A detached snapshot of the authenticated user's own columns. It is what
+# deps.get_current_user returns, so it can be cached between requests without
+# holding on to an ORM object or a database session.
+class UserPrincipal(BaseModel):
+    id: uuid.UUID
+    email: str
+    username: Optional[str] = None
+    name: Optional[str] = None
+    profile_image_url: Optional[str] = None
+    bio: Optional[str] = None
+    timezone: str = "UTC"
+    is_active: bool = True
+    is_email_verified: bool = False
+    current_partnership_id: Optional[uuid.UUID] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
 # --- Full Database Schema ---
 # Additional properties stored in DB but not necessarily sent to client
 class UserInDB(UserInDBBase):
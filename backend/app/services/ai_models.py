@@ -0,0 +1,23 @@
+from typing import Any
+
+from app.core.config import settings
+from app.core.providers import ProviderRegistry
+from app.services.fake_ai_model import FakeStreamingModel
+
+# Generative models for the AI planner, selected by AI_PLANNER_PROVIDER.
+# Every provider returns an object with genai.GenerativeModel's
+# `generate_content_async(contents, *, stream, generation_config)`.
+ai_models: ProviderRegistry[Any] = ProviderRegistry("AI model")
+
+def _build_gemini(*, model_name: str) -> Any:
+    # google.generativeai takes a third of a second to import; only pay for
+    # it once a plan is actually requested.
+    import google.generativeai as genai
+
+    if not settings.GOOGLE_API_KEY:
+        raise ValueError("GOOGLE_API_KEY is not configured for the AI Planner.")
+    genai.configure(api_key=settings.GOOGLE_API_KEY)
+    return genai.GenerativeModel(model_name)
+
+ai_models.register("gemini", _build_gemini)
+ai_models.register("fake", lambda *, model_name: FakeStreamingModel())
@@ -1,19 +1,142 @@
-import google.generativeai as genai
+import hashlib
+import json
+import logging
+import unicodedata
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.rate_limit import ConcurrencyLimiter, TokenBuckets
+from app.core.single_flight import SingleFlight
+from app.crud.crud_ai_plan_cache import ai_plan_cache as crud_ai_plan_cache
+from app.db.models.system import SystemFrequency, SystemMetricType
+from app.db.session import SessionLocal
+from app.schemas.system_schemas import MAX_PLANNED_SYSTEMS, PlannedSystem, SystemPlan
+from app.services.ai_models import ai_models
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the matching prompt below changes, so plans cached for the
+# old prompt are no longer served.
+PLAN_PROMPT_VERSION = "1"
+STRUCTURED_PLAN_PROMPT_VERSION = "structured-1"
+
+# Constrains Gemini's JSON output to the shape of SystemPlan.
+SYSTEM_PLAN_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "systems": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "metric_type": {"type": "string", "format": "enum", "enum": [m.value for m in SystemMetricType]},
+                    "frequency": {"type": "string", "format": "enum", "enum": [f.value for f in SystemFrequency]},
+                },
+                "required": ["title", "description", "metric_type", "frequency"],
+            },
+        },
+    },
+    "required": ["systems"],
+}
+
+_METRIC_LABELS = {
+    SystemMetricType.BINARY: "Binary (Done/Not Done)",
+    SystemMetricType.COUNTER: "Counter (items)",
+    SystemMetricType.DURATION: "Duration (minutes)",
+    SystemMetricType.PAGES: "Pages",
+}
+
+def _normalize(text: str | None) -> str:
+    """
+    Fold the differences that do not change what is asked for: Unicode
+    form, case and whitespace.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text or "").casefold().split())
+
+def plan_cache_key(*, model: str, prompt_version: str, goal_title: str, goal_description: str | None) -> str:
+    """
+    Content address of a plan: a SHA-256 over the model, prompt version and
+    normalized goal text.
+    """
+    payload = json.dumps(
+        [model, prompt_version, _normalize(goal_title), _normalize(goal_description)],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def render_plan_text(systems: List[PlannedSystem]) -> str:
+    """
+    The markdown form of a structured plan, in the layout free-form plans use.
+    """
+    lines = []
+    for n, system in enumerate(systems, 1):
+        lines.append(f"{n}.  **System Title:** {system.title}")
+        lines.append(f"    - **Description:** {system.description}")
+        lines.append(f"    - **Metric:** {_METRIC_LABELS[system.metric_type]}")
+        lines.append(f"    - **Frequency:** {system.frequency.value.capitalize()}")
+    return "\n".join(lines) + "\n"
 
 class AIPlannerService:
-    def __init__(self):
-        if not settings.GOOGLE_API_KEY:
-            raise ValueError("GOOGLE_API_KEY is not configured for the AI Planner.")
-        
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-pro-latest')
+    """
+    Generates system plans with Gemini. Identical goals are answered from a
+    cache: an LRU+TTL tier in memory, then (optionally) the ai_plan_cache
+    table shared by every worker. Concurrent requests for the same plan share
+    one model call. Plans can also be streamed as they are generated.
+    Model calls are bounded by `limiter`; `user_buckets` is the per-user
+    request allowance, charged by the router.
+    The model comes from the `ai_models` provider registry and is only
+    built on first use, so a missing SDK or API key fails plan requests
+    (with a 503) rather than startup.
+    """
+    def __init__(
+        self,
+        *,
+        provider: str = settings.AI_PLANNER_PROVIDER,
+        model_name: str = settings.AI_PLANNER_MODEL,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+        persistent: bool = settings.AI_PLAN_CACHE_PERSISTENT,
+    ):
+        self.provider = provider
+        self.model_name = model_name
+        # Plans are cached per provider and model.
+        self.model_id = f"{provider}/{model_name}"
+        self._model: Optional[Any] = None
+        self.session_factory = session_factory
+        self.persistent = persistent
+        self.plan_cache: TTLCache[str] = TTLCache(
+            max_entries=settings.AI_PLAN_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.AI_PLAN_CACHE_TTL_SECONDS,
+        )
+        self._in_flight: SingleFlight[str] = SingleFlight()
+        self.limiter = ConcurrencyLimiter(
+            limit=settings.AI_PLANNER_MAX_CONCURRENCY,
+            max_queue=settings.AI_PLANNER_MAX_QUEUE,
+            queue_timeout=settings.AI_PLANNER_QUEUE_TIMEOUT_SECONDS,
+        )
+        self.user_buckets = TokenBuckets(
+            rate=settings.AI_PLANNER_USER_RATE_PER_MINUTE / 60,
+            burst=settings.AI_PLANNER_USER_BURST,
+        )
+        self.persistent_hits = 0
+        self.model_calls = 0
+        self.streams_completed = 0
+        self.streams_cancelled = 0
 
-    async def generate_system_plan_for_goal(self, goal_title: str, goal_description: str | None) -> str:
-        """
-        Generates a structured plan of systems for a given goal using the AI model.
-        """
-        prompt = f"""
+    @property
+    def model(self) -> Any:
+        if self._model is None:
+            self._model = ai_models.create(self.provider, model_name=self.model_name)
+        return self._model
+
+    def _build_prompt(self, goal_title: str, goal_description: str | None) -> str:
+        return f"""
         You are an expert productivity coach. A user wants to achieve the following goal.
         Your task is to break this goal down into a clear, concise, and actionable plan consisting of several "systems".
         A system is a repeatable action or habit.
@@ -28,17 +151,193 @@ class AIPlannerService:
         2.  **System Title:** Title for the second system.
             - **Description:** Description for the second system.
             - **Metric:** Suggested metric.
-        
+
         Provide 2-4 systems. The tone should be encouraging and straightforward.
         Focus on creating tangible, repeatable systems that will lead to achieving the main goal.
         """
 
+    def _build_structured_prompt(self, goal_title: str, goal_description: str | None) -> str:
+        return f"""
+        You are an expert productivity coach. A user wants to achieve the following goal.
+        Break it down into several "systems": repeatable actions or habits that will lead to achieving it.
+
+        Goal Title: "{goal_title}"
+        Goal Description: "{goal_description or 'No description provided.'}"
+
+        Respond with a JSON object with a "systems" array of 2-4 systems (never more than {MAX_PLANNED_SYSTEMS}). Each system has:
+        - "title": a short, clear title (e.g., "Daily Morning Review"), at most 100 characters.
+        - "description": one encouraging, straightforward sentence saying what to do.
+        - "metric_type": how progress is tracked, one of "binary" (done/not done), "counter", "duration" (minutes) or "pages".
+        - "frequency": "daily" or "weekly".
+        """
+
+    async def _generate(self, prompt: str, **options: Any) -> str:
+        async with self.limiter.slot():
+            self.model_calls += 1
+            try:
+                response = await self.model.generate_content_async(prompt, **options)
+                return response.text
+            except Exception as e:
+                logger.exception("Error calling Gemini API: %s", e)
+                raise Exception("Failed to generate a plan from the AI service.")
+
+    async def _generate_structured(self, goal_title: str, goal_description: str | None) -> str:
+        """
+        Generates a plan in JSON mode and validates it. Returns the plan
+        re-serialized from the validated model, so only well-formed plans are
+        ever cached.
+        """
+        plan_json = await self._generate(
+            self._build_structured_prompt(goal_title, goal_description),
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": SYSTEM_PLAN_RESPONSE_SCHEMA,
+            },
+        )
+        try:
+            return SystemPlan.model_validate_json(plan_json).model_dump_json()
+        except ValidationError as e:
+            logger.warning("Gemini returned an invalid structured plan: %s", e)
+            raise Exception("The AI service returned a plan in an unexpected format.")
+
+    def _cache_key(self, goal_title: str, goal_description: str | None, *, prompt_version: str = PLAN_PROMPT_VERSION) -> str:
+        return plan_cache_key(
+            model=self.model_id,
+            prompt_version=prompt_version,
+            goal_title=goal_title,
+            goal_description=goal_description,
+        )
+
+    async def _read_persistent(self, key: str) -> Optional[str]:
+        """
+        Look a plan up in the persistent tier, copying a hit into memory.
+        A failing persistent tier only costs the cache, never the request.
+        """
+        if not self.persistent:
+            return None
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
-        except Exception as e:
-            print(f"Error calling Gemini API: {e}")
-            # In a real app, handle this more gracefully
-            raise Exception("Failed to generate a plan from the AI service.")
-
-ai_planner_service = AIPlannerService() 
\ No newline at end of file
+            async with self.session_factory() as db:
+                plan_text = await crud_ai_plan_cache.get_plan_text(db, key=key)
+        except Exception:
+            logger.exception("Could not read the AI plan cache.")
+            return None
+        if plan_text is not None:
+            self.persistent_hits += 1
+            self.plan_cache.set(key, plan_text)
+        return plan_text
+
+    async def _store(self, key: str, plan_text: str, *, prompt_version: str = PLAN_PROMPT_VERSION) -> None:
+        """
+        Store a freshly generated plan in both tiers.
+        """
+        self.plan_cache.set(key, plan_text)
+        if not self.persistent:
+            return
+        try:
+            async with self.session_factory() as db:
+                await crud_ai_plan_cache.put(
+                    db,
+                    key=key,
+                    model=self.model_id,
+                    prompt_version=prompt_version,
+                    plan_text=plan_text,
+                    ttl_seconds=settings.AI_PLAN_CACHE_PERSISTENT_TTL_SECONDS,
+                )
+        except Exception:
+            logger.exception("Could not write the AI plan cache.")
+
+    async def _load_plan(self, key: str, generate: Callable[[], Awaitable[str]], *, prompt_version: str) -> str:
+        """
+        Fill a memory-cache miss: from the persistent tier if possible,
+        otherwise from the model.
+        """
+        plan_text = await self._read_persistent(key)
+        if plan_text is None:
+            plan_text = await generate()
+            await self._store(key, plan_text, prompt_version=prompt_version)
+        return plan_text
+
+    async def _cached_plan(self, key: str, generate: Callable[[], Awaitable[str]], *, prompt_version: str) -> str:
+        plan_text = self.plan_cache.get(key)
+        if plan_text is not None:
+            return plan_text
+        return await self._in_flight.do(key, lambda: self._load_plan(key, generate, prompt_version=prompt_version))
+
+    async def generate_system_plan_for_goal(self, goal_title: str, goal_description: str | None) -> str:
+        """
+        Generates a structured plan of systems for a given goal using the AI
+        model, or returns the cached plan for an identical goal.
+        """
+        return await self._cached_plan(
+            self._cache_key(goal_title, goal_description),
+            lambda: self._generate(self._build_prompt(goal_title, goal_description)),
+            prompt_version=PLAN_PROMPT_VERSION,
+        )
+
+    async def generate_structured_plan_for_goal(self, goal_title: str, goal_description: str | None) -> List[PlannedSystem]:
+        """
+        Like generate_system_plan_for_goal, but the model answers in JSON
+        mode and the plan is returned as validated systems that can be
+        applied to the goal directly. Cached separately from free-form plans.
+        """
+        plan_json = await self._cached_plan(
+            self._cache_key(goal_title, goal_description, prompt_version=STRUCTURED_PLAN_PROMPT_VERSION),
+            lambda: self._generate_structured(goal_title, goal_description),
+            prompt_version=STRUCTURED_PLAN_PROMPT_VERSION,
+        )
+        return SystemPlan.model_validate_json(plan_json).systems
+
+    async def stream_system_plan_for_goal(self, goal_title: str, goal_description: str | None) -> AsyncIterator[str]:
+        """
+        Yields the plan as the model produces it. A cached plan comes back as
+        a single chunk. The full text is cached only once the stream
+        completes; closing the iterator early (the client went away) stops
+        reading from the model and caches nothing. Streams are not shared
+        between concurrent callers, and each holds a limiter slot until it
+        ends. Raises ServiceOverloaded before the first chunk if no slot
+        frees up in time.
+        """
+        key = self._cache_key(goal_title, goal_description)
+        plan_text = self.plan_cache.get(key)
+        if plan_text is None:
+            plan_text = await self._read_persistent(key)
+        if plan_text is not None:
+            yield plan_text
+            return
+
+        chunks = []
+        completed = False
+        async with self.limiter.slot():
+            self.model_calls += 1
+            try:
+                response = await self.model.generate_content_async(
+                    self._build_prompt(goal_title, goal_description), stream=True
+                )
+                async for chunk in response:
+                    if chunk.text:
+                        chunks.append(chunk.text)
+                        yield chunk.text
+                completed = True
+            except Exception as e:
+                logger.exception("Error streaming from Gemini API: %s", e)
+                raise Exception("Failed to generate a plan from the AI service.")
+            finally:
+                if completed:
+                    self.streams_completed += 1
+                else:
+                    self.streams_cancelled += 1
+        await self._store(key, "".join(chunks))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "memory": self.plan_cache.stats(),
+            "persistent_hits": self.persistent_hits,
+            "model_calls": self.model_calls,
+            "streams_completed": self.streams_completed,
+            "streams_cancelled": self.streams_cancelled,
+            "single_flight": self._in_flight.stats(),
+            "limiter": self.limiter.stats(),
+            "user_buckets": self.user_buckets.stats(),
+        }
+
+ai_planner_service = AIPlannerService()
@@ -1,49 +1,89 @@
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_checkin, crud_system
-from app.db.models.checkin import Checkin
+from app.core.pagination import PageParams
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_user import user as crud_user
+from app.db.models.checkin import Checkin, CheckinStatus
 from app.db.models.user import User as UserModel
+from app.db.unit_of_work import unit_of_work
 from app.schemas.checkin_schemas import CheckinCreate, CheckinUpdate
+from app.services.notification_dispatcher import notification_dispatcher
+from app.services.rollup_service import CheckinSnapshot, rollup_service
+from app.services.streak_service import streak_service
 from app.services.system_service import system_service # We can reuse the ownership check
 
 class CheckinService:
     async def get_checkins_for_system(
-        self, db: AsyncSession, *, system_id: uuid.UUID, user: UserModel
-    ) -> List[Checkin]:
+        self, db: AsyncSession, *, system_id: uuid.UUID, user: UserModel, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Retrieve all check-ins for a specific system, ensuring the user owns the system.
+        Retrieve one page of check-ins for a specific system, ensuring the user owns the system.
         """
         # This check implicitly verifies goal ownership as well
         await system_service.get_system_by_id(db, system_id=system_id, user=user)
-        return await crud_checkin.get_multi_by_system(db, system_id=system_id)
+        return await crud_checkin.get_multi_by_system(db, system_id=system_id, page=page)
 
     async def create_checkin_for_system(
         self, db: AsyncSession, *, checkin_in: CheckinCreate, user: UserModel
     ) -> Checkin:
         """
         Create a new check-in for a specific system, ensuring the user owns the system.
+        The user's streaks and daily rollups are updated in the same transaction.
+        A check-in that needs verification notifies the partner once committed.
         """
         # Verify ownership of the parent system
         await system_service.get_system_by_id(db, system_id=checkin_in.system_id, user=user)
-        return await crud_checkin.create(db, obj_in=checkin_in)
+        async with unit_of_work(db):
+            checkin = await crud_checkin.create(
+                db,
+                obj_in={
+                    # Unset fields fall back to column defaults (e.g. timestamp = now).
+                    **checkin_in.dict(exclude_none=True),
+                    "user_id": user.id,
+                    "partnership_id": user.current_partnership_id,
+                },
+            )
+            await streak_service.on_checkin_created(db, checkin=checkin, timezone_name=user.timezone)
+            await rollup_service.on_checkin_created(db, checkin=checkin, timezone_name=user.timezone)
+            if checkin.status == CheckinStatus.PENDING_VERIFICATION and checkin.partnership_id:
+                await self._notify_verifier(db, checkin=checkin, user=user)
+        return checkin
+
+    async def _notify_verifier(self, db: AsyncSession, *, checkin: Checkin, user: UserModel) -> None:
+        partner = await crud_user.get_partner_summary(
+            db, user_id=user.id, partnership_id=checkin.partnership_id
+        )
+        if not partner:
+            return
+        await notification_dispatcher.notify(
+            db,
+            notifications=[{
+                "recipient_id": partner.id,
+                "actor_user_id": user.id,
+                "type": "checkin_verification_requested",
+                "title": "Check-in waiting for you",
+                "message": f"{user.name or user.username or 'Your partner'} asked you to verify a check-in.",
+                "target_type": "checkin",
+                "target_id": str(checkin.id),
+            }],
+        )
 
     async def get_checkin_by_id(
         self, db: AsyncSession, *, checkin_id: uuid.UUID, user: UserModel
     ) -> Optional[Checkin]:
         """
         Retrieve a specific check-in by ID, ensuring ownership via the parent system/goal.
+        Existence and ownership are checked in a single query.
         """
-        checkin = await crud_checkin.get(db, id=checkin_id)
+        checkin = await crud_checkin.get_owned(db, id=checkin_id, user_id=user.id)
         if not checkin:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Check-in not found."
             )
-        # Verify ownership of the parent system
-        await system_service.get_system_by_id(db, system_id=checkin.system_id, user=user)
         return checkin
 
     async def update_user_checkin(
@@ -54,7 +94,20 @@ class CheckinService:
         """
         checkin = await self.get_checkin_by_id(db, checkin_id=checkin_id, user=user)
         # get_checkin_by_id handles all ownership checks
-        return await crud_checkin.update(db, db_obj=checkin, obj_in=checkin_in)
+        previous = CheckinSnapshot(checkin)
+        async with unit_of_work(db):
+            checkin = await crud_checkin.update(db, db_obj=checkin, obj_in=checkin_in)
+            await streak_service.on_checkin_updated(
+                db,
+                checkin=checkin,
+                previous_status=previous.status,
+                previous_timestamp=previous.checkin_timestamp_utc,
+                timezone_name=user.timezone,
+            )
+            await rollup_service.on_checkin_updated(
+                db, checkin=checkin, previous=previous, timezone_name=user.timezone
+            )
+        return checkin
 
     async def delete_user_checkin(
         self, db: AsyncSession, *, checkin_id: uuid.UUID, user: UserModel
@@ -64,6 +117,10 @@ class CheckinService:
         """
         checkin = await self.get_checkin_by_id(db, checkin_id=checkin_id, user=user)
         # get_checkin_by_id handles all ownership checks
-        return await crud_checkin.remove(db, id=checkin.id)
+        async with unit_of_work(db):
+            await crud_checkin.remove_obj(db, db_obj=checkin)
+            await streak_service.on_checkin_deleted(db, checkin=checkin, timezone_name=user.timezone)
+            await rollup_service.on_checkin_deleted(db, checkin=checkin, timezone_name=user.timezone)
+        return checkin
 
-checkin_service = CheckinService() 
\ No newline at end of file
+checkin_service = CheckinService()
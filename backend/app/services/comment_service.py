@@ -1,87 +1,165 @@
 import uuid
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_comment, crud_goal, crud_checkin, crud_system
+from app.core.pagination import PageParams, encode_cursor
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_comment import comment as crud_comment
+from app.crud.crud_reflection import reflection as crud_reflection
+from app.crud.crud_user import user as crud_user
 from app.db.models.user import User as UserModel
-from app.db.models.comment import Comment
-from app.schemas.comment_schemas import CommentCreate, CommentUpdate
-from app.services.partnership_service import partnership_service
+from app.db.models.comment import Comment, CommentTargetType
+from app.schemas.comment_schemas import Comment as CommentSchema, CommentCreate, CommentUpdate
 
-class CommentService:
-    async def _get_item_owner_id(self, db: AsyncSession, *, goal_id: uuid.UUID = None, checkin_id: uuid.UUID = None) -> uuid.UUID:
-        """Private helper to get the ultimate owner of the item being commented on."""
-        if goal_id:
-            goal = await crud_goal.get(db, id=goal_id)
-            if not goal:
-                raise HTTPException(status.HTTP_404_NOT_FOUND, "Goal not found.")
-            return goal.user_id
-        if checkin_id:
-            checkin = await crud_checkin.get(db, id=checkin_id)
-            if not checkin:
-                raise HTTPException(status.HTTP_404_NOT_FOUND, "Checkin not found.")
-            
-            # To get the owner, we must traverse up from the checkin -> system -> goal
-            system = await crud_system.get(db, id=checkin.system_id)
-            if not system:
-                raise HTTPException(status.HTTP_404_NOT_FOUND, "Parent system not found.")
-            
-            goal = await crud_goal.get(db, id=system.goal_id)
-            if not goal:
-                raise HTTPException(status.HTTP_404_NOT_FOUND, "Parent goal not found.")
-
-            return goal.user_id
-        
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, "No item specified for comment.")
+def _build_tree(
+    rows: Sequence[Tuple[Comment, int]], root_parent_id: Optional[uuid.UUID]
+) -> List[Dict[str, Any]]:
+    """
+    Assemble the flat (comment, reply_count) rows of a thread into nested
+    nodes. Roots are the comments whose parent is `root_parent_id`; siblings
+    are ordered oldest first.
+    """
+    nodes: Dict[uuid.UUID, Dict[str, Any]] = {}
+    for comment, reply_count in sorted(rows, key=lambda row: (row[0].created_at, row[0].id)):
+        node = CommentSchema.model_validate(comment, from_attributes=True).model_dump()
+        node["reply_count"] = reply_count
+        node["replies"] = []
+        nodes[comment.id] = node
 
-    async def _verify_item_access(self, db: AsyncSession, *, owner_id: uuid.UUID, current_user: UserModel):
-        """Private helper to verify if the current user can access an item."""
-        if owner_id == current_user.id:
-            return  # User owns the item
+    roots = []
+    for node in nodes.values():
+        parent_id = node["parent_comment_id"]
+        if parent_id == root_parent_id:
+            roots.append(node)
+        elif parent_id in nodes:
+            nodes[parent_id]["replies"].append(node)
+    return roots
 
-        active_partnership = await partnership_service.get_active_partnership(db, user=current_user)
-        if not active_partnership:
-            raise HTTPException(status.HTTP_403_FORBIDDEN, "You do not have access to this item.")
+class CommentService:
+    async def _get_target_owner_id(
+        self, db: AsyncSession, *, target_type: CommentTargetType, target_id: uuid.UUID
+    ) -> uuid.UUID:
+        """Private helper to get the owner of the item being commented on."""
+        if target_type == CommentTargetType.CHECKIN:
+            target = await crud_checkin.get(db, id=target_id)
+        elif target_type == CommentTargetType.REFLECTION:
+            target = await crud_reflection.get(db, id=target_id)
+        else:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Comments on this item type are not supported.")
+        if not target:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Item not found.")
+        return target.user_id
 
-        partner_id = (
-            active_partnership.approver_id
-            if current_user.id == active_partnership.requester_id
-            else active_partnership.requester_id
-        )
+    async def _verify_target_access(
+        self, db: AsyncSession, *, target_type: CommentTargetType, target_id: uuid.UUID, user: UserModel
+    ) -> None:
+        """Private helper to check the user owns the item or is the owner's partner."""
+        owner_id = await self._get_target_owner_id(db, target_type=target_type, target_id=target_id)
+        if owner_id == user.id:
+            return
+        if user.current_partnership_id:
+            partner = await crud_user.get_partner_summary(
+                db, user_id=user.id, partnership_id=user.current_partnership_id
+            )
+            if partner and partner.id == owner_id:
+                return
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "You do not have access to this item.")
 
-        if owner_id != partner_id:
-            raise HTTPException(status.HTTP_403_FORBIDDEN, "You do not have access to this item.")
+    async def _get_own_comment(self, db: AsyncSession, *, comment_id: uuid.UUID, user: UserModel) -> Comment:
+        comment = await crud_comment.get(db, id=comment_id)
+        if not comment:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Comment not found.")
+        if comment.user_id != user.id:
+            raise HTTPException(status.HTTP_403_FORBIDDEN, "You can only change your own comments.")
+        return comment
 
     async def create_comment(self, db: AsyncSession, *, comment_in: CommentCreate, user: UserModel) -> Comment:
-        owner_id = await self._get_item_owner_id(db, goal_id=comment_in.goal_id, checkin_id=comment_in.checkin_id)
-        await self._verify_item_access(db, owner_id=owner_id, current_user=user)
+        await self._verify_target_access(
+            db, target_type=comment_in.target_type, target_id=comment_in.target_id, user=user
+        )
+        if comment_in.parent_comment_id is not None:
+            parent = await crud_comment.get(db, id=comment_in.parent_comment_id)
+            if (
+                not parent
+                or parent.target_type != comment_in.target_type
+                or parent.target_id != comment_in.target_id
+            ):
+                raise HTTPException(status.HTTP_404_NOT_FOUND, "Parent comment not found on this item.")
         return await crud_comment.create(db, obj_in=comment_in, user_id=user.id)
 
-    async def get_comments_for_goal(self, db: AsyncSession, *, goal_id: uuid.UUID, user: UserModel) -> List[Comment]:
-        owner_id = await self._get_item_owner_id(db, goal_id=goal_id)
-        await self._verify_item_access(db, owner_id=owner_id, current_user=user)
-        return await crud_comment.get_multi_by_goal(db, goal_id=goal_id)
+    async def get_comment_page(
+        self,
+        db: AsyncSession,
+        *,
+        target_type: CommentTargetType,
+        target_id: uuid.UUID,
+        user: UserModel,
+        page: PageParams,
+        replies_per_comment: int,
+    ) -> Dict[str, Any]:
+        """
+        One page of top-level comments on an item, oldest first, each with
+        its first `replies_per_comment` replies (and theirs) nested under it.
+        Loaded in a single query however many comments the page holds.
+        """
+        await self._verify_target_access(db, target_type=target_type, target_id=target_id, user=user)
+        rows = await crud_comment.get_thread(
+            db,
+            target_type=target_type,
+            target_id=target_id,
+            page=page,
+            replies_per_comment=replies_per_comment,
+        )
+        roots = _build_tree(rows, None)
+        next_cursor = None
+        if len(roots) > page.limit:
+            roots = roots[:page.limit]
+            next_cursor = encode_cursor(roots[-1]["created_at"], roots[-1]["id"])
+        return {"items": roots, "next_cursor": next_cursor}
 
-    async def get_comments_for_checkin(self, db: AsyncSession, *, checkin_id: uuid.UUID, user: UserModel) -> List[Comment]:
-        owner_id = await self._get_item_owner_id(db, checkin_id=checkin_id)
-        await self._verify_item_access(db, owner_id=owner_id, current_user=user)
-        return await crud_comment.get_multi_by_checkin(db, checkin_id=checkin_id)
+    async def get_thread(
+        self, db: AsyncSession, *, target_type: CommentTargetType, target_id: uuid.UUID, user: UserModel
+    ) -> List[Dict[str, Any]]:
+        """
+        Every comment on an item as a tree, loaded in a single query.
+        """
+        await self._verify_target_access(db, target_type=target_type, target_id=target_id, user=user)
+        rows = await crud_comment.get_thread(db, target_type=target_type, target_id=target_id)
+        return _build_tree(rows, None)
 
-    async def update_comment(self, db: AsyncSession, *, comment_id: uuid.UUID, comment_in: CommentUpdate, user: UserModel) -> Comment:
-        comment = await crud_comment.get(db, id=comment_id)
-        if not comment:
+    async def get_replies(
+        self, db: AsyncSession, *, comment_id: uuid.UUID, user: UserModel, page: PageParams, replies_per_comment: int
+    ) -> Dict[str, Any]:
+        """
+        One page of the direct replies to a comment, each with its first
+        replies nested, for expanding a branch the page view cut short.
+        """
+        parent = await crud_comment.get(db, id=comment_id)
+        if not parent:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Comment not found.")
-        if comment.user_id != user.id:
-            raise HTTPException(status.HTTP_403_FORBIDDEN, "You can only edit your own comments.")
+        await self._verify_target_access(db, target_type=parent.target_type, target_id=parent.target_id, user=user)
+        rows = await crud_comment.get_thread(
+            db,
+            target_type=parent.target_type,
+            target_id=parent.target_id,
+            parent_id=parent.id,
+            page=page,
+            replies_per_comment=replies_per_comment,
+        )
+        replies = _build_tree(rows, parent.id)
+        next_cursor = None
+        if len(replies) > page.limit:
+            replies = replies[:page.limit]
+            next_cursor = encode_cursor(replies[-1]["created_at"], replies[-1]["id"])
+        return {"items": replies, "next_cursor": next_cursor}
+
+    async def update_comment(self, db: AsyncSession, *, comment_id: uuid.UUID, comment_in: CommentUpdate, user: UserModel) -> Comment:
+        comment = await self._get_own_comment(db, comment_id=comment_id, user=user)
         return await crud_comment.update(db, db_obj=comment, obj_in=comment_in)
 
     async def delete_comment(self, db: AsyncSession, *, comment_id: uuid.UUID, user: UserModel) -> Comment:
-        comment = await crud_comment.get(db, id=comment_id)
-        if not comment:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, "Comment not found.")
-        if comment.user_id != user.id:
-            raise HTTPException(status.HTTP_403_FORBIDDEN, "You can only delete your own comments.")
-        return await crud_comment.remove(db, id=comment_id)
+        comment = await self._get_own_comment(db, comment_id=comment_id, user=user)
+        return await crud_comment.remove_obj(db, db_obj=comment)
 
-comment_service = CommentService() 
\ No newline at end of file
+comment_service = CommentService()
@@ -0,0 +1,94 @@
+from datetime import date
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.local_time import local_day_bounds, local_today, resolve_timezone, weekday_name
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_system import system as crud_system
+from app.db.models.checkin import CheckinStatus
+from app.schemas.dashboard_schemas import (
+    Dashboard, DashboardStreak, DashboardSystem, ReflectionPrompt, VerificationAlert
+)
+from app.schemas.user_schemas import UserPrincipal
+from app.services.streak_service import live_streak, streak_service
+
+# How a system's latest check-in of the day is shown on the dashboard.
+SYSTEM_STATUS_LABELS = {
+    None: "Pending",
+    CheckinStatus.COMPLETED: "Completed",
+    CheckinStatus.VERIFIED_COMPLETED: "Completed",
+    CheckinStatus.SKIPPED: "Skipped",
+    CheckinStatus.PENDING_VERIFICATION: "Awaiting Verification",
+    CheckinStatus.QUERIED_BY_PARTNER: "Queried by Partner",
+}
+
+DAILY_REFLECTION_PROMPTS = [
+    ReflectionPrompt(id="prompt_1", text="What are you most grateful for today?"),
+    ReflectionPrompt(id="prompt_2", text="What challenge did you overcome?"),
+    ReflectionPrompt(id="prompt_3", text="How did you support your partner today?"),
+]
+
+MAX_VERIFICATION_ALERTS = 20
+
+class DashboardService:
+    async def get_dashboard(
+        self, db: AsyncSession, *, user: UserPrincipal, day: Optional[date] = None
+    ) -> Dashboard:
+        """
+        Build the dashboard for the user's local "today" (or `day`).
+        Runs a fixed number of aggregate queries (three, or two without a
+        partnership) no matter how many systems or check-ins the user has.
+        """
+        tz = resolve_timezone(user.timezone)
+        day = day or local_today(tz)
+        day_start, day_end = local_day_bounds(day, tz)
+
+        system_rows = await crud_system.get_due_on_day_with_latest_checkin(
+            db, user_id=user.id, weekday=weekday_name(day), day_start=day_start, day_end=day_end
+        )
+        systems_for_today = [
+            DashboardSystem(
+                id=row.id,
+                name=row.title,
+                status=SYSTEM_STATUS_LABELS[row.checkin_status],
+                details=row.checkin_notes or row.description,
+                schedule_time=row.target_time_local,
+                current_streak=live_streak(row, day),
+            )
+            for row in system_rows
+        ]
+
+        current_streak, longest_streak = await streak_service.get_user_streak(db, user_id=user.id, today=day)
+
+        pending_verification_count, verification_alerts = 0, []
+        if user.current_partnership_id:
+            pending_verification_count, pending_rows = await crud_checkin.get_pending_verifications(
+                db,
+                partnership_id=user.current_partnership_id,
+                verifier_id=user.id,
+                limit=MAX_VERIFICATION_ALERTS,
+            )
+            verification_alerts = [
+                VerificationAlert(
+                    id=row.id,
+                    system_id=row.system_id,
+                    system_name=row.system_title,
+                    checked_in_at=row.checkin_timestamp_utc,
+                    message="Your partner has marked this as complete. Please verify.",
+                )
+                for row in pending_rows
+            ]
+
+        return Dashboard(
+            date=day,
+            timezone=tz.key,
+            user_greeting_name=user.name or user.username or user.email,
+            streak=DashboardStreak(current_streak=current_streak, longest_streak=longest_streak),
+            pending_verification_count=pending_verification_count,
+            pending_systems_count=sum(1 for row in system_rows if row.checkin_status is None),
+            systems_for_today=systems_for_today,
+            daily_reflection_prompts=DAILY_REFLECTION_PROMPTS,
+            verification_alerts=verification_alerts,
+        )
+
+dashboard_service = DashboardService()
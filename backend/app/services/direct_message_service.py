@@ -1,20 +1,35 @@
- import uuid
-from typing import List
+import uuid
+from typing import Any, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_direct_message
+from app.core.pagination import PageParams
+from app.crud.crud_direct_message import direct_message as crud_direct_message
 from app.db.models.user import User as UserModel
-from app.schemas.direct_message_schemas import DirectMessageCreate, DirectMessage
+from app.db.unit_of_work import unit_of_work
+from app.schemas.direct_message_schemas import DirectMessageCreate, DirectMessage, ReadReceipt
 from app.services.partnership_service import partnership_service
+from app.services.realtime_service import realtime_service
 
 class DirectMessageService:
+    async def verify_member(self, db: AsyncSession, *, partnership_id: uuid.UUID, user: UserModel) -> None:
+        """
+        The user may only read a conversation of their active partnership.
+        """
+        active_partnership = await partnership_service.get_active_partnership(db, user=user)
+        if not active_partnership or active_partnership.id != partnership_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not authorized to view this conversation."
+            )
+
     async def send_message(
         self, db: AsyncSession, *, message_in: DirectMessageCreate, sender: UserModel
     ) -> DirectMessage:
         """
         Send a direct message to a partner.
-        Verifies that an active partnership exists and the message is valid.
+        Verifies that an active partnership exists and the message is valid,
+        then pushes it to connected clients once committed.
         """
         # 1. Get the sender's active partnership
         active_partnership = await partnership_service.get_active_partnership(db, user=sender)
@@ -31,39 +46,50 @@ class DirectMessageService:
                 detail="You can only send messages within your active partnership."
             )
 
-        # 3. Verify the recipient is the sender's partner
-        partner_id = (
-            active_partnership.approver_id
-            if sender.id == active_partnership.requester_id
-            else active_partnership.requester_id
-        )
-        if message_in.recipient_id != partner_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only send messages to your partner."
+        # 3. If all checks pass, create the message and push it to the partnership
+        async with unit_of_work(db):
+            message = await crud_direct_message.create(db, obj_in=message_in, sender_id=sender.id)
+            await realtime_service.publish_partnership_event(
+                db,
+                partnership_id=message.partnership_id,
+                type="message.created",
+                data=DirectMessage.model_validate(message, from_attributes=True),
             )
-
-        # 4. If all checks pass, create the message
-        return await crud_direct_message.create(db, obj_in=message_in, sender_id=sender.id)
+        return message
 
 
     async def get_conversation(
-        self, db: AsyncSession, *, partnership_id: uuid.UUID, user: UserModel
-    ) -> List[DirectMessage]:
+        self, db: AsyncSession, *, partnership_id: uuid.UUID, user: UserModel, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Get the conversation history for a partnership.
+        Get one page of the conversation history for a partnership.
         Verifies the user is part of the partnership.
         """
-        # 1. Get the user's active partnership
-        active_partnership = await partnership_service.get_active_partnership(db, user=user)
-        if not active_partnership or active_partnership.id != partnership_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not authorized to view this conversation."
+        await self.verify_member(db, partnership_id=partnership_id, user=user)
+        return await crud_direct_message.get_multi_by_partnership(db, partnership_id=partnership_id, page=page)
+
+    async def mark_read_up_to(
+        self, db: AsyncSession, *, partnership_id: uuid.UUID, up_to_message_id: uuid.UUID, user: UserModel
+    ) -> Dict[str, int]:
+        """
+        Mark every message the user received in the partnership, up to and
+        including `up_to_message_id`, as read in one UPDATE, and tell the
+        partner's connected clients.
+        """
+        await self.verify_member(db, partnership_id=partnership_id, user=user)
+
+        async with unit_of_work(db):
+            marked = await crud_direct_message.mark_read_up_to(
+                db, partnership_id=partnership_id, reader_id=user.id, message_id=up_to_message_id
             )
-        
-        # 2. Fetch messages
-        return await crud_direct_message.get_multi_by_partnership(db, partnership_id=partnership_id)
+            if marked:
+                await realtime_service.publish_partnership_event(
+                    db,
+                    partnership_id=partnership_id,
+                    type="messages.read",
+                    data=ReadReceipt(reader_id=user.id, up_to_message_id=up_to_message_id),
+                )
+        return {"marked_read": marked}
 
 
 direct_message_service = DirectMessageService()
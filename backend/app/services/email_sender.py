@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+from app.core.config import settings
+from app.crud.crud_email_outbox import email_outbox as crud_email_outbox
+from app.db.models.email_outbox import EmailOutbox, EmailStatus
+from app.db.session import SessionLocal
+from app.services.email_transport import (
+    EmailDeliveryError, EmailTransport, OutgoingEmail, TransientEmailError, build_transport
+)
+
+logger = logging.getLogger(__name__)
+
+class EmailOutboxSender:
+    """
+    Background worker that delivers the email outbox.
+
+    Each round claims a batch of due messages (see
+    `crud_email_outbox.claim_due`), splits it into transport-sized chunks
+    sent concurrently, and records the outcome of every message in one
+    executemany UPDATE. A chunk that fails transiently is retried right away
+    with exponential backoff (tenacity); if it still fails, its messages go
+    back to the outbox with a growing delay until `max_attempts`, after which
+    they are marked failed. Nothing here runs on a request's event-loop turn:
+    requests only insert outbox rows and `wake` the sender after commit.
+    """
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+        transport_factory: Callable[[], EmailTransport] = build_transport,
+        batch_size: int = settings.EMAIL_BATCH_SIZE,
+        concurrency: int = settings.EMAIL_SEND_CONCURRENCY,
+        poll_interval: float = settings.EMAIL_POLL_INTERVAL_SECONDS,
+        retry_attempts: int = settings.EMAIL_SEND_RETRY_ATTEMPTS,
+        retry_base_seconds: float = settings.EMAIL_RETRY_BASE_SECONDS,
+        max_attempts: int = settings.EMAIL_MAX_ATTEMPTS,
+        lease_seconds: int = settings.EMAIL_LEASE_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.transport_factory = transport_factory
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.retry_attempts = retry_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.transport: Optional[EmailTransport] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """
+        Start the worker. The transport is built by the first round, so a
+        misconfigured transport leaves mail queued and logs an error each
+        round instead of failing startup.
+        """
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._worker = asyncio.create_task(self._run(), name="email-outbox-sender")
+
+    async def stop(self) -> None:
+        """
+        Stop the worker. Messages it had claimed but not settled are picked
+        up again once their lease expires.
+        """
+        if not self.running:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def wake(self) -> None:
+        """
+        Start the next round now instead of at the next poll. Registered with
+        `run_after_commit` by code that queues email.
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Email outbox round failed.")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def run_once(self) -> int:
+        """
+        Claim and deliver one batch of due messages. Returns how many were claimed.
+        """
+        if self.transport is None:
+            self.transport = self.transport_factory()
+        async with self.session_factory() as db:
+            claimed = await crud_email_outbox.claim_due(
+                db, limit=self.batch_size, lease_seconds=self.lease_seconds, max_attempts=self.max_attempts
+            )
+        if not claimed:
+            return 0
+
+        size = self.transport.max_batch_size
+        chunks = [claimed[i:i + size] for i in range(0, len(claimed), size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(chunk: List[EmailOutbox]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._deliver(chunk)
+
+        results = await asyncio.gather(*(deliver(chunk) for chunk in chunks))
+        async with self.session_factory() as db:
+            await crud_email_outbox.update_many_by_id(db, rows=[row for rows in results for row in rows])
+        return len(claimed)
+
+    async def _send_with_retry(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.retry_attempts),
+            wait=wait_exponential_jitter(initial=0.5, max=8),
+            retry=retry_if_exception_type(TransientEmailError),
+            reraise=True,
+        ):
+            with attempt:
+                return await self.transport.send_batch(messages)
+
+    async def _deliver(self, chunk: List[EmailOutbox]) -> List[Dict[str, Any]]:
+        """
+        Send one chunk and return the outbox updates describing the outcome.
+        """
+        messages = [
+            OutgoingEmail(id=row.id, sender=_sender_address(), to=row.to_address, subject=row.subject, html=row.html)
+            for row in chunk
+        ]
+        try:
+            provider_ids = await self._send_with_retry(messages)
+        except EmailDeliveryError as e:
+            return [self._failure(row, e) for row in chunk]
+        except Exception as e:
+            # A transport bug or an unexpected response must not lose the
+            # outcomes of the other chunks in this round.
+            logger.exception("Unexpected error sending %d emails.", len(chunk))
+            return [self._failure(row, e) for row in chunk]
+
+        now = datetime.now(timezone.utc)
+        self.sent += len(chunk)
+        return [
+            {"id": row.id, "status": EmailStatus.SENT, "sent_at": now, "provider_message_id": provider_id, "last_error": None}
+            for row, provider_id in zip(chunk, provider_ids)
+        ]
+
+    def _failure(self, row: EmailOutbox, error: Exception) -> Dict[str, Any]:
+        # Only the transport's permanent errors are final; anything else,
+        # including unexpected errors, is retried until `max_attempts`.
+        retryable = isinstance(error, TransientEmailError) or not isinstance(error, EmailDeliveryError)
+        if retryable and row.attempts < self.max_attempts:
+            self.retried += 1
+            delay = self.retry_base_seconds * 2 ** (row.attempts - 1)
+            logger.warning("Email %s failed (attempt %d), retrying in %.0fs: %s", row.id, row.attempts, delay, error)
+            return {
+                "id": row.id,
+                "next_attempt_at": datetime.now(timezone.utc) + timedelta(seconds=delay),
+                "last_error": str(error),
+            }
+        self.failed += 1
+        logger.error("Email %s failed permanently after %d attempts: %s", row.id, row.attempts, error)
+        return {"id": row.id, "status": EmailStatus.FAILED, "last_error": str(error)}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "transport": self.transport.name if self.transport else None,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+def _sender_address() -> str:
+    return settings.EMAIL_FROM or f"{settings.PROJECT_NAME} <onboarding@resend.dev>"
+
+email_sender = EmailOutboxSender()
@@ -1,46 +1,52 @@
-import resend
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.config import settings
+from app.crud.crud_email_outbox import email_outbox as crud_email_outbox
+from app.db.models.email_outbox import EmailOutbox
+from app.db.unit_of_work import run_after_commit
+from app.services.email_sender import email_sender
 
 class EmailService:
-    def __init__(self):
-        if not settings.RESEND_API_KEY:
-            raise ValueError("RESEND_API_KEY is not configured.")
-        resend.api_key = settings.RESEND_API_KEY
+    """
+    Renders emails and queues them in the outbox. Nothing is sent from the
+    request: the row is written in the caller's transaction and the
+    background sender (app/services/email_sender.py) delivers it once that
+    transaction commits.
+    """
+    async def _queue(self, db: AsyncSession, *, kind: str, email_to: str, subject: str, html: str) -> EmailOutbox:
+        queued = await crud_email_outbox.create(
+            db, obj_in={"kind": kind, "to_address": email_to, "subject": subject, "html": html}
+        )
+        await run_after_commit(db, email_sender.wake)
+        return queued
 
-    def send_partnership_invite_email(
+    async def queue_partnership_invite_email(
         self,
+        db: AsyncSession,
         *,
         email_to: str,
         requester_name: str,
         invite_token: str
-    ):
+    ) -> EmailOutbox:
         """
-        Sends an email to a potential partner with an invitation link.
+        Queues an email to a potential partner with an invitation link.
         """
         project_name = settings.PROJECT_NAME
         # The frontend will have a specific page to handle this token
         accept_url = f"{settings.FRONTEND_URL}/partner-invite/accept?token={invite_token}"
 
-        try:
-            params = {
-                "from": f"{project_name} <onboarding@resend.dev>",
-                "to": [email_to],
-                "subject": f"You're invited to be a partner on {project_name}!",
-                "html": f"""
-                    <p>Hi,</p>
-                    <p><b>{requester_name}</b> has invited you to become their accountability partner on {project_name}.</p>
-                    <p>Click the link below to accept the invitation:</p>
-                    <a href="{accept_url}">Accept Invitation</a>
-                    <p>If you did not expect this, you can safely ignore this email.</p>
-                """,
-            }
-            email = resend.Emails.send(params)
-            print(f"Partnership invitation sent to {email_to}. Email ID: {email['id']}")
-            return email
-        except Exception as e:
-            print(f"Error sending email to {email_to}: {e}")
-            # In a real app, you'd want more robust error handling/logging here
-            raise
+        return await self._queue(
+            db,
+            kind="partnership_invite",
+            email_to=email_to,
+            subject=f"You're invited to be a partner on {project_name}!",
+            html=f"""
+                <p>Hi,</p>
+                <p><b>{requester_name}</b> has invited you to become their accountability partner on {project_name}.</p>
+                <p>Click the link below to accept the invitation:</p>
+                <a href="{accept_url}">Accept Invitation</a>
+                <p>If you did not expect this, you can safely ignore this email.</p>
+            """,
+        )
 
-email_service = EmailService() 
\ No newline at end of file
+email_service = EmailService()
@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import smtplib
+import uuid
+from dataclasses import dataclass
+from email.message import EmailMessage
+from pathlib import Path
+from typing import List, Sequence
+
+from app.core.config import Settings, settings
+from app.core.providers import ProviderRegistry
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    id: uuid.UUID
+    sender: str
+    to: str
+    subject: str
+    html: str
+
+class EmailDeliveryError(Exception):
+    """
+    A batch could not be delivered and retrying it as-is will not help.
+    """
+
+class TransientEmailError(EmailDeliveryError):
+    """
+    A batch could not be delivered but may succeed if retried (network
+    errors, rate limits, provider outages).
+    """
+
+class EmailTransport:
+    """
+    Delivers batches of emails. `send_batch` returns one provider message ID
+    per email, in order, or raises for the batch as a whole.
+    """
+    name = "base"
+    max_batch_size = 1
+
+    async def send_batch(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        raise NotImplementedError
+
+class ResendTransport(EmailTransport):
+    """
+    Sends through Resend's batch endpoint, up to 100 emails per request.
+    The SDK is synchronous, so each request runs in a worker thread. The
+    idempotency key is derived from the outbox IDs, so a retried batch is
+    never delivered twice.
+    """
+    name = "resend"
+    max_batch_size = 100
+
+    # Resend answers these with a retryable error.
+    _TRANSIENT_CODES = {"429", "500", "502", "503", "504"}
+
+    def __init__(self, api_key: str | None):
+        if not api_key:
+            raise ValueError("RESEND_API_KEY is not configured.")
+        # Imported here so the SDK only loads when Resend is the transport.
+        import resend
+
+        resend.api_key = api_key
+        self._resend = resend
+
+    async def send_batch(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        params = [
+            {"from": m.sender, "to": [m.to], "subject": m.subject, "html": m.html}
+            for m in messages
+        ]
+        idempotency_key = hashlib.sha256(b"".join(m.id.bytes for m in messages)).hexdigest()
+        try:
+            response = await asyncio.to_thread(
+                self._resend.Batch.send, params, {"idempotency_key": idempotency_key}
+            )
+        except self._resend.exceptions.ResendError as e:
+            if str(e.code) in self._TRANSIENT_CODES:
+                raise TransientEmailError(str(e)) from e
+            raise EmailDeliveryError(str(e)) from e
+        except (OSError, ConnectionError) as e:
+            raise TransientEmailError(str(e)) from e
+        return [sent["id"] for sent in response["data"]]
+
+class SmtpTransport(EmailTransport):
+    """
+    Sends over plain SMTP, one connection per batch. Meant for a local
+    catcher such as MailHog in development.
+    """
+    name = "smtp"
+    max_batch_size = 50
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+
+    def _send(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            for message in messages:
+                smtp.send_message(_to_mime(message))
+        return [f"smtp:{message.id}" for message in messages]
+
+    async def send_batch(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        try:
+            return await asyncio.to_thread(self._send, messages)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError) as e:
+            raise TransientEmailError(str(e)) from e
+        except smtplib.SMTPException as e:
+            raise EmailDeliveryError(str(e)) from e
+
+class FileTransport(EmailTransport):
+    """
+    Writes every email to `directory` as `<outbox id>.eml` instead of
+    sending it. Used in tests and local development.
+    """
+    name = "file"
+    max_batch_size = 100
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def _write(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for message in messages:
+            path = self.directory / f"{message.id}.eml"
+            path.write_bytes(bytes(_to_mime(message)))
+            paths.append(f"file:{path}")
+        return paths
+
+    async def send_batch(self, messages: Sequence[OutgoingEmail]) -> List[str]:
+        return await asyncio.to_thread(self._write, messages)
+
+def _to_mime(message: OutgoingEmail) -> EmailMessage:
+    mime = EmailMessage()
+    mime["From"] = message.sender
+    mime["To"] = message.to
+    mime["Subject"] = message.subject
+    mime["Message-ID"] = f"<{message.id}@duotrak>"
+    mime.set_content(message.html, subtype="html")
+    return mime
+
+# Email transports, selected by EMAIL_TRANSPORT. Factories take the settings.
+email_transports: ProviderRegistry[EmailTransport] = ProviderRegistry("email transport")
+email_transports.register("resend", lambda *, config: ResendTransport(config.RESEND_API_KEY))
+email_transports.register("smtp", lambda *, config: SmtpTransport(config.SMTP_HOST, config.SMTP_PORT))
+email_transports.register("file", lambda *, config: FileTransport(config.EMAIL_FILE_DIR))
+
+def build_transport(config: Settings = settings) -> EmailTransport:
+    """
+    The transport selected by EMAIL_TRANSPORT.
+    """
+    return email_transports.create(config.EMAIL_TRANSPORT, config=config)
@@ -0,0 +1,83 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+FAKE_PLAN = """1.  **System Title:** Three Easy Runs a Week
+    - **Description:** Run for 20-30 minutes at a conversational pace on three non-consecutive days.
+    - **Metric:** Counter (runs)
+2.  **System Title:** Sunday Long Run
+    - **Description:** Add five minutes to your longest run every week.
+    - **Metric:** Duration (minutes)
+3.  **System Title:** Evening Kit Prep
+    - **Description:** Lay out your running kit the night before each run.
+    - **Metric:** Binary (Done/Not Done)
+"""
+
+FAKE_PLAN_JSON = json.dumps({"systems": [
+    {
+        "title": "Three Easy Runs a Week",
+        "description": "Run for 20-30 minutes at a conversational pace on three non-consecutive days.",
+        "metric_type": "counter",
+        "frequency": "weekly",
+    },
+    {
+        "title": "Sunday Long Run",
+        "description": "Add five minutes to your longest run every week.",
+        "metric_type": "duration",
+        "frequency": "weekly",
+    },
+    {
+        "title": "Evening Kit Prep",
+        "description": "Lay out your running kit the night before each run.",
+        "metric_type": "binary",
+        "frequency": "daily",
+    },
+]})
+
+@dataclass
+class FakeChunk:
+    text: str
+
+class FakeStream:
+    def __init__(self, chunks: List[str], first_chunk_delay: float, chunk_delay: float):
+        self._chunks = chunks
+        self._first_chunk_delay = first_chunk_delay
+        self._chunk_delay = chunk_delay
+
+    async def __aiter__(self) -> AsyncIterator[FakeChunk]:
+        for i, text in enumerate(self._chunks):
+            await asyncio.sleep(self._first_chunk_delay if i == 0 else self._chunk_delay)
+            yield FakeChunk(text)
+
+class FakeStreamingModel:
+    """
+    Offline stand-in for `genai.GenerativeModel` with the same
+    `generate_content_async` interface. It returns a canned plan split into
+    line-sized chunks, with a delay before the first chunk and between the
+    others, so time-to-first-byte and cancellation can be tested without an
+    API key. Asked for JSON (`response_mime_type`), it answers with
+    `plan_json` instead. Selected with AI_PLANNER_PROVIDER=fake.
+    """
+    def __init__(
+        self,
+        *,
+        first_chunk_delay: float = 0.5,
+        chunk_delay: float = 0.2,
+        plan_text: str = FAKE_PLAN,
+        plan_json: str = FAKE_PLAN_JSON,
+    ):
+        self.first_chunk_delay = first_chunk_delay
+        self.chunk_delay = chunk_delay
+        self.chunks = plan_text.splitlines(keepends=True)
+        self.plan_json = plan_json
+        self.calls = 0
+
+    async def generate_content_async(self, contents: str, *, stream: bool = False, generation_config: Optional[Dict[str, Any]] = None):
+        self.calls += 1
+        if stream:
+            return FakeStream(self.chunks, self.first_chunk_delay, self.chunk_delay)
+        await asyncio.sleep(self.first_chunk_delay + self.chunk_delay * (len(self.chunks) - 1))
+        if (generation_config or {}).get("response_mime_type") == "application/json":
+            return FakeChunk(self.plan_json)
+        return FakeChunk("".join(self.chunks))
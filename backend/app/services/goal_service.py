@@ -1,8 +1,9 @@
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.pagination import PageParams
 from app.crud.crud_goal import goal as crud_goal
 from app.db.models.goal import Goal
 from app.db.models.user import User as UserModel
@@ -10,12 +11,12 @@ from app.schemas.goal_schemas import GoalCreate, GoalUpdate
 
 class GoalService:
     async def get_user_goals(
-        self, db: AsyncSession, *, user: UserModel
-    ) -> List[Goal]:
+        self, db: AsyncSession, *, user: UserModel, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Retrieve all goals for the current user.
+        Retrieve one page of goals for the current user.
         """
-        return await crud_goal.get_multi_by_owner(db, user_id=user.id)
+        return await crud_goal.get_multi_by_owner(db, user_id=user.id, page=page)
 
     async def create_user_goal(
         self, db: AsyncSession, *, goal_in: GoalCreate, user: UserModel
@@ -31,8 +32,8 @@ class GoalService:
         """
         Retrieve a specific goal by its ID, ensuring it belongs to the current user.
         """
-        goal = await crud_goal.get(db, id=goal_id)
-        if not goal or goal.user_id != user.id:
+        goal = await crud_goal.get_owned(db, id=goal_id, user_id=user.id)
+        if not goal:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Goal not found."
@@ -57,6 +58,6 @@ class GoalService:
         """
         goal = await self.get_goal_by_id(db, goal_id=goal_id, user=user)
         # get_goal_by_id already handles the 404 case for us.
-        return await crud_goal.remove(db, id=goal.id)
+        return await crud_goal.remove_obj(db, db_obj=goal)
 
 goal_service = GoalService() 
\ No newline at end of file
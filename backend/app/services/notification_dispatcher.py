@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential_jitter
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.db.unit_of_work import run_after_commit
+from app.schemas.notification_schemas import NotificationCreate
+from app.services.notification_service import notification_service
+
+logger = logging.getLogger(__name__)
+
+NotificationRow = Dict[str, Any]
+
+class NotificationDispatcher:
+    """
+    In-process, batched writer for notifications.
+
+    Requests hand over notification rows with `notify`, which queues them
+    once the request's transaction commits, and return without touching the
+    notifications table. A single background worker collects rows from a
+    bounded queue for up to `flush_interval` seconds or `batch_size` rows
+    and writes each batch with multi-row INSERTs in its own session.
+
+    `publish` waits up to `enqueue_timeout` for each row that finds the
+    queue full; once a row times out, it writes that row and the rest
+    itself in one inline batch. It also writes inline when the worker is
+    not running. A slow database therefore pushes back on producers
+    instead of growing memory. `stop` drains whatever is still queued.
+
+    The worker retries a failed batch `write_attempts` times with
+    exponential backoff; inline writes get one attempt so the request is
+    not held up. A batch that still fails is logged, counted in
+    `rows_failed` and dropped: those notifications are lost. Failures are
+    never raised, since `publish` runs after the request has committed.
+    """
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+        max_queue_size: int = settings.NOTIFICATION_QUEUE_MAX_SIZE,
+        batch_size: int = settings.NOTIFICATION_BATCH_SIZE,
+        flush_interval: float = settings.NOTIFICATION_FLUSH_INTERVAL_SECONDS,
+        enqueue_timeout: float = settings.NOTIFICATION_ENQUEUE_TIMEOUT_SECONDS,
+        write_attempts: int = settings.NOTIFICATION_WRITE_ATTEMPTS,
+    ):
+        self.session_factory = session_factory
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.write_attempts = write_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.batches_written = 0
+        self.rows_written = 0
+        self.rows_written_inline = 0
+        self.rows_failed = 0
+        self.write_retries = 0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run(), name="notification-dispatcher")
+
+    async def stop(self, timeout: float = settings.NOTIFICATION_DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Wait up to `timeout` for queued rows to be written, then stop the worker.
+        """
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Notification dispatcher stopped with %d rows still queued.", self._queue.qsize())
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def notify(
+        self,
+        db: AsyncSession,
+        *,
+        notifications: Sequence[Union[NotificationCreate, Dict[str, Any]]],
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Entry point for code that produces notifications. With the dispatcher
+        enabled (NOTIFICATION_DISPATCHER_ENABLED, or `enabled`) the rows are
+        published after `db` commits and never if it rolls back; otherwise
+        they are inserted inline in `db`'s transaction.
+        """
+        rows = [n if isinstance(n, dict) else n.dict() for n in notifications]
+        if not rows:
+            return
+        if not (settings.NOTIFICATION_DISPATCHER_ENABLED if enabled is None else enabled):
+            await notification_service.create_notifications(db, notifications=rows)
+            return
+
+        async def publish_rows() -> None:
+            await self.publish(rows)
+
+        await run_after_commit(db, publish_rows)
+
+    async def publish(self, rows: Sequence[NotificationRow]) -> None:
+        """
+        Queue notification rows for the next batch. Rows that do not fit
+        within `enqueue_timeout` (or arrive while the worker is not running)
+        are written directly.
+        """
+        if not self.running:
+            await self._write(list(rows), inline=True)
+            return
+        for i, row in enumerate(rows):
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(self._queue.put(row), self.enqueue_timeout)
+                except asyncio.TimeoutError:
+                    await self._write(list(rows[i:]), inline=True)
+                    return
+
+    async def _next_batch(self) -> List[NotificationRow]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, rows: List[NotificationRow], *, inline: bool = False) -> None:
+        if not rows:
+            return
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(1 if inline else self.write_attempts),
+                wait=wait_exponential_jitter(initial=0.5, max=8),
+                reraise=True,
+            ):
+                with attempt:
+                    if attempt.retry_state.attempt_number > 1:
+                        self.write_retries += 1
+                    async with self.session_factory() as db:
+                        await notification_service.create_notifications(db, notifications=rows)
+        except Exception:
+            self.rows_failed += len(rows)
+            logger.exception("Failed to write a batch of %d notifications.", len(rows))
+            return
+        self.batches_written += 1
+        self.rows_written += len(rows)
+        if inline:
+            self.rows_written_inline += len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "batches_written": self.batches_written,
+            "rows_written": self.rows_written,
+            "rows_written_inline": self.rows_written_inline,
+            "rows_failed": self.rows_failed,
+            "write_retries": self.write_retries,
+        }
+
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,100 @@
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from app.core.pagination import PageParams
+from app.crud.crud_notification import notification as crud_notification
+from app.crud.crud_notification import notification_counter as crud_notification_counter
+from app.db.models.notification import Notification
+from app.db.models.user import User as UserModel
+from app.db.unit_of_work import unit_of_work
+from app.schemas.notification_schemas import Notification as NotificationSchema, NotificationCreate
+from app.services.target_resolver import TargetResolver
+
+class NotificationService:
+    """
+    Notifications and the per-user unread counter that goes with them. Every
+    write that changes what is unread also moves the counter in the same
+    transaction, so the counter can be served without counting rows.
+    """
+    async def create_notifications(
+        self, db: AsyncSession, *, notifications: Sequence[Union[NotificationCreate, Dict[str, Any]]]
+    ) -> List[Notification]:
+        """
+        Insert notifications with multi-row INSERTs and bump each recipient's
+        unread counter once.
+        """
+        rows = [n if isinstance(n, dict) else n.dict() for n in notifications]
+        if not rows:
+            return []
+        async with unit_of_work(db):
+            created = await crud_notification.create_many(db, objs_in=rows)
+            await crud_notification_counter.increment_many(
+                db, counts=Counter(row["recipient_id"] for row in rows if not row.get("is_read"))
+            )
+        return created
+
+    async def get_notifications(
+        self,
+        db: AsyncSession,
+        *,
+        user: UserModel,
+        unread_only: bool = False,
+        page: PageParams = PageParams(),
+        resolver: Optional[TargetResolver] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of the user's notifications, newest first, with their unread
+        count. With a `resolver`, each notification's target is attached,
+        loaded with one query per target type on the page.
+        """
+        result = await crud_notification.get_multi_by_recipient(
+            db, recipient_id=user.id, unread_only=unread_only, page=page
+        )
+        if resolver is not None:
+            # Load every target on the page up front; the lookups below are then memoized.
+            await resolver.resolve_many(
+                (n.target_type, n.target_id) for n in result["items"] if n.target_type and n.target_id
+            )
+            items = []
+            for n in result["items"]:
+                item = NotificationSchema.model_validate(n, from_attributes=True).model_dump()
+                if n.target_type and n.target_id:
+                    item["target"] = await resolver.resolve(n.target_type, n.target_id)
+                items.append(item)
+            result["items"] = items
+        result["unread_count"] = await crud_notification_counter.get_unread_count(db, user_id=user.id)
+        return result
+
+    async def get_unread_count(self, db: AsyncSession, *, user: UserModel) -> int:
+        return await crud_notification_counter.get_unread_count(db, user_id=user.id)
+
+    async def mark_notification_read(
+        self, db: AsyncSession, *, notification_id: uuid.UUID, user: UserModel
+    ) -> Notification:
+        """
+        Mark one of the user's notifications as read. Marking an already-read
+        notification again is a no-op that returns it unchanged.
+        """
+        notification = await crud_notification.mark_read(db, id=notification_id, recipient_id=user.id)
+        if notification:
+            return notification
+        notification = await crud_notification.get_owned(db, id=notification_id, user_id=user.id)
+        if not notification:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Notification not found."
+            )
+        return notification
+
+    async def mark_all_read(self, db: AsyncSession, *, user: UserModel) -> Dict[str, int]:
+        """
+        Mark all of the user's notifications as read in a single statement.
+        """
+        marked = await crud_notification.mark_all_read(db, recipient_id=user.id)
+        unread = await crud_notification_counter.get_unread_count(db, user_id=user.id)
+        return {"marked_read": marked, "unread_count": unread}
+
+notification_service = NotificationService()
@@ -0,0 +1,157 @@
+import heapq
+import itertools
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from fastapi import HTTPException, status
+
+from app.core.pagination import TimelinePageParams, encode_timeline_cursor
+from app.crud.base import CRUDBase
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_direct_message import direct_message as crud_direct_message
+from app.crud.crud_reflection import reflection as crud_reflection
+from app.crud.crud_user import user as crud_user
+from app.db.load_plans import load_plan
+from app.db.models.user import User as UserModel
+from app.schemas.partnership_schemas import PartnerFeedItemType
+
+@dataclass(frozen=True)
+class FeedSource:
+    """
+    One stream of the partner feed: which rows belong to it, the timestamp
+    it is ordered by (backed by a (owner, timestamp, id) index), and how a
+    row becomes a feed item.
+    """
+    type: PartnerFeedItemType
+    crud: CRUDBase
+    select: Callable[[uuid.UUID, uuid.UUID], Select]
+    sort_attr: str
+    to_item: Callable[[Any], Dict[str, Any]]
+    load_plan: Tuple[str, ...] = ()
+
+def _checkin_item(checkin: Any) -> Dict[str, Any]:
+    return {"title": checkin.system.title, "body": checkin.notes, "status": checkin.status.value}
+
+# Order matters: at equal timestamps, items from earlier sources come first.
+FEED_SOURCES: Tuple[FeedSource, ...] = (
+    FeedSource(
+        type=PartnerFeedItemType.CHECKIN,
+        crud=crud_checkin,
+        select=lambda partner_id, partnership_id: crud_checkin.select_by_user(partner_id),
+        sort_attr="created_at",
+        to_item=_checkin_item,
+        load_plan=("checkin.with_system",),
+    ),
+    FeedSource(
+        type=PartnerFeedItemType.VERIFICATION,
+        crud=crud_checkin,
+        select=lambda partner_id, partnership_id: crud_checkin.select_verified_by(partner_id),
+        sort_attr="verified_at_utc",
+        to_item=_checkin_item,
+        load_plan=("checkin.with_system",),
+    ),
+    FeedSource(
+        type=PartnerFeedItemType.REFLECTION,
+        crud=crud_reflection,
+        select=lambda partner_id, partnership_id: crud_reflection.select_owned(partner_id),
+        sort_attr="created_at",
+        to_item=lambda reflection: {
+            "title": reflection.prompt_text,
+            "body": reflection.content,
+        },
+    ),
+    FeedSource(
+        type=PartnerFeedItemType.MESSAGE,
+        crud=crud_direct_message,
+        select=lambda partner_id, partnership_id: crud_direct_message.select_sent_by(
+            partnership_id=partnership_id, sender_id=partner_id
+        ),
+        sort_attr="sent_at_utc",
+        to_item=lambda message: {"body": message.text_content or message.emoji_content},
+    ),
+)
+
+class PartnerFeedService:
+    async def _read_source(
+        self,
+        db: AsyncSession,
+        *,
+        rank: int,
+        source: FeedSource,
+        partner_id: uuid.UUID,
+        partnership_id: uuid.UUID,
+        page: TimelinePageParams,
+    ) -> List[Tuple[Tuple[Any, int, uuid.UUID], Dict[str, Any]]]:
+        """
+        Read the next `page.limit + 1` items of one source after the cursor.
+        The merged order is (timestamp desc, source rank, id desc), so after
+        a cursor at (t, r, i) a source ranked below r resumes at timestamps
+        <= t, one ranked above r at timestamps < t, and source r itself
+        strictly after (t, i).
+        """
+        before, include_ties = None, None
+        if page.after is not None:
+            after_at, after_type, after_id = page.after
+            after_rank = next(
+                (i for i, s in enumerate(FEED_SOURCES) if s.type.value == after_type), None
+            )
+            if after_rank is None:
+                raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid pagination cursor.")
+            before = (after_at, after_id)
+            if rank != after_rank:
+                include_ties = rank > after_rank
+
+        sort_column = getattr(source.crud.model, source.sort_attr)
+        statement = source.select(partner_id, partnership_id).options(*load_plan(*source.load_plan))
+        rows = await source.crud.get_timeline_slice(
+            db, statement, sort_column=sort_column, limit=page.limit + 1,
+            before=before, include_ties=include_ties,
+        )
+        entries = []
+        for row in rows:
+            occurred_at = getattr(row, source.sort_attr)
+            item = {"type": source.type, "id": row.id, "occurred_at": occurred_at, **source.to_item(row)}
+            # heapq.merge(reverse=True) wants every stream descending by this key.
+            entries.append(((occurred_at, -rank, row.id), item))
+        return entries
+
+    async def get_feed(
+        self, db: AsyncSession, *, user: UserModel, page: TimelinePageParams
+    ) -> Dict[str, Any]:
+        """
+        One page of the partner's activity, newest first: their check-ins,
+        the check-ins they verified, their reflections and the messages they
+        sent. Each source is read with its own keyset index scan, limited to
+        one page, and the streams are k-way merged in memory, so a page costs
+        the same however long the partnership has run.
+        """
+        partner = None
+        if user.current_partnership_id:
+            partner = await crud_user.get_partner_summary(
+                db, user_id=user.id, partnership_id=user.current_partnership_id
+            )
+        if not partner:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "No active partnership found.")
+
+        streams = [
+            await self._read_source(
+                db, rank=rank, source=source, partner_id=partner.id,
+                partnership_id=user.current_partnership_id, page=page,
+            )
+            for rank, source in enumerate(FEED_SOURCES)
+        ]
+
+        merged = list(itertools.islice(
+            heapq.merge(*streams, key=lambda entry: entry[0], reverse=True), page.limit + 1
+        ))
+        items = [item for _, item in merged]
+        next_cursor = None
+        if len(items) > page.limit:
+            items = items[:page.limit]
+            last = items[-1]
+            next_cursor = encode_timeline_cursor(last["occurred_at"], last["type"].value, last["id"])
+        return {"items": items, "next_cursor": next_cursor}
+
+partner_feed_service = PartnerFeedService()
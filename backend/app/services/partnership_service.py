@@ -1,15 +1,19 @@
 import uuid
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_partnership, crud_user
+from app.core.principal_cache import principal_cache
+from app.crud.crud_partnership import partnership as crud_partnership
+from app.crud.crud_user import user as crud_user
 from app.db.models.partnership import Partnership, PartnershipStatus
 from app.db.models.user import User as UserModel
-from app.schemas.partnership_schemas import PartnershipCreate, PartnershipUpdate
+from app.db.unit_of_work import unit_of_work
+from app.schemas.partnership_schemas import Partnership as PartnershipSchema, PartnershipCreate, PartnershipUpdate
 from app.services.email_service import email_service
+from app.services.realtime_service import PARTNERSHIP_TERMINATED, realtime_service
 
 class PartnershipService:
     async def send_request(
@@ -17,7 +21,7 @@ class PartnershipService:
     ) -> Partnership:
         """
         Send a partnership request to another user.
-        This now includes generating an invite token and sending an email.
+        This now includes generating an invite token and queueing an invitation email.
         """
         # The user being invited might not exist in our system yet.
         # We invite them by email.
@@ -48,22 +52,24 @@ class PartnershipService:
         # Generate a secure token for the invitation
         invite_token = secrets.token_urlsafe(32)
         expires_in_days = 7
-        invite_token_expires_at = datetime.utcnow() + timedelta(days=expires_in_days)
-
-        new_partnership = await crud_partnership.create(
-            db, 
-            obj_in=request_in, 
-            requester_id=requester.id,
-            invite_token=invite_token,
-            invite_token_expires_at=invite_token_expires_at
-        )
-
-        # Send the invitation email
-        email_service.send_partnership_invite_email(
-            email_to=request_in.invite_email,
-            requester_name=requester.name or requester.username,
-            invite_token=invite_token
-        )
+        invite_token_expires_at = datetime.now(timezone.utc) + timedelta(days=expires_in_days)
+
+        # The partnership and its invitation email commit together; the
+        # email is delivered from the outbox afterwards.
+        async with unit_of_work(db):
+            new_partnership = await crud_partnership.create(
+                db, 
+                obj_in=request_in, 
+                requester_id=requester.id,
+                invite_token=invite_token,
+                invite_token_expires_at=invite_token_expires_at
+            )
+            await email_service.queue_partnership_invite_email(
+                db,
+                email_to=request_in.invite_email,
+                requester_name=requester.name or requester.username,
+                invite_token=invite_token
+            )
 
         return new_partnership
 
@@ -100,27 +106,32 @@ class PartnershipService:
         if partnership.status != PartnershipStatus.PENDING_INVITE:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This request is no longer pending.")
 
-        if response.status == PartnershipStatus.ACTIVE:
-            # Mark the partnership as active
-            partnership.status = PartnershipStatus.ACTIVE
-            partnership.user2_id = approver.id # Link the second user
-            partnership.activated_at = datetime.utcnow()
-            partnership.invite_token = None # Invalidate token
-            partnership.invite_token_expires_at = None
+        # Every change below (partnership plus both users) is committed once.
+        async with unit_of_work(db):
+            if response.status == PartnershipStatus.ACTIVE:
+                # Mark the partnership as active
+                partnership.status = PartnershipStatus.ACTIVE
+                partnership.user2_id = approver.id # Link the second user
+                partnership.activated_at = datetime.now(timezone.utc)
+                partnership.invite_token = None # Invalidate token
+                partnership.invite_token_expires_at = None
             
-            # Assign partnership to both users
-            approver.current_partnership_id = partnership.id
-            requester = await crud_user.get(db, id=partnership.user1_id)
-            if requester:
-                requester.current_partnership_id = partnership.id
-                db.add(requester)
+                # Assign partnership to both users. The approver we were given is a
+                # detached principal, so load both rows to modify them.
+                for user_id in (approver.id, partnership.user1_id):
+                    partner_user = await crud_user.get(db, id=user_id)
+                    if partner_user:
+                        partner_user.current_partnership_id = partnership.id
+                        db.add(partner_user)
 
-            db.add(approver)
+            else: # If declined or other status
+                partnership.status = PartnershipStatus.DISSOLVED # Or a new 'DECLINED' status
 
-        else: # If declined or other status
-            partnership.status = PartnershipStatus.DISSOLVED # Or a new 'DECLINED' status
+            db.add(partnership)
 
-        return await crud_partnership.update(db, db_obj=partnership, obj_in=partnership)
+        principal_cache.invalidate_user(approver.id)
+        principal_cache.invalidate_user(partnership.user1_id)
+        return partnership
 
     async def accept_invite_with_token(
         self, db: AsyncSession, *, token: str, accepting_user: UserModel
@@ -136,7 +147,7 @@ class PartnershipService:
         if partnership.status != PartnershipStatus.PENDING_INVITE:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This invitation is no longer valid.")
 
-        if partnership.invite_token_expires_at < datetime.utcnow():
+        if partnership.invite_token_expires_at < datetime.now(timezone.utc):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This invitation has expired.")
 
         # All checks passed, accept the invite
@@ -155,13 +166,28 @@ class PartnershipService:
         if not partnership:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Partnership not found.")
 
-        if current_user.id not in [partnership.requester_id, partnership.approver_id]:
+        member_ids = [partnership.user1_id, partnership.user2_id]
+        if current_user.id not in member_ids:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not part of this partnership.")
         
-        if partnership.status != PartnershipStatus.ACCEPTED:
+        if partnership.status != PartnershipStatus.ACTIVE:
              raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot terminate a partnership that is not active.")
 
-        return await crud_partnership.remove(db, id=partnership_id)
+        removed = await crud_partnership.remove(db, id=partnership_id)
+        # current_partnership_id is nulled by the FK, so cached principals are stale.
+        for member_id in member_ids:
+            if member_id:
+                principal_cache.invalidate_user(member_id)
+        # Closes the members' open conversation sockets on every worker.
+        await realtime_service.publish_partnership_event(
+            db,
+            partnership_id=partnership_id,
+            type=PARTNERSHIP_TERMINATED,
+            data=PartnershipSchema.model_validate(removed, from_attributes=True).model_copy(
+                update={"status": PartnershipStatus.DISSOLVED}
+            ),
+        )
+        return removed
 
 
 partnership_service = PartnershipService() 
\ No newline at end of file
@@ -0,0 +1,306 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.local_time import WEEKDAY_NAMES, local_day_bounds, local_today, resolve_timezone
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_checkin_rollup import checkin_rollup as crud_checkin_rollup
+from app.crud.crud_streak import user_streak as crud_user_streak
+from app.crud.crud_system import system as crud_system
+from app.crud.crud_user import user as crud_user
+from app.db.models.system import SystemFrequency
+from app.schemas.progress_schemas import (
+    ConsistencyPoint, DateRangePreset, DayOfWeekConsistency, PartnerProfile, Progress,
+    ProgressStats, StatsSource, SystemEngagement, SystemSummary
+)
+from app.schemas.user_schemas import UserPrincipal
+from app.services.goal_service import goal_service
+from app.services.streak_service import live_streak
+
+# allTime and custom ranges are capped so the day grid stays small.
+MAX_RANGE_DAYS = 3660
+
+WEEKDAY_LABELS = ("Mondays", "Tuesdays", "Wednesdays", "Thursdays", "Fridays", "Saturdays", "Sundays")
+
+@dataclass
+class ProgressArrays:
+    """
+    Output of `compute_progress_arrays`. Leading axis is the owner (0 = the
+    user, 1 = the partner when comparing).
+    """
+    consistency_by_day: np.ndarray      # (owners, days) percentage, NaN when nothing was scheduled
+    consistency_by_weekday: np.ndarray  # (owners, 7) percentage, NaN when nothing was scheduled
+    overall_consistency: np.ndarray     # (owners,) percentage
+    logged_by_system: np.ndarray        # (systems,) check-ins of any status
+    completed_by_system: np.ndarray     # (systems,) completed check-ins
+    metric_by_system: np.ndarray        # (systems,) sum of logged metric values
+    logged_by_owner: np.ndarray         # (owners,)
+    completed_by_owner: np.ndarray      # (owners,)
+
+def _percent(done: np.ndarray, scheduled: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(scheduled > 0, done / scheduled * 100.0, np.nan)
+
+def compute_progress_arrays(
+    *,
+    start: date,
+    n_days: int,
+    n_owners: int,
+    system_owner: np.ndarray,
+    system_first_day: np.ndarray,
+    system_weekdays: np.ndarray,
+    total_system: np.ndarray,
+    total_day: np.ndarray,
+    total_logged: np.ndarray,
+    total_completed: np.ndarray,
+    total_metric: np.ndarray,
+) -> ProgressArrays:
+    """
+    Vectorized progress statistics for every owner in one pass.
+
+    Systems are rows of a (systems x days) grid. A cell is "scheduled" when
+    the day falls on one of the system's weekdays (`system_weekdays`, a
+    (systems, 7) bool mask) on or after the day it was created
+    (`system_first_day`, an index into the grid), and "done" when its daily
+    totals (the `total_*` arrays, one entry per system and day) include a
+    completed check-in. Per-owner totals are a one-hot (owners x systems)
+    matrix product, so nothing loops over systems, days or check-ins in Python.
+    """
+    n_systems = len(system_owner)
+    day_index = np.arange(n_days)
+    day_weekday = (day_index + start.weekday()) % 7
+
+    scheduled = system_weekdays[:, day_weekday] & (day_index[None, :] >= system_first_day[:, None])
+
+    done = np.zeros((n_systems, n_days), dtype=bool)
+    has_completed = total_completed > 0
+    done[total_system[has_completed], total_day[has_completed]] = True
+    done &= scheduled
+
+    owner_matrix = np.zeros((n_owners, n_systems))
+    owner_matrix[system_owner, np.arange(n_systems)] = 1.0
+    scheduled_by_day = owner_matrix @ scheduled
+    done_by_day = owner_matrix @ done
+
+    weekday_matrix = np.zeros((n_days, 7))
+    weekday_matrix[day_index, day_weekday] = 1.0
+
+    logged_by_system = np.bincount(total_system, weights=total_logged, minlength=n_systems)
+    completed_by_system = np.bincount(total_system, weights=total_completed, minlength=n_systems)
+    metric_by_system = np.bincount(total_system, weights=total_metric, minlength=n_systems)
+
+    return ProgressArrays(
+        consistency_by_day=_percent(done_by_day, scheduled_by_day),
+        consistency_by_weekday=_percent(done_by_day @ weekday_matrix, scheduled_by_day @ weekday_matrix),
+        overall_consistency=np.nan_to_num(_percent(done_by_day.sum(axis=1), scheduled_by_day.sum(axis=1))),
+        logged_by_system=logged_by_system,
+        completed_by_system=completed_by_system,
+        metric_by_system=metric_by_system,
+        logged_by_owner=(owner_matrix @ logged_by_system).astype(int),
+        completed_by_owner=(owner_matrix @ completed_by_system).astype(int),
+    )
+
+def _weekday_mask(frequency: SystemFrequency, frequency_details: Optional[dict]) -> List[bool]:
+    # Same rule as the dashboard: weekly systems without a "days" list are due every day.
+    days = (frequency_details or {}).get("days") if frequency == SystemFrequency.WEEKLY else None
+    if not days:
+        return [True] * 7
+    return [name in days for name in WEEKDAY_NAMES]
+
+def _positions(values: Sequence[Any], position: Dict[Any, int]) -> np.ndarray:
+    """
+    Map a column of IDs to integer positions, looking up each distinct ID once.
+    """
+    if not values:
+        return np.zeros(0, dtype=int)
+    unique_values, inverse = np.unique(np.array(values, dtype=object), return_inverse=True)
+    return np.array([position[v] for v in unique_values], dtype=int)[inverse]
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 1)
+
+class ProgressService:
+    def resolve_range(
+        self,
+        *,
+        preset: DateRangePreset,
+        today: date,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        earliest: Optional[date],
+    ) -> Tuple[date, date]:
+        if preset == DateRangePreset.CUSTOM:
+            if not start_date or not end_date or end_date < start_date:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="A custom range needs startDate and endDate, with startDate first.",
+                )
+            if (end_date - start_date).days >= MAX_RANGE_DAYS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"A custom range can span at most {MAX_RANGE_DAYS} days.",
+                )
+            return start_date, end_date
+        if preset == DateRangePreset.LAST_7D:
+            return today - timedelta(days=6), today
+        if preset == DateRangePreset.LAST_30D:
+            return today - timedelta(days=29), today
+        if preset == DateRangePreset.MONTH_TO_DATE:
+            return today.replace(day=1), today
+        start = min(earliest or today, today)
+        return max(start, today - timedelta(days=MAX_RANGE_DAYS - 1)), today
+
+    async def get_progress(
+        self,
+        db: AsyncSession,
+        *,
+        user: UserPrincipal,
+        preset: DateRangePreset = DateRangePreset.LAST_7D,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        goal_id: Optional[uuid.UUID] = None,
+        compare_partner: bool = False,
+        source: Optional[StatsSource] = None,
+    ) -> Progress:
+        """
+        Progress statistics for the user (and their partner when comparing).
+        Systems and daily check-in totals for everyone involved are each
+        fetched in a single query, then all statistics come from one
+        vectorized pass. Totals come from checkin_daily_rollups or are
+        aggregated from the raw check-ins, per `source` (defaulting to
+        CHECKIN_STATS_SOURCE); both give the same result.
+        """
+        source = source or StatsSource(settings.CHECKIN_STATS_SOURCE)
+        goal_title = "Overall Progress"
+        if goal_id is not None:
+            goal = await goal_service.get_goal_by_id(db, goal_id=goal_id, user=user)
+            goal_title = goal.title
+
+        partner = None
+        if compare_partner and user.current_partnership_id:
+            partner = await crud_user.get_partner_summary(
+                db, user_id=user.id, partnership_id=user.current_partnership_id
+            )
+
+        owner_ids: List[uuid.UUID] = [user.id] + ([partner.id] if partner else [])
+        timezones = [resolve_timezone(user.timezone)] + ([resolve_timezone(partner.timezone)] if partner else [])
+        owner_index = {owner_id: i for i, owner_id in enumerate(owner_ids)}
+
+        systems = await crud_system.get_active_for_users(
+            db, user_ids=owner_ids, goal_id=goal_id, goal_owner_id=user.id
+        )
+        system_owner = np.array([owner_index[s.user_id] for s in systems], dtype=int)
+        created_days = [s.created_at.astimezone(timezones[owner_index[s.user_id]]).date() for s in systems]
+
+        today = local_today(timezones[0])
+        own_created = [d for d, owner in zip(created_days, system_owner) if owner == 0]
+        start, end = self.resolve_range(
+            preset=preset,
+            today=today,
+            start_date=start_date,
+            end_date=end_date,
+            earliest=min(own_created) if own_created else None,
+        )
+        n_days = (end - start).days + 1
+
+        system_ids = [s.id for s in systems]
+        if source == StatsSource.ROLLUP:
+            columns = await crud_checkin_rollup.get_daily_total_columns(
+                db, system_ids=system_ids, start_date=start, end_date=end
+            )
+        else:
+            bounds = [local_day_bounds(day, tz) for tz in timezones for day in (start, end)]
+            columns = await crud_checkin.get_daily_total_columns(
+                db,
+                system_ids=system_ids,
+                timezones={owner_id: tz.key for owner_id, tz in zip(owner_ids, timezones)},
+                start=min(b[0] for b in bounds),
+                end=max(b[1] for b in bounds),
+            )
+        total_systems, total_days, total_logged, total_completed, total_metric = columns
+
+        # Map the daily totals onto grid indices, dropping any that fall
+        # outside the local range.
+        total_system = _positions(total_systems, {system_id: i for i, system_id in enumerate(system_ids)})
+        total_day = (np.array(total_days, dtype="datetime64[D]") - np.datetime64(start, "D")).astype(int)
+        in_range = (total_day >= 0) & (total_day < n_days)
+
+        arrays = compute_progress_arrays(
+            start=start,
+            n_days=n_days,
+            n_owners=len(owner_ids),
+            system_owner=system_owner,
+            system_first_day=np.array([(d - start).days for d in created_days], dtype=int).clip(min=0),
+            system_weekdays=np.array(
+                [_weekday_mask(s.frequency, s.frequency_details) for s in systems], dtype=bool
+            ).reshape(len(systems), 7),
+            total_system=total_system[in_range],
+            total_day=total_day[in_range],
+            total_logged=np.array(total_logged, dtype=float)[in_range],
+            total_completed=np.array(total_completed, dtype=float)[in_range],
+            total_metric=np.array(total_metric, dtype=float)[in_range],
+        )
+
+        streaks = {s.user_id: s for s in await crud_user_streak.get_many_by_key(db, keys=owner_ids)}
+
+        def stats_for(owner: int) -> ProgressStats:
+            weekday_consistency = arrays.consistency_by_weekday[owner]
+            most_consistent = (
+                WEEKDAY_LABELS[int(np.nanargmax(weekday_consistency))]
+                if not np.all(np.isnan(weekday_consistency)) else "N/A"
+            )
+            streak = streaks.get(owner_ids[owner])
+            return ProgressStats(
+                overall_consistency=round(float(arrays.overall_consistency[owner]), 1),
+                current_streak=live_streak(streak, local_today(timezones[owner])),
+                longest_streak=streak.longest_streak if streak else 0,
+                most_consistent_day=most_consistent,
+                total_checkins=int(arrays.logged_by_owner[owner]),
+                systems_completed=int(arrays.completed_by_owner[owner]),
+                system_engagement=[
+                    SystemEngagement(
+                        system_id=s.id,
+                        system_name=s.title,
+                        logged_count=int(arrays.logged_by_system[i]),
+                        completed_count=int(arrays.completed_by_system[i]),
+                        metric_total=round(float(arrays.metric_by_system[i]), 2),
+                    )
+                    for i, s in enumerate(systems) if system_owner[i] == owner
+                ],
+            )
+
+        return Progress(
+            goal_title=goal_title,
+            start_date=start,
+            end_date=end,
+            personal_stats=stats_for(0),
+            partner_profile=PartnerProfile(user_id=partner.id, username=partner.username) if partner else None,
+            partner_stats=stats_for(1) if partner else None,
+            user_systems_list=[
+                SystemSummary(id=s.id, name=s.title) for i, s in enumerate(systems) if system_owner[i] == 0
+            ],
+            consistency_over_time=[
+                ConsistencyPoint(
+                    date=start + timedelta(days=i),
+                    user_consistency=_optional(arrays.consistency_by_day[0, i]),
+                    partner_consistency=_optional(arrays.consistency_by_day[1, i]) if partner else None,
+                )
+                for i in range(n_days)
+            ],
+            consistency_by_weekday=[
+                DayOfWeekConsistency(
+                    day=WEEKDAY_LABELS[d],
+                    user_consistency=_optional(arrays.consistency_by_weekday[0, d]),
+                    partner_consistency=_optional(arrays.consistency_by_weekday[1, d]) if partner else None,
+                )
+                for d in range(7)
+            ],
+        )
+
+progress_service = ProgressService()
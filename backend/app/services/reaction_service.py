@@ -1,15 +1,40 @@
 import uuid
-from typing import List
+from typing import Any, Dict, List, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_reaction, crud_direct_message
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.crud_direct_message import direct_message as crud_direct_message
+from app.crud.crud_reaction import reaction as crud_reaction
+from app.crud.crud_user import user as crud_user
+from app.db.load_plans import load_plan
 from app.db.models.user import User as UserModel
-from app.db.models.reaction import Reaction
-from app.schemas.reaction_schemas import ReactionCreate
+from app.db.models.reaction import Reaction, ReactionTargetType
+from app.db.unit_of_work import run_after_commit, unit_of_work
+from app.schemas.reaction_schemas import Reaction as ReactionSchema, ReactionCreate, ReactionTarget
 from app.services.partnership_service import partnership_service
+from app.services.realtime_service import realtime_service
+
+TargetKey = Tuple[ReactionTargetType, uuid.UUID]
+
+# (target_type, target_id) -> {emoji: [user IDs who reacted with it]}
+reaction_summary_cache: TTLCache[Dict[str, List[uuid.UUID]]] = TTLCache(
+    max_entries=settings.REACTION_SUMMARY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.REACTION_SUMMARY_CACHE_TTL_SECONDS,
+)
 
 class ReactionService:
+    async def _invalidate_summary(self, db: AsyncSession, *, reaction: Reaction) -> None:
+        # Dropped after commit. The pop also bumps the key's version, so a
+        # summary read that queried before the commit does not re-cache it.
+        key = (reaction.target_type, reaction.target_id)
+
+        async def invalidate() -> None:
+            reaction_summary_cache.pop(key)
+
+        await run_after_commit(db, invalidate)
+
     async def add_reaction_to_message(
         self, db: AsyncSession, *, reaction_in: ReactionCreate, user: UserModel
     ) -> Reaction:
@@ -42,8 +67,17 @@ class ReactionService:
                 detail="You have already reacted with this emoji."
             )
 
-        # 4. Create the reaction
-        return await crud_reaction.create(db, obj_in=reaction_in, user_id=user.id)
+        # 4. Create the reaction and push it to the partnership
+        async with unit_of_work(db):
+            reaction = await crud_reaction.create(db, obj_in=reaction_in, user_id=user.id)
+            await realtime_service.publish_partnership_event(
+                db,
+                partnership_id=message.partnership_id,
+                type="reaction.created",
+                data=ReactionSchema.model_validate(reaction, from_attributes=True),
+            )
+            await self._invalidate_summary(db, reaction=reaction)
+        return reaction
 
     async def remove_reaction_from_message(
         self, db: AsyncSession, *, reaction_id: uuid.UUID, user: UserModel
@@ -51,9 +85,9 @@ class ReactionService:
         """
         Remove a reaction from a direct message.
         """
-        statement = select(Reaction).where(Reaction.id == reaction_id)
-        result = await db.execute(statement)
-        reaction_to_delete = result.scalars().first()
+        reaction_to_delete = await crud_reaction.get(
+            db, id=reaction_id, options=[*load_plan("reaction.with_author"), *load_plan("reaction.with_message")]
+        )
 
         if not reaction_to_delete:
             raise HTTPException(
@@ -67,7 +101,17 @@ class ReactionService:
                 detail="You are not authorized to remove this reaction."
             )
 
-        return await crud_reaction.remove(db, id=reaction_id)
+        async with unit_of_work(db):
+            await crud_reaction.remove_obj(db, db_obj=reaction_to_delete)
+            if reaction_to_delete.direct_message is not None:
+                await realtime_service.publish_partnership_event(
+                    db,
+                    partnership_id=reaction_to_delete.direct_message.partnership_id,
+                    type="reaction.deleted",
+                    data=ReactionSchema.model_validate(reaction_to_delete, from_attributes=True),
+                )
+            await self._invalidate_summary(db, reaction=reaction_to_delete)
+        return reaction_to_delete
 
     async def get_reactions_for_message(
         self, db: AsyncSession, *, message_id: uuid.UUID, user: UserModel
@@ -95,4 +139,50 @@ class ReactionService:
         return await crud_reaction.get_multi_by_message(db, message_id=message_id)
 
 
+    async def get_reaction_summaries(
+        self, db: AsyncSession, *, targets: Sequence[ReactionTarget], user: UserModel
+    ) -> List[Dict[str, Any]]:
+        """
+        Emoji counts and "reacted by me" for many targets at once, in request
+        order. Cached targets are served from memory; the rest are fetched in
+        one GROUP BY query. Only reactions by the user and their current
+        partner are counted, so the summary never reveals anything from
+        outside the partnership.
+        """
+        keys: List[TargetKey] = list(dict.fromkeys((t.target_type, t.target_id) for t in targets))
+        reactors: Dict[TargetKey, Dict[str, List[uuid.UUID]]] = {}
+        missing: List[TargetKey] = []
+        for key in keys:
+            cached = reaction_summary_cache.get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                reactors[key] = cached
+        if missing:
+            versions = {key: reaction_summary_cache.version(key) for key in missing}
+            fetched = await crud_reaction.get_reactors_by_target(db, targets=missing)
+            for key in missing:
+                reactors[key] = fetched.get(key, {})
+                reaction_summary_cache.set(key, reactors[key], version=versions[key])
+
+        visible = {user.id}
+        if user.current_partnership_id:
+            partner = await crud_user.get_partner_summary(
+                db, user_id=user.id, partnership_id=user.current_partnership_id
+            )
+            if partner:
+                visible.add(partner.id)
+
+        summaries = []
+        for target_type, target_id in keys:
+            counts = []
+            for emoji, user_ids in reactors[(target_type, target_id)].items():
+                shown = [user_id for user_id in user_ids if user_id in visible]
+                if shown:
+                    counts.append({"emoji": emoji, "count": len(shown), "reacted_by_me": user.id in shown})
+            counts.sort(key=lambda c: (-c["count"], c["emoji"]))
+            summaries.append({"target_type": target_type, "target_id": target_id, "reactions": counts})
+        return summaries
+
+
 reaction_service = ReactionService() 
\ No newline at end of file
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Dict
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pubsub import pubsub_hub
+from app.db.unit_of_work import run_after_commit
+
+logger = logging.getLogger(__name__)
+
+# Published when a partnership ends; streams on its channel close after it.
+PARTNERSHIP_TERMINATED = "partnership.terminated"
+
+def partnership_channel(partnership_id: uuid.UUID) -> str:
+    return f"partnership:{partnership_id}"
+
+class RealtimeService:
+    """
+    Pushes partnership events (new messages, reactions) to connected
+    WebSocket clients through the pub/sub hub. Events are published only
+    after the write that produced them commits.
+    """
+    async def publish_partnership_event(
+        self, db: AsyncSession, *, partnership_id: uuid.UUID, type: str, data: BaseModel
+    ) -> None:
+        event: Dict[str, Any] = {"type": type, "data": data.model_dump(mode="json")}
+
+        async def publish() -> None:
+            # The write is already committed; a failed push must not turn
+            # the request into an error. Clients catch up on their next fetch.
+            try:
+                await pubsub_hub.publish(partnership_channel(partnership_id), event)
+            except Exception:
+                logger.exception("Could not publish %s to partnership %s.", type, partnership_id)
+
+        await run_after_commit(db, publish)
+
+    async def stream_partnership(self, websocket: WebSocket, *, partnership_id: uuid.UUID) -> None:
+        """
+        Forward the partnership's events to an accepted WebSocket until either
+        side goes away. Incoming frames are only read to notice disconnects.
+        If the client falls too far behind, the socket is closed so it can
+        reconnect and refetch. Once the partnership is terminated, the event
+        is forwarded and the socket closed, so a former partner stops
+        receiving the conversation.
+        """
+        async with pubsub_hub.subscribe(partnership_channel(partnership_id)) as subscription:
+            async def send() -> None:
+                while (text := await subscription.get()) is not None:
+                    await websocket.send_text(text)
+                    if json.loads(text).get("type") == PARTNERSHIP_TERMINATED:
+                        await websocket.close(code=1000)
+                        return
+                await websocket.close(code=1013)  # Try again later
+
+            async def receive() -> None:
+                try:
+                    while True:
+                        await websocket.receive_text()
+                except WebSocketDisconnect:
+                    pass
+
+            tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+realtime_service = RealtimeService()
@@ -3,7 +3,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_reflection
+from app.crud.crud_reflection import reflection as crud_reflection
 from app.db.models.reflection import Reflection
 from app.db.models.user import User as UserModel
 from app.schemas.reflection_schemas import ReflectionCreate, ReflectionUpdate
@@ -33,16 +33,15 @@ class ReflectionService:
         self, db: AsyncSession, *, reflection_id: uuid.UUID, user: UserModel
     ) -> Optional[Reflection]:
         """
-        Retrieve a specific reflection by ID, ensuring ownership via the parent goal.
+        Retrieve a specific reflection by ID, ensuring it was written by the user.
+        Existence and ownership are checked in a single query.
         """
-        reflection = await crud_reflection.get(db, id=reflection_id)
+        reflection = await crud_reflection.get_owned(db, id=reflection_id, user_id=user.id)
         if not reflection:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Reflection not found."
             )
-        # Verify ownership of the parent goal
-        await goal_service.get_goal_by_id(db, goal_id=reflection.goal_id, user=user)
         return reflection
 
     async def update_user_reflection(
@@ -61,6 +60,6 @@ class ReflectionService:
         Delete a reflection, ensuring ownership.
         """
         reflection = await self.get_reflection_by_id(db, reflection_id=reflection_id, user=user)
-        return await crud_reflection.remove(db, id=reflection.id)
+        return await crud_reflection.remove_obj(db, db_obj=reflection)
 
 reflection_service = ReflectionService() 
\ No newline at end of file
@@ -0,0 +1,94 @@
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.local_time import resolve_timezone
+from app.crud.crud_checkin_rollup import TOTAL_COLUMNS
+from app.crud.crud_checkin_rollup import checkin_rollup as crud_checkin_rollup
+from app.db.models.checkin import COMPLETED_CHECKIN_STATUSES, Checkin, CheckinStatus
+
+RollupKey = Tuple[uuid.UUID, uuid.UUID, date]
+
+class CheckinSnapshot:
+    """
+    The columns of a check-in that feed its rollup row, captured before an
+    update so the old contribution can be subtracted.
+    """
+    def __init__(self, checkin: Checkin):
+        self.user_id: uuid.UUID = checkin.user_id
+        self.system_id: uuid.UUID = checkin.system_id
+        self.status: CheckinStatus = checkin.status
+        self.checkin_timestamp_utc: datetime = checkin.checkin_timestamp_utc
+        self.metric_value_logged: Optional[float] = checkin.metric_value_logged
+
+class RollupService:
+    """
+    Keeps checkin_daily_rollups in step with check-ins by applying signed
+    deltas for the affected (system, local day) rows. The hooks should run in
+    the same unit of work as the check-in write, so a rollup never reflects a
+    write that was rolled back.
+    """
+    def _key(self, checkin: Checkin | CheckinSnapshot, timezone_name: Optional[str]) -> RollupKey:
+        local_date = checkin.checkin_timestamp_utc.astimezone(resolve_timezone(timezone_name)).date()
+        return checkin.user_id, checkin.system_id, local_date
+
+    def _add(
+        self,
+        totals: Dict[RollupKey, List[float]],
+        checkin: Checkin | CheckinSnapshot,
+        sign: int,
+        timezone_name: Optional[str],
+    ) -> None:
+        entry = totals[self._key(checkin, timezone_name)]
+        entry[0] += sign
+        entry[1] += sign if checkin.status in COMPLETED_CHECKIN_STATUSES else 0
+        entry[2] += sign * (checkin.metric_value_logged or 0.0)
+
+    async def _apply(self, db: AsyncSession, totals: Dict[RollupKey, List[float]]) -> None:
+        deltas = [
+            {
+                "user_id": user_id,
+                "system_id": system_id,
+                "local_date": local_date,
+                **dict(zip(TOTAL_COLUMNS, (int(values[0]), int(values[1]), values[2]))),
+            }
+            for (user_id, system_id, local_date), values in totals.items()
+            # An edit that moves nothing (e.g. only the notes changed) needs no write.
+            if any(values)
+        ]
+        await crud_checkin_rollup.apply_deltas(db, deltas=deltas)
+
+    async def on_checkin_created(
+        self, db: AsyncSession, *, checkin: Checkin, timezone_name: Optional[str]
+    ) -> None:
+        totals: Dict[RollupKey, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+        self._add(totals, checkin, 1, timezone_name)
+        await self._apply(db, totals)
+
+    async def on_checkin_updated(
+        self,
+        db: AsyncSession,
+        *,
+        checkin: Checkin,
+        previous: CheckinSnapshot,
+        timezone_name: Optional[str],
+    ) -> None:
+        """
+        Move the check-in's contribution from its previous (system, day) to its
+        current one. Both land in the same delta when the day is unchanged.
+        """
+        totals: Dict[RollupKey, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+        self._add(totals, previous, -1, timezone_name)
+        self._add(totals, checkin, 1, timezone_name)
+        await self._apply(db, totals)
+
+    async def on_checkin_deleted(
+        self, db: AsyncSession, *, checkin: Checkin, timezone_name: Optional[str]
+    ) -> None:
+        totals: Dict[RollupKey, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+        self._add(totals, checkin, -1, timezone_name)
+        await self._apply(db, totals)
+
+rollup_service = RollupService()
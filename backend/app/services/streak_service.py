@@ -0,0 +1,173 @@
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.local_time import resolve_timezone
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_streak import StreakModel
+from app.crud.crud_streak import system_streak as crud_system_streak
+from app.crud.crud_streak import user_streak as crud_user_streak
+from app.db.models.checkin import COMPLETED_CHECKIN_STATUSES, Checkin, CheckinStatus
+from app.db.unit_of_work import unit_of_work
+
+def live_streak(streak: Optional[StreakModel], today: date) -> int:
+    """
+    The stored run only counts as the current streak while its last day is
+    today or yesterday; after that it is broken.
+    """
+    if streak is None or streak.last_completed_date is None:
+        return 0
+    if (today - streak.last_completed_date).days > 1:
+        return 0
+    return streak.current_streak
+
+def _advance(streak: StreakModel, day: date) -> bool:
+    """
+    Apply a completed local day to a streak in place. Returns False when the
+    day is earlier than the last recorded day (a backdated check-in), which
+    cannot be applied incrementally.
+    """
+    last = streak.last_completed_date
+    if last is None or day > last + timedelta(days=1):
+        streak.current_streak = 1
+        streak.current_streak_start_date = day
+    elif day == last + timedelta(days=1):
+        streak.current_streak += 1
+    elif day < last:
+        return False
+    # day == last is already counted and only needs the longest check below.
+    streak.last_completed_date = day
+    streak.longest_streak = max(streak.longest_streak, streak.current_streak)
+    return True
+
+def _summary_values(summary: Optional[Any]) -> Dict[str, Any]:
+    if summary is None:
+        return {
+            "current_streak": 0,
+            "longest_streak": 0,
+            "current_streak_start_date": None,
+            "last_completed_date": None,
+        }
+    return {
+        "current_streak": summary.length,
+        "longest_streak": summary.longest,
+        "current_streak_start_date": summary.first_day,
+        "last_completed_date": summary.last_day,
+    }
+
+class StreakService:
+    """
+    Keeps the user_streaks / system_streaks tables in step with check-ins.
+    New completed check-ins are applied incrementally under a row lock.
+    Backdated, edited and deleted check-ins trigger a recompute of just the
+    affected user or system from its check-ins.
+    The hooks should run in the same unit of work as the check-in write.
+    """
+    def local_day(self, checkin: Checkin, timezone_name: Optional[str]) -> date:
+        return checkin.checkin_timestamp_utc.astimezone(resolve_timezone(timezone_name)).date()
+
+    async def on_checkin_created(
+        self, db: AsyncSession, *, checkin: Checkin, timezone_name: Optional[str]
+    ) -> None:
+        if checkin.status not in COMPLETED_CHECKIN_STATUSES:
+            return
+        day = self.local_day(checkin, timezone_name)
+
+        streak = await crud_user_streak.get_for_update(db, key=checkin.user_id, values={})
+        if not _advance(streak, day):
+            await self.recompute_user(db, user_id=checkin.user_id, timezone_name=timezone_name)
+
+        streak = await crud_system_streak.get_for_update(
+            db, key=checkin.system_id, values={"user_id": checkin.user_id}
+        )
+        if not _advance(streak, day):
+            await self.recompute_system(
+                db, user_id=checkin.user_id, system_id=checkin.system_id, timezone_name=timezone_name
+            )
+
+    async def on_checkin_updated(
+        self,
+        db: AsyncSession,
+        *,
+        checkin: Checkin,
+        previous_status: CheckinStatus,
+        previous_timestamp: datetime,
+        timezone_name: Optional[str],
+    ) -> None:
+        was_completed = previous_status in COMPLETED_CHECKIN_STATUSES
+        is_completed = checkin.status in COMPLETED_CHECKIN_STATUSES
+        if not was_completed:
+            # Nothing was counted before, so this behaves like a new check-in.
+            await self.on_checkin_created(db, checkin=checkin, timezone_name=timezone_name)
+        elif not is_completed or previous_timestamp != checkin.checkin_timestamp_utc:
+            # A counted day may have disappeared or moved.
+            await self.recompute_for_checkin(db, checkin=checkin, timezone_name=timezone_name)
+
+    async def on_checkin_deleted(
+        self, db: AsyncSession, *, checkin: Checkin, timezone_name: Optional[str]
+    ) -> None:
+        if checkin.status in COMPLETED_CHECKIN_STATUSES:
+            await self.recompute_for_checkin(db, checkin=checkin, timezone_name=timezone_name)
+
+    async def recompute_for_checkin(
+        self, db: AsyncSession, *, checkin: Checkin, timezone_name: Optional[str]
+    ) -> None:
+        await self.recompute_user(db, user_id=checkin.user_id, timezone_name=timezone_name)
+        await self.recompute_system(
+            db, user_id=checkin.user_id, system_id=checkin.system_id, timezone_name=timezone_name
+        )
+
+    async def recompute_user(
+        self, db: AsyncSession, *, user_id: uuid.UUID, timezone_name: Optional[str]
+    ) -> None:
+        tz_key = resolve_timezone(timezone_name).key
+        summaries = await crud_checkin.summarize_streaks(db, user_id=user_id, timezone_name=tz_key)
+        summary = summaries[0] if summaries else None
+        await crud_user_streak.upsert_many(db, rows=[{"user_id": user_id, **_summary_values(summary)}])
+
+    async def recompute_system(
+        self, db: AsyncSession, *, user_id: uuid.UUID, system_id: uuid.UUID, timezone_name: Optional[str]
+    ) -> None:
+        tz_key = resolve_timezone(timezone_name).key
+        summaries = await crud_checkin.summarize_streaks(
+            db, user_id=user_id, timezone_name=tz_key, by_system=True, system_id=system_id
+        )
+        summary = summaries[0] if summaries else None
+        await crud_system_streak.upsert_many(
+            db, rows=[{"system_id": system_id, "user_id": user_id, **_summary_values(summary)}]
+        )
+
+    async def rebuild_for_user(
+        self, db: AsyncSession, *, user_id: uuid.UUID, timezone_name: Optional[str]
+    ) -> int:
+        """
+        Rebuild the user's streak and every one of their system streaks from
+        scratch in two queries plus two upserts. Used by the backfill script.
+        Returns the number of system streaks written.
+        """
+        tz_key = resolve_timezone(timezone_name).key
+        async with unit_of_work(db):
+            await self.recompute_user(db, user_id=user_id, timezone_name=tz_key)
+            summaries = await crud_checkin.summarize_streaks(
+                db, user_id=user_id, timezone_name=tz_key, by_system=True
+            )
+            await crud_system_streak.upsert_many(
+                db,
+                rows=[
+                    {"system_id": summary.system_id, "user_id": user_id, **_summary_values(summary)}
+                    for summary in summaries
+                ],
+            )
+        return len(summaries)
+
+    async def get_user_streak(
+        self, db: AsyncSession, *, user_id: uuid.UUID, today: date
+    ) -> Tuple[int, int]:
+        """
+        The user's (current, longest) streak, read from the store.
+        """
+        streak = await crud_user_streak.get_by_key(db, key=user_id)
+        return live_streak(streak, today), (streak.longest_streak if streak else 0)
+
+streak_service = StreakService()
@@ -1,39 +1,37 @@
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.crud import crud_system, crud_goal
+from app.core.pagination import PageParams
+from app.crud.crud_goal import goal as crud_goal
+from app.crud.crud_system import system as crud_system
 from app.db.models.system import System
 from app.db.models.user import User as UserModel
-from app.schemas.system_schemas import SystemCreate, SystemUpdate
+from app.schemas.system_schemas import PlannedSystem, SystemCreate, SystemUpdate
 
 class SystemService:
     async def _verify_goal_ownership(self, db: AsyncSession, *, goal_id: uuid.UUID, user_id: uuid.UUID):
         """
         Private helper to verify that the goal exists and belongs to the user.
+        A goal owned by someone else is reported as not found.
         """
-        goal = await crud_goal.get(db, id=goal_id)
+        goal = await crud_goal.get_owned(db, id=goal_id, user_id=user_id)
         if not goal:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Parent goal not found."
             )
-        if goal.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User does not have permission to access this goal's systems."
-            )
         return goal
 
     async def get_systems_for_goal(
-        self, db: AsyncSession, *, goal_id: uuid.UUID, user: UserModel
-    ) -> List[System]:
+        self, db: AsyncSession, *, goal_id: uuid.UUID, user: UserModel, page: PageParams = PageParams()
+    ) -> Dict[str, Any]:
         """
-        Retrieve all systems for a specific goal, ensuring the user owns the goal.
+        Retrieve one page of systems for a specific goal, ensuring the user owns the goal.
         """
         await self._verify_goal_ownership(db, goal_id=goal_id, user_id=user.id)
-        return await crud_system.get_multi_by_goal(db, goal_id=goal_id)
+        return await crud_system.get_multi_by_goal(db, goal_id=goal_id, page=page)
 
     async def create_system_for_goal(
         self, db: AsyncSession, *, system_in: SystemCreate, user: UserModel
@@ -44,19 +42,44 @@ class SystemService:
         await self._verify_goal_ownership(db, goal_id=system_in.goal_id, user_id=user.id)
         return await crud_system.create(db, obj_in=system_in)
 
+    async def create_planned_systems_for_goal(
+        self, db: AsyncSession, *, goal_id: uuid.UUID, systems: Sequence[PlannedSystem], user: UserModel
+    ) -> List[System]:
+        """
+        Create every system of an AI plan under a goal: one ownership check,
+        then a single multi-row INSERT, so the plan is applied all-or-nothing.
+        Returns the new systems in plan order.
+        """
+        await self._verify_goal_ownership(db, goal_id=goal_id, user_id=user.id)
+        return await crud_system.create_many(
+            db,
+            objs_in=[
+                {
+                    "user_id": user.id,
+                    "goal_id": goal_id,
+                    "title": planned.title,
+                    "description": planned.description,
+                    "metric_type": planned.metric_type,
+                    "frequency": planned.frequency,
+                    "ai_assistance_used": True,
+                }
+                for planned in systems
+            ],
+        )
+
     async def get_system_by_id(
         self, db: AsyncSession, *, system_id: uuid.UUID, user: UserModel
     ) -> Optional[System]:
         """
         Retrieve a specific system by ID, ensuring ownership via the parent goal.
+        Existence and ownership are checked in a single query.
         """
-        system = await crud_system.get(db, id=system_id)
+        system = await crud_system.get_owned(db, id=system_id, user_id=user.id)
         if not system:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="System not found."
             )
-        await self._verify_goal_ownership(db, goal_id=system.goal_id, user_id=user.id)
         return system
 
     async def update_user_system(
@@ -77,6 +100,6 @@ class SystemService:
         """
         system = await self.get_system_by_id(db, system_id=system_id, user=user)
         # get_system_by_id handles all ownership checks
-        return await crud_system.remove(db, id=system.id)
+        return await crud_system.remove_obj(db, db_obj=system)
 
-system_service = SystemService() 
\ No newline at end of file
+system_service = SystemService()
@@ -0,0 +1,146 @@
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.crud_checkin import checkin as crud_checkin
+from app.crud.crud_direct_message import direct_message as crud_direct_message
+from app.crud.crud_goal import goal as crud_goal
+from app.crud.crud_reflection import reflection as crud_reflection
+from app.crud.crud_system import system as crud_system
+from app.crud.crud_user import user as crud_user
+from app.db.load_plans import load_plan
+from app.db.models.user import User as UserModel
+
+# Message bodies are cut to this length when used as a target title.
+MESSAGE_TITLE_LENGTH = 80
+
+TargetKey = Tuple[str, uuid.UUID]
+TargetRef = Tuple[Union[str, Enum], Union[str, uuid.UUID]]
+
+def _message_title(message: Any) -> str:
+    if message.text_content:
+        text = " ".join(message.text_content.split())
+        return text if len(text) <= MESSAGE_TITLE_LENGTH else text[:MESSAGE_TITLE_LENGTH - 1] + "…"
+    return message.emoji_content or "Image"
+
+@dataclass(frozen=True)
+class TargetLoader:
+    """
+    How to load one target type: the CRUD object, its load plan, the column
+    holding the owner, and how to title a row.
+    """
+    crud: CRUDBase
+    owner_attr: str
+    title: Callable[[Any], Optional[str]]
+    load_plan: Tuple[str, ...] = ()
+
+# Keyed by the lowercase values shared by CommentTargetType, ReactionTargetType
+# and Notification.target_type. Feed items have no table yet, so they never resolve.
+TARGET_LOADERS: Dict[str, TargetLoader] = {
+    "checkin": TargetLoader(
+        crud=crud_checkin,
+        owner_attr="user_id",
+        title=lambda checkin: checkin.system.title,
+        load_plan=("checkin.with_system",),
+    ),
+    "reflection": TargetLoader(
+        crud=crud_reflection,
+        owner_attr="user_id",
+        title=lambda reflection: f"Reflection for {reflection.reflection_date_local.isoformat()}",
+    ),
+    "direct_message": TargetLoader(crud=crud_direct_message, owner_attr="sender_id", title=_message_title),
+    "goal": TargetLoader(crud=crud_goal, owner_attr="user_id", title=lambda goal: goal.title),
+    "system": TargetLoader(crud=crud_system, owner_attr="user_id", title=lambda system: system.title),
+}
+
+def _normalize(target_type: Union[str, Enum], target_id: Union[str, uuid.UUID]) -> Optional[TargetKey]:
+    """
+    Turn a (type, id) reference into a lookup key. Notification targets store
+    the ID as text, so malformed IDs are tolerated and resolve to nothing.
+    """
+    type_name = target_type.value if isinstance(target_type, Enum) else str(target_type).lower()
+    if isinstance(target_id, uuid.UUID):
+        return type_name, target_id
+    try:
+        return type_name, uuid.UUID(str(target_id))
+    except ValueError:
+        return None
+
+class TargetResolver:
+    """
+    Batch-loads the targets of polymorphic references (comments, reactions,
+    notifications) for one viewer. References are grouped by type and each
+    type is fetched with a single `IN` query; everything resolved is
+    remembered, so later calls in the same request only query what is new.
+    Create one per request (see `deps.get_target_resolver`).
+    """
+    def __init__(self, db: AsyncSession, user: UserModel):
+        self.db = db
+        self.user = user
+        self._resolved: Dict[TargetKey, Dict[str, Any]] = {}
+        self._viewer_ids: Optional[Set[uuid.UUID]] = None
+
+    async def _get_viewer_ids(self) -> Set[uuid.UUID]:
+        """
+        The user and their current partner: the owners whose targets are visible.
+        """
+        if self._viewer_ids is None:
+            self._viewer_ids = {self.user.id}
+            if self.user.current_partnership_id:
+                partner = await crud_user.get_partner_summary(
+                    self.db, user_id=self.user.id, partnership_id=self.user.current_partnership_id
+                )
+                if partner:
+                    self._viewer_ids.add(partner.id)
+        return self._viewer_ids
+
+    async def _load(self, type_name: str, ids: List[uuid.UUID]) -> None:
+        loader = TARGET_LOADERS.get(type_name)
+        rows = []
+        if loader is not None:
+            rows = await loader.crud.get_many(self.db, ids=ids, options=load_plan(*loader.load_plan))
+        viewer_ids = await self._get_viewer_ids()
+        for row in rows:
+            owner_id = getattr(row, loader.owner_attr)
+            if owner_id in viewer_ids:
+                self._resolved[(type_name, row.id)] = {
+                    "target_type": type_name,
+                    "target_id": row.id,
+                    "available": True,
+                    "title": loader.title(row),
+                    "owner_id": owner_id,
+                }
+        for target_id in ids:
+            self._resolved.setdefault(
+                (type_name, target_id),
+                {"target_type": type_name, "target_id": target_id, "available": False},
+            )
+
+    async def resolve_many(self, refs: Iterable[TargetRef]) -> Dict[TargetKey, Dict[str, Any]]:
+        """
+        Resolve (target_type, target_id) references into target summaries
+        shaped like `schemas.target_schemas.TargetSummary`, keyed by the
+        normalized (type, UUID) pair. Malformed references are left out.
+        """
+        keys = [key for key in (_normalize(t, i) for t, i in refs) if key is not None]
+        missing: Dict[str, List[uuid.UUID]] = {}
+        for type_name, target_id in dict.fromkeys(keys):
+            if (type_name, target_id) not in self._resolved:
+                missing.setdefault(type_name, []).append(target_id)
+        for type_name, ids in missing.items():
+            await self._load(type_name, ids)
+        return {key: self._resolved[key] for key in keys}
+
+    async def resolve(
+        self, target_type: Union[str, Enum], target_id: Union[str, uuid.UUID]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a single reference; None if it is malformed.
+        """
+        key = _normalize(target_type, target_id)
+        if key is None:
+            return None
+        return (await self.resolve_many([key]))[key]
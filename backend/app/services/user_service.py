@@ -2,9 +2,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from fastapi import HTTPException, status
 
+from app.core.principal_cache import principal_cache
 from app.crud.crud_user import user as crud_user
 from app.db.models.user import User
-from app.schemas.user_schemas import UserUpdate
+from app.schemas.user_schemas import UserPrincipal, UserUpdate
 
 class UserService:
     async def get_user_by_id(self, db: AsyncSession, *, user_id: uuid.UUID) -> User | None:
@@ -14,7 +15,7 @@ class UserService:
         return await crud_user.get(db, id=user_id)
 
     async def update_user_profile(
-        self, db: AsyncSession, *, current_user: User, user_in: UserUpdate
+        self, db: AsyncSession, *, current_user: UserPrincipal, user_in: UserUpdate
     ) -> User:
         """
         Update a user's profile with validation.
@@ -28,8 +29,14 @@ class UserService:
                     detail="This username is already taken. Please choose another one.",
                 )
         
+        # The principal is a detached snapshot, so load the row we are changing.
+        db_user = await crud_user.get(db, id=current_user.id)
+        if not db_user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+
         # If checks pass, proceed to update the user in the database
-        updated_user = await crud_user.update(db, db_obj=current_user, obj_in=user_in)
+        updated_user = await crud_user.update(db, db_obj=db_user, obj_in=user_in)
+        principal_cache.invalidate_user(updated_user.id)
         return updated_user
 
 user_service = UserService() 
\ No newline at end of file
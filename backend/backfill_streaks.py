@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import sys
+import time
+
+from sqlalchemy.future import select
+
+from app.db.models.user import User
+from app.db.session import SessionLocal
+from app.services.streak_service import streak_service
+
+async def rebuild_batch(users, concurrency: int) -> int:
+    """
+    Rebuild streaks for a batch of (id, timezone) rows, `concurrency` users at
+    a time, each in its own session and transaction.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def rebuild(user_id, timezone_name) -> int:
+        async with semaphore:
+            async with SessionLocal() as db:
+                return await streak_service.rebuild_for_user(db, user_id=user_id, timezone_name=timezone_name)
+
+    results = await asyncio.gather(*(rebuild(user_id, tz) for user_id, tz in users))
+    return sum(results)
+
+async def backfill(batch_size: int, concurrency: int) -> None:
+    started = time.perf_counter()
+    last_id = None
+    users_done = systems_done = 0
+
+    while True:
+        # Walk users by primary key so the scan is stable while rows change.
+        async with SessionLocal() as db:
+            statement = select(User.id, User.timezone).order_by(User.id).limit(batch_size)
+            if last_id is not None:
+                statement = statement.where(User.id > last_id)
+            users = (await db.execute(statement)).all()
+        if not users:
+            break
+
+        systems_done += await rebuild_batch(users, concurrency)
+        users_done += len(users)
+        last_id = users[-1].id
+        print(f"  {users_done} users, {systems_done} system streaks rebuilt...")
+
+    elapsed = time.perf_counter() - started
+    print(f"\nSUCCESS: Rebuilt streaks for {users_done} users and {systems_done} systems in {elapsed:.1f}s.")
+
+def main():
+    """
+    Rebuilds the user_streaks and system_streaks tables from existing check-ins.
+    Safe to re-run: every row is overwritten with freshly computed values.
+    Run from the 'backend' directory after 'alembic upgrade head'.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--batch-size", type=int, default=500, help="Users fetched per batch.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Users rebuilt in parallel.")
+    args = parser.parse_args()
+
+    print("Backfilling streaks from existing check-ins...\n")
+    try:
+        asyncio.run(backfill(args.batch_size, args.concurrency))
+    except Exception as e:
+        print(f"\nERROR: Streak backfill failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
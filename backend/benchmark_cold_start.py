@@ -0,0 +1,85 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# SDKs that should only load once the service that needs them is used.
+LAZY_SDKS = ("google.generativeai", "resend")
+
+PROBE = (
+    "import sys, app.main; "
+    f"print(','.join(m for m in {LAZY_SDKS!r} if m in sys.modules))"
+)
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| +(\S+)")
+
+def import_app(env: dict) -> tuple[float, str, dict]:
+    """
+    Import app.main in a fresh interpreter. Returns the wall time in seconds,
+    the lazy SDKs that got loaded anyway, and the cumulative import time in
+    microseconds of each top-level package other than the app itself,
+    wherever it was first imported.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", PROBE],
+        env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    packages = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            cumulative, name = match.groups()
+            if "." not in name and name != "app":
+                packages[name] = max(packages.get(name, 0), int(cumulative))
+    return elapsed, result.stdout.strip(), packages
+
+def run(runs: int, without_keys: bool, top: int) -> None:
+    env = dict(os.environ)
+    if without_keys:
+        for key in ("GOOGLE_API_KEY", "RESEND_API_KEY"):
+            env.pop(key, None)
+
+    timings = []
+    for _ in range(runs):
+        elapsed, loaded, packages = import_app(env)
+        timings.append(elapsed * 1000)
+
+    timings.sort()
+    print(f"import app.main over {runs} fresh interpreters"
+          f"{' (no GOOGLE_API_KEY / RESEND_API_KEY)' if without_keys else ''}:")
+    print(f"  wall time ms: p50={statistics.median(timings):.0f} min={timings[0]:.0f} max={timings[-1]:.0f}")
+    print(f"  lazy SDKs loaded at import: {loaded or 'none'}")
+    print("  slowest top-level imports (last run):")
+    for name, micros in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"    {micros / 1000:8.1f}ms  {name}")
+
+def main():
+    """
+    Measures the cold start of the API: the time to import app.main in a
+    fresh interpreter, which SDKs meant to load lazily were imported anyway,
+    and the slowest top-level imports. Run from the 'backend' directory with
+    the usual environment; --without-keys checks that the app still starts
+    without the external services' API keys.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--without-keys", action="store_true")
+    parser.add_argument("--top", type=int, default=10, help="How many of the slowest imports to list.")
+    args = parser.parse_args()
+
+    try:
+        run(args.runs, args.without_keys, args.top)
+    except Exception as e:
+        print(f"\nERROR: Benchmark failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+# The load test runs against the offline model and must not touch the
+# database; both are read when the app is imported.
+os.environ["AI_PLANNER_PROVIDER"] = "fake"
+os.environ["AI_PLAN_CACHE_PERSISTENT"] = "false"
+
+from app.core.principal_cache import principal_cache
+from app.main import app
+from app.schemas.user_schemas import UserPrincipal
+from app.services.ai_planner_service import ai_planner_service
+
+def sign_in(users: int) -> list:
+    """
+    Bearer tokens for `users` made-up users. Their principals are put
+    straight into the principal cache, so authentication needs no database.
+    """
+    now = datetime.now(timezone.utc)
+    tokens = []
+    for n in range(users):
+        token = f"load-test-{n}"
+        principal_cache.set(token, UserPrincipal(
+            id=uuid.uuid4(), email=f"load-test-{n}@example.com", created_at=now, updated_at=now
+        ))
+        tokens.append(token)
+    return tokens
+
+async def call(path: str, token: str, body: dict) -> tuple[int, dict, float]:
+    """
+    POST `body` to `path` straight through the ASGI app and return the
+    status, response headers and seconds until the response completed.
+    """
+    payload = json.dumps(body).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    received = False
+    finished = asyncio.Event()
+    response = {}
+    started = time.perf_counter()
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            finished.set()
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], time.perf_counter() - started
+
+async def run(users: int, requests_per_user: int, path: str, latency: float) -> None:
+    ai_planner_service.model.first_chunk_delay = latency / 2
+    ai_planner_service.model.chunk_delay = latency / 2 / max(1, len(ai_planner_service.model.chunks) - 1)
+    tokens = sign_in(users)
+
+    peak_active = 0
+    sampling = True
+
+    async def sample():
+        nonlocal peak_active
+        while sampling:
+            peak_active = max(peak_active, ai_planner_service.limiter.active)
+            await asyncio.sleep(0.005)
+
+    sampler = asyncio.create_task(sample())
+    started = time.perf_counter()
+    # Every user fires all of their requests at once, each for a new goal so
+    # nothing is answered from the plan cache.
+    results = await asyncio.gather(*(
+        call(path, token, {"goal_title": f"Load test goal {u}-{r}"})
+        for u, token in enumerate(tokens)
+        for r in range(requests_per_user)
+    ))
+    elapsed = time.perf_counter() - started
+    sampling = False
+    await sampler
+
+    statuses = Counter(status for status, _, _ in results)
+    print(f"{len(results)} requests from {users} users to {path} in {elapsed:.2f}s "
+          f"(model latency {latency * 1000:.0f}ms).")
+    print("Status codes: " + ", ".join(f"{status}={count}" for status, count in sorted(statuses.items())))
+    ok = sorted(seconds * 1000 for status, _, seconds in results if status == 200)
+    if ok:
+        print(f"200 latency ms: p50={statistics.median(ok):.1f} "
+              f"p95={ok[max(0, int(len(ok) * 0.95) - 1)]:.1f} max={ok[-1]:.1f}")
+    for code in (429, 503):
+        hints = sorted(int(headers["retry-after"]) for status, headers, _ in results if status == code)
+        rejected = [seconds * 1000 for status, _, seconds in results if status == code]
+        if hints:
+            print(f"{code}: Retry-After {hints[0]}-{hints[-1]}s, answered in p50={statistics.median(rejected):.1f}ms")
+    print(f"Peak concurrent model calls: {peak_active} (limit {ai_planner_service.limiter.limit}).")
+    print(json.dumps(ai_planner_service.stats()["limiter"], indent=2))
+
+def main():
+    """
+    Load-tests the AI planner limits against the offline fake model (no API
+    key or database needed; run from the 'backend' directory): many users
+    each send a burst of plan requests at once, and the status codes,
+    latencies, Retry-After hints and peak model concurrency are reported.
+    Tune the limits with the AI_PLANNER_* environment variables.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--requests-per-user", type=int, default=5)
+    parser.add_argument("--stream", action="store_true", help="Use the streaming endpoint.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds the fake model takes per plan.")
+    args = parser.parse_args()
+
+    path = "/api/v1/planner/generate-plan/stream" if args.stream else "/api/v1/planner/generate-plan"
+    try:
+        asyncio.run(run(args.users, args.requests_per_user, path, args.latency))
+    except Exception as e:
+        print(f"\nERROR: Load test failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
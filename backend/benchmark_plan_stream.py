@@ -0,0 +1,112 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+# The benchmark runs against the offline model and must not touch the
+# database; both are read when the app is imported.
+os.environ["AI_PLANNER_PROVIDER"] = "fake"
+os.environ["AI_PLAN_CACHE_PERSISTENT"] = "false"
+# One user sends every request; keep the per-user limit out of the way.
+os.environ["AI_PLANNER_USER_BURST"] = "1000000"
+
+from app.core.principal_cache import principal_cache
+from app.main import app
+from app.schemas.user_schemas import UserPrincipal
+from app.services.ai_planner_service import ai_planner_service
+
+TOKEN = "benchmark-plan-stream"
+
+async def call(path: str, body: dict) -> tuple[float, float]:
+    """
+    POST `body` to `path` straight through the ASGI app and return the
+    seconds until the first and the last body byte.
+    """
+    payload = json.dumps(body).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+            (b"authorization", f"Bearer {TOKEN}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    received = False
+    finished = asyncio.Event()
+    first_byte = None
+    started = time.perf_counter()
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_byte
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} answered {message['status']}")
+        if message["type"] == "http.response.body":
+            if first_byte is None and message.get("body"):
+                first_byte = time.perf_counter() - started
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return first_byte, time.perf_counter() - started
+
+def report(label: str, samples: list) -> None:
+    ttfb = [first * 1000 for first, _ in samples]
+    total = [last * 1000 for _, last in samples]
+    print(f"{label:>10}: TTFB p50={statistics.median(ttfb):7.1f}ms max={max(ttfb):7.1f}ms | "
+          f"full response p50={statistics.median(total):7.1f}ms max={max(total):7.1f}ms")
+
+async def run(requests: int, first_chunk_delay: float, chunk_delay: float) -> None:
+    ai_planner_service.model.first_chunk_delay = first_chunk_delay
+    ai_planner_service.model.chunk_delay = chunk_delay
+    # Authenticate straight from the principal cache, so no database is needed.
+    now = datetime.now(timezone.utc)
+    principal_cache.set(TOKEN, UserPrincipal(
+        id=uuid.uuid4(), email="benchmark@example.com", created_at=now, updated_at=now
+    ))
+
+    buffered, streamed = [], []
+    for n in range(requests):
+        # A fresh goal each time so neither endpoint is answered from the cache.
+        buffered.append(await call("/api/v1/planner/generate-plan", {"goal_title": f"Run a 10k #{n}"}))
+        streamed.append(await call("/api/v1/planner/generate-plan/stream", {"goal_title": f"Run a 5k #{n}"}))
+
+    print(f"{requests} requests per endpoint, first chunk after {first_chunk_delay * 1000:.0f}ms, "
+          f"then one every {chunk_delay * 1000:.0f}ms.")
+    report("buffered", buffered)
+    report("streamed", streamed)
+
+def main():
+    """
+    Compares time-to-first-byte of the buffered and the streaming plan
+    endpoints against the offline fake model (no API key or database
+    needed; run from the 'backend' directory).
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--requests", type=int, default=5, help="Requests sent to each endpoint.")
+    parser.add_argument("--first-chunk-delay", type=float, default=0.5, help="Seconds before the model's first chunk.")
+    parser.add_argument("--chunk-delay", type=float, default=0.2, help="Seconds between later chunks.")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args.requests, args.first_chunk_delay, args.chunk_delay))
+    except Exception as e:
+        print(f"\nERROR: Benchmark failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+
+from app.core.config import settings
+from app.core.pubsub import PostgresPubSubHub, PubSubHub
+
+def build_hubs(backend: str, workers: int):
+    """
+    One hub per simulated worker process. With the memory backend there is
+    only ever one hub, since it cannot fan out between processes.
+    """
+    if backend == "memory":
+        return [PubSubHub(max_pending=10_000)]
+    dsn = (settings.PUBSUB_DATABASE_URL or settings.DATABASE_URL).replace("postgresql+asyncpg://", "postgresql://")
+    return [PostgresPubSubHub(dsn, max_pending=10_000) for _ in range(workers)]
+
+async def run(backend: str, workers: int, partnerships: int, per_partnership: int, events: int) -> None:
+    hubs = build_hubs(backend, workers)
+    for hub in hubs:
+        await hub.start()
+
+    channels = [f"partnership:{uuid.uuid4()}" for _ in range(partnerships)]
+    latencies = []
+    expected = events * per_partnership
+
+    async def subscriber(hub: PubSubHub, channel: str, ready: asyncio.Event, subscribed: list):
+        async with hub.subscribe(channel) as subscription:
+            subscribed.append(1)
+            if len(subscribed) == partnerships * per_partnership:
+                ready.set()
+            for _ in range(events):
+                text = await subscription.get()
+                if text is None:
+                    return
+                latencies.append(time.perf_counter() - json.loads(text)["sent_at"])
+
+    ready = asyncio.Event()
+    subscribed = []
+    # Spread each partnership's connections over the workers, as a load
+    # balancer would.
+    tasks = [
+        asyncio.create_task(subscriber(hubs[(c + i) % len(hubs)], channel, ready, subscribed))
+        for c, channel in enumerate(channels)
+        for i in range(per_partnership)
+    ]
+    await ready.wait()
+    print(f"{len(tasks)} connections on {partnerships} partnerships across {len(hubs)} hub(s) ({backend}).")
+
+    started = time.perf_counter()
+    for n in range(events):
+        await asyncio.gather(*(
+            hubs[c % len(hubs)].publish(channel, {"type": "message.created", "n": n, "sent_at": time.perf_counter()})
+            for c, channel in enumerate(channels)
+        ))
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=60)
+    elapsed = time.perf_counter() - started
+
+    for hub in hubs:
+        await hub.stop()
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    print(f"Delivered {len(ms)} of {expected * partnerships} events in {elapsed:.2f}s "
+          f"({len(ms) / elapsed:,.0f} deliveries/s).")
+    print(f"Fan-out latency ms: p50={statistics.median(ms):.2f} "
+          f"p95={ms[int(len(ms) * 0.95) - 1]:.2f} p99={ms[int(len(ms) * 0.99) - 1]:.2f} max={ms[-1]:.2f}")
+
+def main():
+    """
+    Measures pub/sub fan-out: opens simulated WebSocket subscribers across
+    many partnerships, publishes events to every partnership and reports
+    delivery throughput and publish-to-delivery latency percentiles.
+    Use --backend postgres with --workers N to include LISTEN/NOTIFY
+    between N hubs (run from the 'backend' directory).
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--backend", choices=["memory", "postgres"], default="memory")
+    parser.add_argument("--workers", type=int, default=2, help="Hubs to simulate (postgres backend only).")
+    parser.add_argument("--partnerships", type=int, default=1000)
+    parser.add_argument("--connections-per-partnership", type=int, default=2)
+    parser.add_argument("--events", type=int, default=20, help="Events published to each partnership.")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args.backend, args.workers, args.partnerships, args.connections_per_partnership, args.events))
+    except Exception as e:
+        print(f"\nERROR: Benchmark failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import argparse
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api import deps
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.db.models.checkin import Checkin, CheckinStatus
+from app.db.models.comment import Comment, CommentTargetType
+from app.db.models.direct_message import DirectMessage
+from app.db.models.goal import Goal
+from app.db.models.partnership import Partnership, PartnershipStatus
+from app.db.models.reaction import Reaction, ReactionTargetType
+from app.db.models.system import System, SystemFrequency, SystemMetricType
+from app.db.models.user import User
+from app.db.query_counter import assert_num_queries
+from app.db.session import engine as app_engine
+from app.main import app
+from app.schemas.user_schemas import UserPrincipal
+
+TOKEN = "check-query-budgets"
+
+# (label, path, queries) for the reads whose load plans are pinned in
+# app/db/load_plans.py. Authentication comes from the principal cache, so
+# the budgets count only the endpoint's own queries. They must hold however
+# many rows come back; the seed data has several of everything so an N+1
+# shows up as a failure.
+BUDGETS = [
+    ("GET /users/me", "/users/me", 0),
+    ("GET /goals", "/goals/", 1),
+    ("GET /goals/{id}", "/goals/{goal_id}", 1),
+    ("GET /systems/{id}", "/systems/{system_id}", 1),
+    ("GET /systems/by_goal/{id}", "/systems/by_goal/{goal_id}", 2),
+    ("GET /checkins/{id}", "/checkins/{checkin_id}", 1),
+    ("GET /checkins/by_system/{id}", "/checkins/by_system/{system_id}", 2),
+    ("GET /partnerships/current", "/partnerships/current", 1),
+    ("GET /direct-messages/{id}", "/direct-messages/{partnership_id}", 3),
+    ("GET /reactions/by_message/{id}", "/reactions/by_message/{message_id}", 3),
+    ("GET /comments/targets/checkin/{id}", "/comments/targets/checkin/{checkin_id}", 2),
+]
+
+async def get(path: str) -> tuple[int, bytes]:
+    """
+    GET `path` straight through the ASGI app and return the status and body.
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {TOKEN}".encode())],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    response = {"body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response["status"], response["body"]
+
+async def seed(db: AsyncSession, rows: int) -> dict:
+    """
+    Two partners, and for the first: a goal with `rows` systems, `rows`
+    check-ins per system, `rows` comments on a check-in and `rows` messages
+    reacted to by both partners. Returns the ids the budget paths need.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    me = User(email=f"budget-a-{suffix}@example.com", username=f"budget-a-{suffix}", name="Budget A")
+    partner = User(email=f"budget-b-{suffix}@example.com", username=f"budget-b-{suffix}", name="Budget B")
+    db.add_all([me, partner])
+    await db.flush()
+    partnership = Partnership(user1_id=me.id, user2_id=partner.id, status=PartnershipStatus.ACTIVE)
+    db.add(partnership)
+    await db.flush()
+    me.current_partnership_id = partner.current_partnership_id = partnership.id
+
+    goal = Goal(user_id=me.id, title="Run a marathon")
+    db.add(goal)
+    await db.flush()
+    now = datetime.now(timezone.utc)
+    systems = [
+        System(
+            user_id=me.id, goal_id=goal.id, title=f"System {n}", description="Seeded.",
+            frequency=SystemFrequency.DAILY, metric_type=SystemMetricType.BINARY,
+        )
+        for n in range(rows)
+    ]
+    db.add_all(systems)
+    await db.flush()
+    checkins = [
+        Checkin(
+            user_id=me.id, system_id=system.id, partnership_id=partnership.id,
+            status=CheckinStatus.COMPLETED, checkin_timestamp_utc=now - timedelta(days=n),
+        )
+        for system in systems
+        for n in range(rows)
+    ]
+    messages = [
+        DirectMessage(
+            partnership_id=partnership.id, sender_id=[me, partner][n % 2].id,
+            text_content=f"Message {n}", sent_at_utc=now - timedelta(minutes=n),
+        )
+        for n in range(rows)
+    ]
+    db.add_all([*checkins, *messages])
+    await db.flush()
+    db.add_all([
+        Reaction(
+            user_id=user.id, emoji="👍", target_type=ReactionTargetType.DIRECT_MESSAGE,
+            target_id=message.id, direct_message_id=message.id,
+        )
+        for message in messages
+        for user in (me, partner)
+    ])
+    db.add_all([
+        Comment(
+            user_id=[me, partner][n % 2].id, target_type=CommentTargetType.CHECKIN,
+            target_id=checkins[0].id, content=f"Comment {n}",
+        )
+        for n in range(rows)
+    ])
+    await db.flush()
+
+    principal_cache.set(TOKEN, UserPrincipal.model_validate(me, from_attributes=True))
+    return {
+        "goal_id": goal.id, "system_id": systems[0].id, "checkin_id": checkins[0].id,
+        "partnership_id": partnership.id, "message_id": messages[0].id,
+    }
+
+async def run(database_url: str | None, rows: int) -> bool:
+    engine = create_async_engine(database_url) if database_url else app_engine
+    failures = []
+    # Everything, seed data included, happens in one transaction that is
+    # rolled back at the end, so this is safe to point at a dev database.
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+
+        async def get_db():
+            async with AsyncSession(bind=conn, autoflush=False, expire_on_commit=False) as db:
+                yield db
+
+        app.dependency_overrides[deps.get_db] = get_db
+        app.dependency_overrides[deps.get_uow_db] = get_db
+        try:
+            async with AsyncSession(bind=conn, expire_on_commit=False) as db:
+                ids = await seed(db, rows)
+
+            for label, path, budget in BUDGETS:
+                try:
+                    with assert_num_queries(engine, budget, label=label) as counter:
+                        status, body = await get(settings.API_V1_STR + path.format(**ids))
+                    if status != 200:
+                        raise AssertionError(f"{label}: answered {status}: {body[:200].decode(errors='replace')}")
+                    print(f"  ok    {label}: {counter.count} quer{'y' if counter.count == 1 else 'ies'}")
+                except AssertionError as e:
+                    failures.append(str(e))
+                    print(f"  FAIL  {label}")
+        finally:
+            app.dependency_overrides.clear()
+            principal_cache.clear()
+            await outer.rollback()
+
+    if database_url:
+        await engine.dispose()
+    for failure in failures:
+        print(f"\n{failure}", file=sys.stderr)
+    return not failures
+
+def main():
+    """
+    Checks the query budget of the endpoints with pinned load plans: each
+    one is called with `--rows` of everything seeded and must run exactly
+    its budgeted number of queries. Runs against DATABASE_URL (after
+    'alembic upgrade head') or --database-url, inside a transaction that is
+    rolled back. Run from the 'backend' directory.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--database-url", help="Defaults to the app's DATABASE_URL.")
+    parser.add_argument("--rows", type=int, default=5, help="Rows of each kind to seed.")
+    args = parser.parse_args()
+
+    print(f"Checking query budgets with {args.rows} rows of each kind...\n")
+    try:
+        ok = asyncio.run(run(args.database_url, args.rows))
+    except Exception as e:
+        print(f"\nERROR: Query budget check failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not ok:
+        print("\nERROR: Some endpoints are over or under their query budget.", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nSUCCESS: All {len(BUDGETS)} endpoints are within their query budgets.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import sys
+import time
+from collections import defaultdict
+
+from sqlalchemy.future import select
+
+from app.core.local_time import resolve_timezone
+from app.crud.crud_checkin_rollup import checkin_rollup as crud_checkin_rollup
+from app.db.models.user import User
+from app.db.session import SessionLocal
+from app.db.unit_of_work import unit_of_work
+
+async def user_batches(batch_size: int):
+    """
+    Walk users by primary key and yield each batch grouped by resolved
+    timezone, so every group can be handled with one set-based statement.
+    """
+    last_id = None
+    while True:
+        async with SessionLocal() as db:
+            statement = select(User.id, User.timezone).order_by(User.id).limit(batch_size)
+            if last_id is not None:
+                statement = statement.where(User.id > last_id)
+            users = (await db.execute(statement)).all()
+        if not users:
+            return
+        groups = defaultdict(list)
+        for user_id, timezone_name in users:
+            groups[resolve_timezone(timezone_name).key].append(user_id)
+        yield len(users), groups
+        last_id = users[-1].id
+
+async def run_groups(groups, concurrency: int, work) -> list:
+    """
+    Run `work(db, user_ids, timezone_name)` for every timezone group,
+    `concurrency` groups at a time, each in its own session.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(timezone_name, user_ids):
+        async with semaphore:
+            async with SessionLocal() as db:
+                return await work(db, user_ids, timezone_name)
+
+    return await asyncio.gather(*(run(tz, ids) for tz, ids in groups.items()))
+
+async def rebuild_group(db, user_ids, timezone_name) -> int:
+    async with unit_of_work(db):
+        return await crud_checkin_rollup.rebuild_for_users(db, user_ids=user_ids, timezone_name=timezone_name)
+
+async def verify_group(db, user_ids, timezone_name) -> list:
+    return await crud_checkin_rollup.find_mismatches(db, user_ids=user_ids, timezone_name=timezone_name)
+
+async def backfill(batch_size: int, concurrency: int) -> None:
+    started = time.perf_counter()
+    users_done = rows_done = 0
+    async for count, groups in user_batches(batch_size):
+        rows_done += sum(await run_groups(groups, concurrency, rebuild_group))
+        users_done += count
+        print(f"  {users_done} users, {rows_done} rollup rows written...")
+
+    elapsed = time.perf_counter() - started
+    print(f"\nSUCCESS: Rebuilt {rows_done} rollup rows for {users_done} users in {elapsed:.1f}s.")
+
+async def verify(batch_size: int, concurrency: int) -> bool:
+    users_done = mismatches = 0
+    async for count, groups in user_batches(batch_size):
+        for rows in await run_groups(groups, concurrency, verify_group):
+            mismatches += len(rows)
+            for row in rows:
+                print(
+                    f"  MISMATCH user={row.user_id} system={row.system_id} day={row.local_date}: "
+                    f"raw=({row.raw_checkin_count}, {row.raw_completed_count}, {row.raw_metric_sum}) "
+                    f"rollup=({row.rollup_checkin_count}, {row.rollup_completed_count}, {row.rollup_metric_sum})"
+                )
+        users_done += count
+
+    if mismatches:
+        print(f"\nERROR: {mismatches} rollup rows disagree with the raw check-ins.", file=sys.stderr)
+        return False
+    print(f"\nSUCCESS: Rollups match the raw check-ins for all {users_done} users.")
+    return True
+
+def main():
+    """
+    Maintains the checkin_daily_rollups table.
+      backfill  rebuild every user's rollups from their check-ins (safe to re-run)
+      verify    compare the rollups against totals recomputed from check-ins
+    Run from the 'backend' directory after 'alembic upgrade head', then set
+    CHECKIN_STATS_SOURCE=rollup once verify passes.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["backfill", "verify"])
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users fetched per batch.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Timezone groups processed in parallel.")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "backfill":
+            print("Backfilling check-in rollups from existing check-ins...\n")
+            asyncio.run(backfill(args.batch_size, args.concurrency))
+        else:
+            print("Verifying check-in rollups against raw check-ins...\n")
+            if not asyncio.run(verify(args.batch_size, args.concurrency)):
+                sys.exit(1)
+    except Exception as e:
+        print(f"\nERROR: Rollup {args.command} failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()